@@ -0,0 +1,17 @@
+# Generated by Django 4.2.9 on 2026-10-18 15:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="generation",
+            index=models.Index(fields=["start_date", "end_date"], name="generation_date_range_idx"),
+        ),
+    ]
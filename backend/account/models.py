@@ -50,6 +50,9 @@ class Generation(models.Model):
         db_table = "generation"
         verbose_name = "기수"
         verbose_name_plural = "기수"
+        indexes = [
+            models.Index(fields=["start_date", "end_date"], name="generation_date_range_idx"),
+        ]
 
 
 class User(AbstractBaseUser, PermissionsMixin):
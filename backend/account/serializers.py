@@ -20,7 +20,12 @@ from account.schemas import (
     USER_REGISTER_REQUEST_AUTH_CODE_REQUEST_EXAMPLE,
     USER_REGISTRATION_REQUEST_EXAMPLE,
 )
-from common.choices import ROLE_CHOICES, WORKOUT_LEVELS, WORKOUT_LOCATION_CHOICES
+from common.choices import (
+    ROLE_REGISTRY,
+    WORKOUT_LEVEL_REGISTRY,
+    WORKOUT_LEVELS,
+    WORKOUT_LOCATION_REGISTRY,
+)
 from config.exceptions import (
     EmptyFieldException,
     InvalidAccountException,
@@ -135,20 +140,17 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return value
 
     def validate_role(self, value: str) -> str:
-        role = [choice[0] for choice in ROLE_CHOICES]
-        if value not in role:
+        if value not in ROLE_REGISTRY:
             raise InvalidFieldException("역할이 정확하지 않습니다.")
         return value
 
     def validate_workout_location(self, value: str) -> str:
-        workout_location = [choice[0] for choice in WORKOUT_LOCATION_CHOICES]
-        if value not in workout_location:
+        if value not in WORKOUT_LOCATION_REGISTRY:
             raise InvalidFieldException("지점이 정확하지 않습니다.")
         return value
 
     def validate_workout_level(self, value: int) -> int:
-        workout_level = [choice[0] for choice in WORKOUT_LEVELS]
-        if value not in workout_level:
+        if value not in WORKOUT_LEVEL_REGISTRY:
             raise InvalidFieldException("난이도가 정확하지 않습니다.")
         return value
 
@@ -0,0 +1,108 @@
+import threading
+import time
+import uuid
+from bisect import bisect_right
+from datetime import date
+from typing import List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+
+from account.models import Generation
+
+GENERATION_CALENDAR_VERSION_KEY = "generation:calendar:version"
+
+# 다른 워커에서 기수가 변경되었는지 확인하는 주기입니다.
+GENERATION_CALENDAR_CHECK_INTERVAL = 5  # Seconds
+
+
+class GenerationCalendar:
+    """
+    모든 기수를 시작일 순으로 메모리에 적재하여, 날짜에 해당하는 기수와 주차를 이진 탐색으로 조회하는 클래스입니다.
+    기수가 변경되면 캐시에 저장된 버전이 바뀌며, 각 워커는 버전을 확인하여 기수 목록을 다시 적재합니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calendar: Tuple[List[date], List[Generation]] = ([], [])
+        self._version: Optional[str] = None
+        self._checked_at: float = 0.0
+        self._loaded: bool = False
+
+    def _load(self, version: Optional[str]) -> Tuple[List[date], List[Generation]]:
+        generations: List[Generation] = list(
+            Generation.objects.filter(start_date__isnull=False, end_date__isnull=False).order_by("start_date")
+        )
+        self._calendar = ([generation.start_date for generation in generations], generations)
+        self._version = version
+        self._loaded = True
+        return self._calendar
+
+    def _snapshot(self) -> Tuple[List[date], List[Generation]]:
+        now: float = time.monotonic()
+        if self._loaded and now - self._checked_at < GENERATION_CALENDAR_CHECK_INTERVAL:
+            return self._calendar
+
+        with self._lock:
+            version: Optional[str] = cache.get(GENERATION_CALENDAR_VERSION_KEY)
+            self._checked_at = now
+            if not self._loaded or version != self._version:
+                return self._load(version)
+            return self._calendar
+
+    def invalidate(self) -> None:
+        """
+        현재 워커에 적재된 기수 목록을 무효화하는 메서드입니다.
+        """
+        with self._lock:
+            self._loaded = False
+
+    def get_generation(self, target_date: date) -> Optional[Generation]:
+        """
+        인자로 주어진 날짜가 속한 기수를 반환하는 메서드입니다. 해당하는 기수가 없으면 None을 반환합니다.
+        """
+        start_dates, generations = self._snapshot()
+        index: int = bisect_right(start_dates, target_date) - 1
+        if index < 0 or generations[index].end_date < target_date:
+            return None
+        return generations[index]
+
+    def has_generation(self, name: str) -> bool:
+        """
+        인자로 주어진 이름의 기수가 시작일과 종료일이 정해진 기수인지 반환하는 메서드입니다.
+        """
+        _, generations = self._snapshot()
+        return any(generation.name == name for generation in generations)
+
+    def get_week(self, target_date: date) -> Optional[int]:
+        """
+        인자로 주어진 날짜가 기수의 몇 주차인지 반환하는 메서드입니다. 해당하는 기수가 없으면 None을 반환합니다.
+        """
+        generation: Optional[Generation] = self.get_generation(target_date)
+        if generation is None:
+            return None
+        return (target_date - generation.start_date).days // 7 + 1
+
+
+generation_calendar = GenerationCalendar()
+
+
+def get_generation_by_date(target_date: date) -> Optional[Generation]:
+    """
+    인자로 주어진 날짜가 속한 기수를 반환하는 메서드입니다.
+    """
+    return generation_calendar.get_generation(target_date)
+
+
+def invalidate_generation_calendar() -> None:
+    """
+    모든 워커의 기수 목록을 무효화하는 메서드입니다.
+    현재 워커는 즉시 무효화되며, 다른 워커는 트랜잭션이 커밋된 이후 버전을 확인할 때 무효화됩니다.
+    """
+    generation_calendar.invalidate()
+
+    def publish() -> None:
+        generation_calendar.invalidate()
+        cache.set(GENERATION_CALENDAR_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+    transaction.on_commit(publish)
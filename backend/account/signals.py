@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from account.models import Generation
+from account.services import invalidate_generation_calendar
+
+
+@receiver(post_save, sender=Generation)
+def invalidate_generation_calendar_on_save(sender: Generation, instance: Generation, **kwargs) -> None:
+    """
+    Generation 모델의 인스턴스가 생성되거나 수정될 때 호출되는 함수입니다.
+    모든 워커에 적재된 기수 목록을 무효화합니다.
+    """
+    invalidate_generation_calendar()
+
+
+@receiver(post_delete, sender=Generation)
+def invalidate_generation_calendar_on_delete(sender: Generation, instance: Generation, **kwargs) -> None:
+    """
+    Generation 모델의 인스턴스가 삭제될 때 호출되는 함수입니다.
+    모든 워커에 적재된 기수 목록을 무효화합니다.
+    """
+    invalidate_generation_calendar()
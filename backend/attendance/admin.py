@@ -3,6 +3,7 @@
 from django.contrib import admin
 
 from .models import Attendance, AttendanceStats, UnavailableDates, WeeklyStaffInfo
+from .services import refresh_attendance_rate
 
 
 @admin.register(WeeklyStaffInfo)
@@ -70,9 +71,16 @@ class AttendanceAdmin(admin.ModelAdmin):
 
 @admin.register(AttendanceStats)
 class AttendanceStatsAdmin(admin.ModelAdmin):
-    list_display = ("get_user_name", "generation", "attendance", "late", "absence")
+    list_display = ("get_user_name", "generation", "attendance", "late", "absence", "attendance_rate")
     list_filter = ("generation",)
     search_fields = ("user__username", "user__email")
+    readonly_fields = ("attendance_rate",)
+    ordering = ("generation", "-attendance_rate")
+
+    def save_model(self, request, obj, form, change):
+        # 출석률은 횟수로부터 계산되는 값이므로, 횟수를 수정하면 저장된 출석률도 갱신합니다.
+        super().save_model(request, obj, form, change)
+        refresh_attendance_rate(obj, obj.user.generation_id)
 
     def get_queryset(self, request):
         queryset = super().get_queryset(request)
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.9 on 2026-10-18 15:30
+
+from django.db import migrations, models
+
+
+def calculate_attendance_rate(stats, stats_gen_number, user_gen_number):
+    if stats_gen_number - user_gen_number < 2:
+        late_as_absence = stats.late // 2
+        late_as_attendance = stats.late % 2
+        total_possible_attendance = stats.attendance + stats.absence + late_as_attendance + late_as_absence
+        if total_possible_attendance > 0:
+            return (stats.attendance + late_as_attendance) / total_possible_attendance * 100
+        return 0.0
+    return 100 if stats.attendance > 0 or stats.late > 0 else 0.0
+
+
+def backfill_attendance_rate(apps, schema_editor):
+    AttendanceStats = apps.get_model("attendance", "AttendanceStats")
+    updated = []
+    for stats in AttendanceStats.objects.filter(
+        generation__isnull=False, user__generation__isnull=False
+    ).select_related("user"):
+        stats.attendance_rate = calculate_attendance_rate(
+            stats, int(stats.generation_id[:-1]), int(stats.user.generation_id[:-1])
+        )
+        updated.append(stats)
+    AttendanceStats.objects.bulk_update(updated, ["attendance_rate"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="attendancestats",
+            name="attendance_rate",
+            field=models.FloatField(default=0, verbose_name="출석률"),
+        ),
+        migrations.RunPython(backfill_attendance_rate, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="attendancestats",
+            index=models.Index(fields=["generation", "attendance_rate"], name="attendance_stats_rate_idx"),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.9 on 2026-10-18 15:32
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def delete_duplicate_holidays(apps, schema_editor):
+    Attendance = apps.get_model("attendance", "Attendance")
+    duplicates = (
+        Attendance.objects.filter(attendance_status="휴일")
+        .values("user", "generation", "week")
+        .annotate(row_count=Count("id"), kept_id=Min("id"))
+        .filter(row_count__gt=1)
+    )
+    for duplicate in duplicates:
+        Attendance.objects.filter(
+            attendance_status="휴일",
+            user=duplicate["user"],
+            generation=duplicate["generation"],
+            week=duplicate["week"],
+        ).exclude(id=duplicate["kept_id"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0002_attendance_stats_attendance_rate"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_holidays, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="attendance",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("attendance_status", "휴일")),
+                fields=("user", "generation", "week"),
+                name="unique_holiday_attendance_user_generation_week",
+            ),
+        ),
+    ]
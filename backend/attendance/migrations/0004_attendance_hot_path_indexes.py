@@ -0,0 +1,27 @@
+# Generated by Django 4.2.9 on 2026-10-18 15:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0003_attendance_unique_holiday_per_week"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["user", "generation", "week", "request_processed_status"], name="attendance_user_week_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                condition=models.Q(("request_processed_status", "대기")),
+                fields=["attendance_status", "-request_time"],
+                name="attendance_pending_idx",
+            ),
+        ),
+    ]
@@ -56,6 +56,24 @@ class Attendance(models.Model):
         ordering = ["-request_time"]
         verbose_name = "출석"
         verbose_name_plural = "출석"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "generation", "week"],
+                condition=models.Q(attendance_status="휴일"),
+                name="unique_holiday_attendance_user_generation_week",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "generation", "week", "request_processed_status"],
+                name="attendance_user_week_idx",
+            ),
+            models.Index(
+                fields=["attendance_status", "-request_time"],
+                condition=models.Q(request_processed_status="대기"),
+                name="attendance_pending_idx",
+            ),
+        ]
 
 
 class AttendanceStats(models.Model):
@@ -71,11 +89,15 @@ class AttendanceStats(models.Model):
     attendance = models.IntegerField(default=0, verbose_name="출석 횟수")
     late = models.IntegerField(default=0, verbose_name="지각 횟수")
     absence = models.IntegerField(default=0, verbose_name="결석 횟수")
+    attendance_rate = models.FloatField(default=0, verbose_name="출석률")
 
     class Meta:
         db_table = "attendance_stats"
         verbose_name = "출석 통계"
         verbose_name_plural = "출석 통계"
+        indexes = [
+            models.Index(fields=["generation", "attendance_rate"], name="attendance_stats_rate_idx"),
+        ]
 
 
 class UnavailableDates(models.Model):
@@ -2,10 +2,9 @@ from datetime import datetime
 
 from rest_framework import serializers
 
-from account.models import Generation, User
+from account.models import User
 from account.serializers import UserRetrieveSerializer
-from attendance.models import Attendance, AttendanceStats
-from attendance.services import calculate_attendance_rate, get_current_generation
+from attendance.models import Attendance
 from common.choices import WORKOUT_LEVELS
 from config.utils import WorkoutLevelChoiceField
 
@@ -77,7 +76,7 @@ class UserListSerializer(serializers.ModelSerializer):
     """
 
     workout_level = WorkoutLevelChoiceField(choices=WORKOUT_LEVELS)
-    attendance_rate = serializers.SerializerMethodField()
+    attendance_rate = serializers.FloatField(read_only=True)
 
     class Meta:
         model = User
@@ -91,19 +90,6 @@ class UserListSerializer(serializers.ModelSerializer):
             "attendance_rate",
         ]
 
-    def get_attendance_rate(self, instance):
-        current_generation: Generation = get_current_generation()
-        current_gen_number: int = int(current_generation.name[:-1])
-        user_gen_number: int = int(instance.generation.name[:-1])
-        attendance_stats: AttendanceStats = AttendanceStats.objects.filter(
-            user=instance, generation=current_generation
-        ).first()
-
-        if not attendance_stats:
-            return 0
-
-        return calculate_attendance_rate(attendance_stats, current_gen_number, user_gen_number)
-
     def to_representation(self, instance):
         representation = super().to_representation(instance)
 
@@ -114,5 +100,5 @@ class UserListSerializer(serializers.ModelSerializer):
             "workout_location": representation["workout_location"],
             "workout_level": self.fields["workout_level"].to_representation(instance.workout_level),
             "generation": representation["generation"],
-            "attendance_rate": self.get_attendance_rate(instance),
+            "attendance_rate": representation["attendance_rate"],
         }
@@ -1,11 +1,15 @@
 from datetime import datetime, time, timedelta
-from typing import Optional
+from typing import Iterable, List, Optional, Set
 
+from django.db.models import F, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from account.models import User
+from account.services import get_generation_by_date
 from attendance.models import AttendanceStats, Generation, WeeklyStaffInfo
 from config.exceptions import NotExistException
+from mypage.services import invalidate_mypage_summary
 
 
 def get_current_generation():
@@ -14,10 +18,10 @@ def get_current_generation():
     """
 
     today = timezone.now().date()
-    try:
-        return Generation.objects.get(start_date__lte=today, end_date__gte=today)
-    except Generation.DoesNotExist:
+    generation: Optional[Generation] = get_generation_by_date(today)
+    if generation is None:
         raise NotExistException("기수 정보가 존재하지 않습니다.")
+    return generation
 
 
 def get_weeks_since_start(start_date):
@@ -72,12 +76,12 @@ def check_alternate_attendance(current_user: User) -> bool:
     대체 출석 여부를 판별하기 위한 메서드입니다.
     """
 
-    if int(get_current_generation().name[:-1]) - int(current_user.generation.name[:-1]) > 1:
+    current_generation: Generation = get_current_generation()
+    if int(current_generation.name[:-1]) - int(current_user.generation.name[:-1]) > 1:
         return False
 
     current_time: datetime = timezone.now()
     day_of_week: str = get_day_of_week(current_time.date())
-    current_generation: Generation = get_current_generation()
 
     today_workout_location: str = (
         WeeklyStaffInfo.objects.filter(generation=current_generation, day_of_week=day_of_week)
@@ -91,6 +95,20 @@ def check_alternate_attendance(current_user: User) -> bool:
         return True
 
 
+def annotate_attendance_rate(queryset: QuerySet, generation: Generation) -> QuerySet:
+    """
+    사용자 쿼리셋에 인자로 주어진 기수의 출석률을 주석으로 추가하는 메서드입니다.
+    출석 통계가 없는 사용자의 출석률은 0입니다.
+    """
+
+    attendance_stats: QuerySet = AttendanceStats.objects.filter(user=OuterRef("pk"), generation=generation).order_by(
+        "id"
+    )
+    return queryset.annotate(
+        attendance_rate=Coalesce(Subquery(attendance_stats.values("attendance_rate")[:1]), Value(0.0)),
+    )
+
+
 def calculate_attendance_rate(
     attendance_stats: AttendanceStats,
     current_gen_number: int,
@@ -119,3 +137,65 @@ def calculate_attendance_rate(
             attendance_rate = 0.0
 
     return attendance_rate
+
+
+def get_attendance_rate(attendance_stats: AttendanceStats, user_generation: Optional[str]) -> float:
+    """
+    출석 통계의 기수와 사용자의 가입 기수를 바탕으로 저장할 출석률을 계산하는 메서드입니다.
+    """
+
+    if attendance_stats.generation_id is None or user_generation is None:
+        return 0.0
+
+    stats_gen_number: int = int(attendance_stats.generation_id[:-1])
+    user_gen_number: int = int(user_generation[:-1])
+    return calculate_attendance_rate(attendance_stats, stats_gen_number, user_gen_number)
+
+
+def refresh_attendance_rate(attendance_stats: AttendanceStats, user_generation: Optional[str]) -> None:
+    """
+    출석 통계의 횟수를 다시 조회한 뒤 저장된 출석률을 갱신하는 메서드입니다.
+    횟수를 F 표현식으로 증가시킨 직후에 호출합니다.
+    """
+
+    attendance_stats.refresh_from_db(fields=["attendance", "late", "absence"])
+    attendance_stats.attendance_rate = get_attendance_rate(attendance_stats, user_generation)
+    attendance_stats.save(update_fields=["attendance_rate"])
+
+
+def bulk_refresh_attendance_rates(generation: Generation, user_ids: Iterable[int]) -> None:
+    """
+    인자로 주어진 사용자들의 기수 출석 통계에 저장된 출석률을 한 번에 갱신하는 메서드입니다.
+    """
+
+    attendance_stats_list: List[AttendanceStats] = list(
+        AttendanceStats.objects.filter(generation=generation, user_id__in=user_ids).annotate(
+            user_generation=F("user__generation")
+        )
+    )
+    for attendance_stats in attendance_stats_list:
+        attendance_stats.attendance_rate = get_attendance_rate(attendance_stats, attendance_stats.user_generation)
+    AttendanceStats.objects.bulk_update(attendance_stats_list, ["attendance_rate"], batch_size=500)
+
+
+def increment_absences(generation: Generation, user_ids: List[int]) -> None:
+    """
+    인자로 주어진 사용자들의 결석 횟수를 1씩 증가시키고 출석률을 갱신하는 메서드입니다.
+    출석 통계가 있는 사용자는 하나의 UPDATE로 증가시키고, 없는 사용자는 한 번에 생성합니다.
+    """
+
+    existing_user_ids: Set[int] = set(
+        AttendanceStats.objects.filter(generation=generation, user_id__in=user_ids).values_list("user_id", flat=True)
+    )
+    AttendanceStats.objects.filter(generation=generation, user_id__in=existing_user_ids).update(
+        absence=F("absence") + 1
+    )
+    AttendanceStats.objects.bulk_create(
+        [
+            AttendanceStats(user_id=user_id, generation=generation, absence=1)
+            for user_id in user_ids
+            if user_id not in existing_user_ids
+        ]
+    )
+    bulk_refresh_attendance_rates(generation, user_ids)
+    invalidate_mypage_summary(user_ids)
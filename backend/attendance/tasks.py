@@ -1,19 +1,23 @@
 import logging
+import time
+import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
+from celery import chain
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import F
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
 from account.models import Generation, User
-from attendance.models import (
-    Attendance,
-    AttendanceStats,
-    UnavailableDates,
-    WeeklyStaffInfo,
+from account.services import get_generation_by_date
+from attendance.models import Attendance, UnavailableDates, WeeklyStaffInfo
+from attendance.services import (
+    get_day_of_week,
+    get_weeks_since_start,
+    increment_absences,
 )
-from attendance.services import get_day_of_week, get_weeks_since_start
 from config.celery import app
 
 logger = logging.getLogger("django")
@@ -23,35 +27,37 @@ logger = logging.getLogger("django")
 def reject_pending_attendances():
     """
     처리되지 않은 '대기' 상태의 출석 요청을 거절 처리 하는 테스크입니다.
-    매일 23시 57분에 실행됩니다.
+    거절한 요청 수를 반환합니다.
     """
 
     today = timezone.now().date()
-    if Generation.objects.filter(start_date__lte=today, end_date__gte=today).exists():
+    if get_generation_by_date(today) is not None:
         pending_attendances = Attendance.objects.filter(request_processed_status="대기", request_time__date=today)
-        pending_attendances.update(request_processed_status="거절")
+        return pending_attendances.update(request_processed_status="거절")
+
+    return 0
 
 
 @app.task(name="holiday_processing")
 def holiday_processing():
     """
     휴일 출석을 처리하는 테스크입니다.
-    매일 23시 58분에 실행됩니다.
+    해당 주차에 승인된 출석이 없는 부원에게 휴일 출석을 일괄 기록하며, 처리한 부원 수를 반환합니다.
+    같은 주차의 휴일 출석은 사용자마다 하나만 존재하므로 다시 실행해도 중복으로 기록되지 않습니다.
     """
 
     current_date: datetime = timezone.now().date()
-    current_generation_queryset = Generation.objects.filter(start_date__lte=current_date, end_date__gte=current_date)
-    if current_generation_queryset.exists() and UnavailableDates.objects.filter(date=current_date).exists():
+    current_generation: Optional[Generation] = get_generation_by_date(current_date)
+    if current_generation is not None and UnavailableDates.objects.filter(date=current_date).exists():
 
         day_of_week: str = get_day_of_week(current_date)
-        current_generation: Generation = current_generation_queryset.first()
 
         weekly_staff_info: Optional[WeeklyStaffInfo] = WeeklyStaffInfo.objects.filter(
             generation=current_generation, day_of_week=day_of_week
         ).first()
 
         if weekly_staff_info is None:
-            return
+            return 0
 
         current_generation_name = current_generation.name
         current_generation_number = int(current_generation_name[:-1])
@@ -59,78 +65,177 @@ def holiday_processing():
 
         week: int = get_weeks_since_start(current_generation.start_date)
 
-        users = User.objects.filter(
-            workout_location=weekly_staff_info.workout_location,
-            generation__name__in=[previous_generation_name, current_generation_name],
+        approved_attendances = Attendance.objects.filter(
+            user=OuterRef("pk"),
+            generation=current_generation,
+            week=week,
+            request_processed_status="승인",
+        )
+        holiday_user_ids: List[int] = list(
+            User.objects.filter(
+                workout_location=weekly_staff_info.workout_location,
+                generation__name__in=[previous_generation_name, current_generation_name],
+            )
+            .filter(~Exists(approved_attendances))
+            .values_list("id", flat=True)
         )
+        if not holiday_user_ids:
+            return 0
 
-        with transaction.atomic():
-            for user in users:
-                if not Attendance.objects.filter(
-                    user=user,
+        Attendance.objects.bulk_create(
+            [
+                Attendance(
+                    user_id=user_id,
                     generation=current_generation,
                     week=week,
+                    request_time=current_date,
                     request_processed_status="승인",
-                ).exists():
-                    Attendance.objects.create(
-                        user=user,
-                        generation=current_generation,
-                        week=week,
-                        request_time=current_date,
-                        request_processed_status="승인",
-                        attendance_status="휴일",
-                    )
+                    attendance_status="휴일",
+                )
+                for user_id in holiday_user_ids
+            ],
+            ignore_conflicts=True,
+        )
+        return len(holiday_user_ids)
+
+    return 0
 
 
 @app.task(name="absence_processing")
 def absence_processing():
     """
     당일의 출석 내역을 확인하고 결석을 처리하는 테스크입니다.
-    매일 23시 59분에 실행됩니다.
+    해당 주차에 승인된 출석이 없는 부원을 한 번에 조회하여 결석을 일괄 기록하며, 처리한 결석 수를 반환합니다.
     """
 
     today: datetime = timezone.now().date()
-    current_generation_queryset = Generation.objects.filter(start_date__lte=today, end_date__gte=today)
-    if current_generation_queryset.exists():
+    current_generation: Optional[Generation] = get_generation_by_date(today)
+    if current_generation is not None:
 
-        current_generation: Generation = current_generation_queryset.first()
         start_weekday = current_generation.start_date.weekday()
 
         expected_run_day = (start_weekday - 1) % 7
         if today.weekday() != expected_run_day:
-            return
+            return 0
 
         week = get_weeks_since_start(current_generation.start_date)
 
         current_generation_number = int(current_generation.name[:-1])
         previous_generation_name = f"{current_generation_number - 1}기"
 
-        users = User.objects.filter(
-            generation__name__in=[previous_generation_name, current_generation.name],
-            role="부원",
-            is_active=True,
+        approved_attendances = Attendance.objects.filter(
+            user=OuterRef("pk"),
+            generation=current_generation,
+            week=week,
+            request_processed_status="승인",
+        )
+        absent_user_ids: List[int] = list(
+            User.objects.filter(
+                generation__name__in=[previous_generation_name, current_generation.name],
+                role="부원",
+                is_active=True,
+            )
+            .filter(~Exists(approved_attendances))
+            .values_list("id", flat=True)
         )
+        if not absent_user_ids:
+            return 0
 
         with transaction.atomic():
-            for user in users:
-                if not Attendance.objects.filter(
-                    user=user,
-                    generation=current_generation,
-                    week=week,
-                    request_processed_status="승인",
-                ).exists():
-                    Attendance.objects.create(
-                        user=user,
+            Attendance.objects.bulk_create(
+                [
+                    Attendance(
+                        user_id=user_id,
                         generation=current_generation,
                         week=week,
                         request_time=today,
                         request_processed_status="승인",
                         attendance_status="결석",
                     )
+                    for user_id in absent_user_ids
+                ]
+            )
+            increment_absences(current_generation, absent_user_ids)
 
-                    attendance_stats, created = AttendanceStats.objects.get_or_create(
-                        user=user,
-                        generation=current_generation,
-                    )
-                    attendance_stats.absence = F("absence") + 1
-                    attendance_stats.save()
+        return len(absent_user_ids)
+
+    return 0
+
+
+NIGHTLY_CLOSING_LOCK_KEY = "attendance:nightly_closing:lock"
+
+# 마감 작업이 비정상 종료되어 잠금이 해제되지 않더라도 다음 날 실행이 막히지 않도록 하는 잠금 만료 시간입니다.
+NIGHTLY_CLOSING_LOCK_TIMEOUT = 60 * 30  # Seconds
+
+NIGHTLY_CLOSING_STAGES = {
+    "reject_pending_attendances": reject_pending_attendances,
+    "holiday_processing": holiday_processing,
+    "absence_processing": absence_processing,
+}
+
+
+def release_nightly_closing_lock(lock_token: str) -> None:
+    """
+    야간 출석 마감 잠금을 획득한 작업의 잠금만 해제하는 메서드입니다.
+    """
+
+    if cache.get(NIGHTLY_CLOSING_LOCK_KEY) == lock_token:
+        cache.delete(NIGHTLY_CLOSING_LOCK_KEY)
+
+
+@app.task(name="run_nightly_closing_stage")
+def run_nightly_closing_stage(results: List[Dict], stage: str) -> List[Dict]:
+    """
+    야간 출석 마감의 한 단계를 실행하고, 처리 건수와 소요 시간을 이전 단계의 결과에 덧붙여 반환하는 테스크입니다.
+    """
+
+    started_at: float = time.perf_counter()
+    count: int = NIGHTLY_CLOSING_STAGES[stage]()
+    elapsed: float = round(time.perf_counter() - started_at, 3)
+
+    logger.info(f"야간 출석 마감 단계 완료 - {stage}, 처리 건수: {count}, 소요 시간: {elapsed}초")
+    return [*results, {"stage": stage, "count": count, "elapsed": elapsed}]
+
+
+@app.task(name="finish_nightly_closing")
+def finish_nightly_closing(results: List[Dict], lock_token: str) -> List[Dict]:
+    """
+    야간 출석 마감의 전체 소요 시간을 기록하고 잠금을 해제하는 테스크입니다.
+    """
+
+    release_nightly_closing_lock(lock_token)
+    elapsed: float = round(sum(result["elapsed"] for result in results), 3)
+    logger.info(f"야간 출석 마감 완료 - 소요 시간: {elapsed}초")
+    return results
+
+
+@app.task(name="abort_nightly_closing")
+def abort_nightly_closing(lock_token: str) -> None:
+    """
+    야간 출석 마감의 단계가 실패한 경우 잠금을 해제하는 테스크입니다.
+    """
+
+    release_nightly_closing_lock(lock_token)
+    logger.error("야간 출석 마감 실패 - 남은 단계를 실행하지 않습니다.")
+
+
+@app.task(name="nightly_attendance_closing")
+def nightly_attendance_closing() -> Optional[str]:
+    """
+    출석 요청 거절, 휴일 처리, 결석 처리를 순서대로 실행하는 야간 출석 마감 테스크입니다.
+    캐시 잠금으로 여러 워커와 beat 인스턴스 중 하나만 실행되며, 이미 실행 중이면 None을 반환합니다.
+    매일 23시 57분에 실행됩니다.
+    """
+
+    lock_token: str = uuid.uuid4().hex
+    if not cache.add(NIGHTLY_CLOSING_LOCK_KEY, lock_token, timeout=NIGHTLY_CLOSING_LOCK_TIMEOUT):
+        logger.warning("야간 출석 마감이 이미 실행 중입니다.")
+        return None
+
+    stages: List[str] = list(NIGHTLY_CLOSING_STAGES)
+    workflow = chain(
+        run_nightly_closing_stage.s([], stage=stages[0]),
+        *(run_nightly_closing_stage.s(stage=stage) for stage in stages[1:]),
+        finish_nightly_closing.s(lock_token=lock_token),
+    ).on_error(abort_nightly_closing.si(lock_token))
+    return workflow.apply_async().id
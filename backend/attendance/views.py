@@ -1,10 +1,10 @@
 from datetime import date, datetime
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from django.db import OperationalError, transaction
 from django.db.models import F, Q, QuerySet
 from django.utils import timezone
-from drf_spectacular.utils import OpenApiResponse, extend_schema
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
@@ -54,21 +54,27 @@ from attendance.serializers import (
     UserListSerializer,
 )
 from attendance.services import (
-    calculate_attendance_rate,
+    annotate_attendance_rate,
     check_alternate_attendance,
     get_attendance_status,
     get_current_generation,
     get_day_of_week,
     get_weeks_since_start,
+    refresh_attendance_rate,
 )
 from config.exceptions import (
     AttendancePeriodException,
     DuplicateAttendanceException,
+    InvalidFieldException,
     InvalidFieldStateException,
     NotExistException,
     ResourceLockedException,
 )
 from config.utils import IsManager, IsMember
+from mypage.services import invalidate_mypage_summary
+
+# 부원 목록을 출석률로 정렬할 때 허용하는 정렬 순서입니다.
+ATTENDANCE_RATE_ORDERINGS: List[str] = ["attendance_rate", "-attendance_rate"]
 
 
 class AttendanceAPIView(APIView):
@@ -330,6 +336,8 @@ class AttendanceAcceptAPIView(APIView):
                 attendance_stats.late = F("late") + 1
 
             attendance_stats.save()
+            refresh_attendance_rate(attendance_stats, attendance.user.generation_id)
+            invalidate_mypage_summary([attendance.user_id])
 
             return Response(
                 data={
@@ -455,11 +463,7 @@ class AttendanceRateAPIView(APIView):
             user=current_user, generation=current_generation
         ).first()
 
-        attendance_rate: float = 0
-        if attendance_stats:
-            current_gen_number: int = int(current_generation.name[:-1])
-            user_gen_number: int = int(current_user.generation.name[:-1])
-            attendance_rate = calculate_attendance_rate(attendance_stats, current_gen_number, user_gen_number)
+        attendance_rate: float = attendance_stats.attendance_rate if attendance_stats else 0
 
         return Response(
             data={
@@ -621,6 +625,18 @@ class AttendanceUserListAPIView(APIView):
         tags=["출석"],
         summary="부원 목록 조회",
         description="현재 활성화된 부원들의 목록을 조회하며, 각 부원의 출석률과 운동 수준을 포함합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="ordering",
+                description="출석률 정렬 순서 (attendance_rate: 오름차순, -attendance_rate: 내림차순)",
+                required=False,
+                type=str,
+                enum=ATTENDANCE_RATE_ORDERINGS,
+            ),
+            OpenApiParameter(
+                name="min_attendance_rate", description="조회할 최소 출석률 (0 ~ 100)", required=False, type=float
+            ),
+        ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
                 response=UserListResponseSerializer,
@@ -641,7 +657,24 @@ class AttendanceUserListAPIView(APIView):
         },
     )
     def get(self, request: Request) -> Response:
-        queryset: QuerySet = User.objects.filter(role="부원", is_active=True).all()
+        ordering: Optional[str] = request.query_params.get("ordering")
+        if ordering is not None and ordering not in ATTENDANCE_RATE_ORDERINGS:
+            raise InvalidFieldException("정렬 순서는 attendance_rate 또는 -attendance_rate여야 합니다.")
+        min_attendance_rate: Optional[str] = request.query_params.get("min_attendance_rate")
+        try:
+            if min_attendance_rate is not None and not 0 <= float(min_attendance_rate) <= 100:
+                raise ValueError
+        except ValueError:
+            raise InvalidFieldException("최소 출석률은 0 이상 100 이하의 숫자여야 합니다.")
+
+        current_generation: Generation = get_current_generation()
+        queryset: QuerySet = annotate_attendance_rate(
+            User.objects.filter(role="부원", is_active=True), current_generation
+        )
+        if min_attendance_rate is not None:
+            queryset = queryset.filter(attendance_rate__gte=float(min_attendance_rate))
+        if ordering is not None:
+            queryset = queryset.order_by(ordering, "id")
         serializer: UserListSerializer = UserListSerializer(queryset, many=True)
 
         return Response(
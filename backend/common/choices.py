@@ -1,3 +1,7 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping, Optional, Tuple
+
 ROLE_CHOICES = (
     ("운영진", "운영진"),
     ("부원", "부원"),
@@ -31,3 +35,61 @@ WORKOUT_LEVELS = (
     (9, "갈색"),
     (10, "검정색"),
 )
+
+
+@dataclass(frozen=True)
+class ChoiceRegistry:
+    """
+    선택지의 저장 값과 표시 이름을 양방향으로 조회하는 클래스입니다.
+    모든 조회용 매핑은 생성할 때 한 번만 만들어지며, 변경할 수 없습니다.
+    """
+
+    choices: Tuple[Tuple[Any, str], ...]
+    labels: Mapping[Any, str]
+    values: Mapping[str, Any]
+    value_set: FrozenSet[Any]
+    label_set: FrozenSet[str]
+
+    @classmethod
+    def from_choices(cls, choices: Tuple[Tuple[Any, str], ...]) -> "ChoiceRegistry":
+        labels = dict(choices)
+        values = {label: value for value, label in choices}
+        return cls(
+            choices=tuple(choices),
+            labels=MappingProxyType(labels),
+            values=MappingProxyType(values),
+            value_set=frozenset(labels),
+            label_set=frozenset(values),
+        )
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.value_set
+
+    def get_label(self, value: Any, default: Optional[str] = None) -> Optional[str]:
+        """
+        저장 값의 표시 이름을 반환하는 메서드입니다. 등록되지 않은 값은 default를 반환합니다.
+        """
+        return self.labels.get(value, default)
+
+    def get_value(self, label: str, default: Any = None) -> Any:
+        """
+        표시 이름의 저장 값을 반환하는 메서드입니다. 등록되지 않은 이름은 default를 반환합니다.
+        """
+        return self.values.get(label, default)
+
+
+ROLE_REGISTRY = ChoiceRegistry.from_choices(ROLE_CHOICES)
+WORKOUT_LOCATION_REGISTRY = ChoiceRegistry.from_choices(WORKOUT_LOCATION_CHOICES)
+WORKOUT_LEVEL_REGISTRY = ChoiceRegistry.from_choices(WORKOUT_LEVELS)
+
+CHOICE_REGISTRIES: Mapping[Tuple[Tuple[Any, str], ...], ChoiceRegistry] = MappingProxyType(
+    {registry.choices: registry for registry in (ROLE_REGISTRY, WORKOUT_LOCATION_REGISTRY, WORKOUT_LEVEL_REGISTRY)}
+)
+
+
+def get_choice_registry(choices: Tuple[Tuple[Any, str], ...]) -> ChoiceRegistry:
+    """
+    선택지의 ChoiceRegistry를 반환하는 메서드입니다. 등록되지 않은 선택지는 새로 만듭니다.
+    """
+    registry: Optional[ChoiceRegistry] = CHOICE_REGISTRIES.get(tuple(choices))
+    return registry if registry is not None else ChoiceRegistry.from_choices(choices)
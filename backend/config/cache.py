@@ -0,0 +1,81 @@
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
+
+from config.metrics import metrics
+
+# 캐시 키의 종류를 판별하는 정규식입니다. 키에 포함된 이메일, 사용자 ID 등이 지표의 레이블이 되지 않도록 합니다.
+CACHE_KEY_FAMILIES: List[Tuple[str, re.Pattern]] = [
+    ("register:code", re.compile(r".+:register:code$")),
+    ("register:status", re.compile(r".+:register:status$")),
+    ("password:code", re.compile(r".+:password:code$")),
+    ("password:status", re.compile(r".+:password:status$")),
+    ("mypage:version", re.compile(r"^mypage:\d+:version$")),
+    ("mypage:summary", re.compile(r"^mypage:\d+:[0-9a-f]+:.+$")),
+    ("generation:calendar:version", re.compile(r"^generation:calendar:version$")),
+    ("ranking:scoring", re.compile(r"^ranking:[^:]+:scoring$")),
+    ("attendance:nightly_closing:lock", re.compile(r"^attendance:nightly_closing:lock$")),
+]
+
+_missing = object()
+
+
+def get_cache_key_family(key: str) -> str:
+    """
+    캐시 키가 속한 종류의 이름을 반환하는 메서드입니다. 등록되지 않은 키는 other로 분류합니다.
+    """
+    for family, pattern in CACHE_KEY_FAMILIES:
+        if pattern.match(str(key)):
+            return family
+    return "other"
+
+
+def record_cache_lookup(key: str, hit: bool) -> None:
+    metrics.increment("cache_requests_total", {"cache": get_cache_key_family(key), "result": "hit" if hit else "miss"})
+
+
+class InstrumentedCacheMixin:
+    """
+    캐시 조회마다 키의 종류별로 hit, miss 수를 지표로 기록하는 캐시 백엔드 믹스인입니다.
+    """
+
+    def get(self, key: str, default: Any = None, version=None, **kwargs) -> Any:
+        value: Any = super().get(key, _missing, version=version, **kwargs)
+        record_cache_lookup(key, value is not _missing)
+        return default if value is _missing else value
+
+    def get_or_set(self, key: str, default: Any, timeout=DEFAULT_TIMEOUT, version=None) -> Any:
+        """
+        값이 없으면 저장한 뒤 다시 조회하는 메서드입니다. 다시 조회한 결과는 hit로 기록하지 않습니다.
+        """
+        value: Any = self.get(key, _missing, version=version)
+        if value is not _missing:
+            return value
+
+        if callable(default):
+            default = default()
+        self.add(key, default, timeout=timeout, version=version)
+        return super().get(key, default, version=version)
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    """
+    조회 지표를 기록하는 Redis 캐시 백엔드 클래스입니다.
+    Redis 캐시는 get_many에서 get을 거치지 않으므로 따로 기록합니다.
+    """
+
+    def get_many(self, keys: Iterable[str], version=None, client=None) -> Dict[str, Any]:
+        keys = list(keys)
+        values: Dict[str, Any] = super().get_many(keys, version=version, client=client)
+        for key in keys:
+            record_cache_lookup(key, key in values)
+        return values
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    """
+    조회 지표를 기록하는 로컬 메모리 캐시 백엔드 클래스입니다.
+    """
@@ -1,7 +1,17 @@
 import os
+import time
+from typing import Dict
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import (
+    task_failure,
+    task_postrun,
+    task_prerun,
+    worker_process_shutdown,
+)
+
+from config.metrics import TASK_DURATION_BUCKETS, get_task_metric_name, metrics
 
 env = os.getenv("DJANGO_ENV", "dev")
 settings_module = "config.settings.prod" if env == "prod" else "config.settings.dev"
@@ -14,16 +24,48 @@ app.conf.timezone = "Asia/Seoul"
 app.conf.broker_connection_retry_on_startup = True
 
 app.conf.beat_schedule = {
-    "reject_pending_attendances": {
-        "task": "reject_pending_attendances",
+    "nightly_attendance_closing": {
+        "task": "nightly_attendance_closing",
         "schedule": crontab(hour=23, minute=57),
     },
-    "holiday_processing": {
-        "task": "holiday_processing",
-        "schedule": crontab(hour=23, minute=58),
-    },
-    "absence_processing": {
-        "task": "absence_processing",
-        "schedule": crontab(hour=23, minute=59),
-    },
 }
+
+# 실행 중인 테스크의 시작 시간입니다. 테스크는 같은 워커 프로세스에서 시작하고 끝나므로 프로세스별로 관리합니다.
+_task_started_at: Dict[str, float] = {}
+
+
+@task_prerun.connect
+def record_task_start(task_id: str, **extra) -> None:
+    _task_started_at[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def record_task_duration(task_id: str, task, kwargs: Dict = None, state: str = None, **extra) -> None:
+    """
+    테스크의 실행 시간을 지표로 기록하는 메서드입니다.
+    """
+    started_at = _task_started_at.pop(task_id, None)
+    if started_at is None:
+        return
+    metrics.observe(
+        "celery_task_duration_seconds",
+        {"task": get_task_metric_name(task.name, kwargs), "state": state or "UNKNOWN"},
+        time.perf_counter() - started_at,
+        TASK_DURATION_BUCKETS,
+    )
+
+
+@task_failure.connect
+def record_task_failure(sender, kwargs: Dict = None, **extra) -> None:
+    """
+    테스크의 실패를 지표로 기록하는 메서드입니다.
+    """
+    metrics.increment("celery_task_failures_total", {"task": get_task_metric_name(sender.name, kwargs)})
+
+
+@worker_process_shutdown.connect
+def flush_metrics(**extra) -> None:
+    """
+    prefork 워커 프로세스는 atexit 핸들러를 실행하지 않고 종료되므로, 종료 전에 남은 지표를 반영하는 메서드입니다.
+    """
+    metrics.flush()
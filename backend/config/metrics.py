@@ -0,0 +1,258 @@
+import atexit
+import base64
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger("django")
+
+METRICS_KEY = "metrics:series"
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+TASK_DURATION_BUCKETS: Tuple[float, ...] = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 1800.0)
+
+# 지표 이름별 (유형, 설명)입니다. 노출 형식의 HELP, TYPE 줄에 사용됩니다.
+METRIC_FAMILIES: Dict[str, Tuple[str, str]] = {
+    "http_request_duration_seconds": ("histogram", "DRF 뷰별 요청 처리 시간"),
+    "http_requests_total": ("counter", "DRF 뷰별 요청 수"),
+    "http_request_db_queries_total": ("counter", "DRF 뷰별 실행한 DB 쿼리 수"),
+    "cache_requests_total": ("counter", "캐시 키 종류별 조회 결과(hit, miss) 수"),
+    "celery_task_duration_seconds": ("histogram", "Celery 테스크 실행 시간"),
+    "celery_task_failures_total": ("counter", "Celery 테스크 실패 수"),
+    "celery_queue_length": ("gauge", "Celery 큐에 대기 중인 메시지 수"),
+    "celery_queued_tasks": ("gauge", "Celery 큐에 대기 중인 테스크별 메시지 수"),
+}
+
+# 등록된 이름이 함수 이름과 다른 테스크의 지표 이름입니다.
+TASK_METRIC_NAMES: Dict[str, str] = {
+    "worker": "send_auth_code_to_email",
+}
+
+# 큐 길이를 조회할 때 테스크별로 분류할 최대 메시지 수입니다.
+QUEUE_SCAN_LIMIT = 1000
+
+
+def escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_series(name: str, labels: Dict[str, str]) -> str:
+    """
+    지표 이름과 레이블을 노출 형식의 시계열 이름으로 변환하는 메서드입니다.
+    """
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{key}="{escape_label_value(value)}"' for key, value in labels.items()) + "}"
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def get_metrics_connection() -> Optional[Redis]:
+    """
+    지표 저장소로 사용할 Redis 연결을 반환하는 메서드입니다.
+    캐시 백엔드가 Redis가 아닌 경우 None을 반환하며, 이때 지표는 현재 프로세스에만 집계됩니다.
+    """
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
+
+
+class MetricsStore:
+    """
+    시계열별 값을 Redis 해시에 누적하여, 여러 gunicorn 워커와 Celery 워커의 지표를 하나로 집계하는 클래스입니다.
+    기록한 값은 프로세스 안에서 먼저 합산한 뒤 METRICS_FLUSH_INTERVAL마다 하나의 파이프라인으로 Redis에 반영하므로,
+    캐시 조회나 요청마다 Redis 왕복이 추가되지 않습니다. Redis를 사용할 수 없으면 현재 프로세스의 메모리에 누적합니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local: Dict[str, float] = defaultdict(float)
+        self._pending: Dict[str, float] = defaultdict(float)
+        self._flushed_at: float = time.monotonic()
+
+    def _increment_many(self, increments: Dict[str, float]) -> None:
+        with self._lock:
+            for series, value in increments.items():
+                self._pending[series] += value
+            due: bool = time.monotonic() - self._flushed_at >= settings.METRICS_FLUSH_INTERVAL
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        프로세스 안에서 합산한 값을 Redis에 반영하는 메서드입니다.
+        반영에 실패한 값은 다음 반영 때 다시 시도하지 않고 버립니다.
+        """
+        with self._lock:
+            pending: Dict[str, float] = self._pending
+            self._pending = defaultdict(float)
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return
+
+        connection: Optional[Redis] = get_metrics_connection()
+        if connection is None:
+            with self._lock:
+                for series, value in pending.items():
+                    self._local[series] += value
+            return
+
+        try:
+            pipeline = connection.pipeline(transaction=False)
+            for series, value in pending.items():
+                pipeline.hincrbyfloat(METRICS_KEY, series, value)
+            pipeline.execute()
+        except RedisError as e:
+            logger.error(f"지표 기록 실패, 에러: {str(e)}")
+
+    def increment(self, name: str, labels: Dict[str, str], value: float = 1.0) -> None:
+        """
+        카운터 지표를 value만큼 증가시키는 메서드입니다.
+        """
+        self._increment_many({format_series(name, labels): value})
+
+    def observe(self, name: str, labels: Dict[str, str], value: float, buckets: Iterable[float]) -> None:
+        """
+        히스토그램 지표에 관측값을 기록하는 메서드입니다. 관측값 이상인 모든 구간과 합계, 개수를 한 번에 증가시킵니다.
+        """
+        increments: Dict[str, float] = {
+            format_series(f"{name}_bucket", {**labels, "le": str(bucket)}): 1.0 for bucket in buckets if value <= bucket
+        }
+        increments[format_series(f"{name}_bucket", {**labels, "le": "+Inf"})] = 1.0
+        increments[format_series(f"{name}_sum", labels)] = value
+        increments[format_series(f"{name}_count", labels)] = 1.0
+        self._increment_many(increments)
+
+    def collect(self) -> Dict[str, float]:
+        """
+        누적된 모든 시계열의 값을 반환하는 메서드입니다. 현재 프로세스에서 합산 중인 값을 먼저 반영합니다.
+        """
+        self.flush()
+        connection: Optional[Redis] = get_metrics_connection()
+        if connection is None:
+            with self._lock:
+                return dict(self._local)
+
+        try:
+            return {series.decode(): float(value) for series, value in connection.hgetall(METRICS_KEY).items()}
+        except RedisError as e:
+            logger.error(f"지표 조회 실패, 에러: {str(e)}")
+            return {}
+
+    def reset(self) -> None:
+        """
+        누적된 모든 지표를 삭제하는 메서드입니다.
+        """
+        connection: Optional[Redis] = get_metrics_connection()
+        with self._lock:
+            self._local.clear()
+            self._pending.clear()
+        if connection is not None:
+            connection.delete(METRICS_KEY)
+
+
+metrics = MetricsStore()
+
+# 프로세스가 종료될 때 아직 반영하지 않은 지표를 Redis에 반영합니다.
+atexit.register(metrics.flush)
+
+
+def get_task_metric_name(task_name: str, kwargs: Optional[Dict] = None) -> str:
+    """
+    Celery 테스크의 지표 이름을 반환하는 메서드입니다.
+    야간 출석 마감의 단계를 실행하는 테스크는 단계의 이름을 사용합니다.
+    """
+    if kwargs and kwargs.get("stage"):
+        return kwargs["stage"]
+    return TASK_METRIC_NAMES.get(task_name, task_name)
+
+
+def get_message_task_name(message: bytes) -> str:
+    """
+    브로커에 대기 중인 Celery 메시지의 테스크 지표 이름을 반환하는 메서드입니다.
+    """
+    try:
+        payload: Dict = json.loads(message)
+        task_name: str = payload["headers"]["task"]
+        _, kwargs, _ = json.loads(base64.b64decode(payload["body"]))
+    except (ValueError, KeyError, TypeError):
+        return "unknown"
+    return get_task_metric_name(task_name, kwargs)
+
+
+def collect_queue_metrics() -> Dict[str, float]:
+    """
+    Redis 브로커의 Celery 큐 길이와 테스크별 대기 메시지 수를 조회하는 메서드입니다.
+    브로커가 Redis가 아니거나 조회에 실패하면 빈 결과를 반환합니다.
+    """
+    broker_url: str = getattr(settings, "CELERY_BROKER_URL", "")
+    if not broker_url.startswith(("redis://", "rediss://")):
+        return {}
+
+    queue: str = getattr(settings, "CELERY_TASK_DEFAULT_QUEUE", "celery")
+    try:
+        broker: Redis = Redis.from_url(broker_url, socket_timeout=1)
+        length: int = broker.llen(queue)
+        messages: List[bytes] = broker.lrange(queue, 0, QUEUE_SCAN_LIMIT - 1)
+    except RedisError as e:
+        logger.error(f"Celery 큐 조회 실패, 에러: {str(e)}")
+        return {}
+
+    queued_tasks: Dict[str, int] = defaultdict(int)
+    for message in messages:
+        queued_tasks[get_message_task_name(message)] += 1
+
+    values: Dict[str, float] = {format_series("celery_queue_length", {"queue": queue}): float(length)}
+    for task_name, count in queued_tasks.items():
+        values[format_series("celery_queued_tasks", {"queue": queue, "task": task_name})] = float(count)
+    return values
+
+
+def get_series_sort_key(series: str) -> Tuple[str, float]:
+    """
+    히스토그램의 구간이 le 값의 오름차순으로 노출되도록 정렬하기 위한 키를 반환하는 메서드입니다.
+    """
+    if ',le="' not in series and '{le="' not in series:
+        return (series, 0.0)
+    head, le = series.rsplit('le="', 1)
+    le = le.split('"', 1)[0]
+    return (head, float("inf") if le == "+Inf" else float(le))
+
+
+def get_family_name(series: str) -> str:
+    name: str = series.split("{", 1)[0]
+    for suffix in ("_bucket", "_sum", "_count"):
+        base: str = name[: -len(suffix)]
+        if name.endswith(suffix) and METRIC_FAMILIES.get(base, ("",))[0] == "histogram":
+            return base
+    return name
+
+
+def render_metrics() -> str:
+    """
+    누적된 지표와 Celery 큐 지표를 Prometheus 텍스트 노출 형식으로 변환하는 메서드입니다.
+    """
+    values: Dict[str, float] = {**metrics.collect(), **collect_queue_metrics()}
+
+    families: Dict[str, List[str]] = defaultdict(list)
+    for series in sorted(values, key=get_series_sort_key):
+        families[get_family_name(series)].append(series)
+
+    lines: List[str] = []
+    for family in sorted(families):
+        metric_type, description = METRIC_FAMILIES.get(family, ("untyped", ""))
+        lines.append(f"# HELP {family} {description}")
+        lines.append(f"# TYPE {family} {metric_type}")
+        lines.extend(f"{series} {format_value(values[series])}" for series in families[family])
+    return "\n".join(lines) + "\n"
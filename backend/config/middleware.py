@@ -0,0 +1,130 @@
+import json
+import logging
+import random
+import time
+from contextlib import ExitStack
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from config.metrics import LATENCY_BUCKETS, metrics
+
+logger = logging.getLogger("django")
+
+
+class QueryRecorder:
+    """
+    DB 커넥션의 execute_wrapper로 등록되어, 요청 중에 실행된 쿼리의 개수와 실행 시간을 기록하는 클래스입니다.
+    커넥션은 스레드마다 따로 생성되므로, 요청마다 새로운 인스턴스를 등록하면 스레드 간에 기록이 섞이지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self.queries: List[Tuple[float, str]] = []
+        self.total_ms: float = 0.0
+        self.slowest: Tuple[float, Optional[str]] = (0.0, None)
+
+    def __call__(self, execute: Callable, sql: str, params, many: bool, context):
+        started_at: float = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms: float = (time.perf_counter() - started_at) * 1000
+            self.queries.append((duration_ms, sql))
+            self.total_ms += duration_ms
+            if duration_ms >= self.slowest[0]:
+                self.slowest = (duration_ms, sql)
+
+
+class RequestTimingMiddleware:
+    """
+    요청마다 처리 시간, 쿼리 개수, 쿼리 실행 시간과 가장 느린 쿼리를 기록하는 미들웨어입니다.
+    기록은 구조화된 로그와 Server-Timing 응답 헤더로 남기며, REQUEST_TIMING_SAMPLE_RATE의 비율만큼만 기록합니다.
+    처리 시간이 REQUEST_TIMING_SLOW_THRESHOLD(밀리초)를 넘는 요청은 실행된 모든 쿼리를 함께 남깁니다.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if random.random() >= settings.REQUEST_TIMING_SAMPLE_RATE:
+            return self.get_response(request)
+
+        recorder: QueryRecorder = QueryRecorder()
+        started_at: float = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response: HttpResponse = self.get_response(request)
+        duration_ms: float = (time.perf_counter() - started_at) * 1000
+
+        response["Server-Timing"] = ", ".join(
+            [
+                f"app;dur={duration_ms:.3f}",
+                f'db;dur={recorder.total_ms:.3f};desc="{len(recorder.queries)} queries"',
+                f"db-slowest;dur={recorder.slowest[0]:.3f}",
+            ]
+        )
+        self.log(request, response, recorder, duration_ms)
+        return response
+
+    def log(self, request: HttpRequest, response: HttpResponse, recorder: QueryRecorder, duration_ms: float) -> None:
+        resolver_match = getattr(request, "resolver_match", None)
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "view": resolver_match.view_name if resolver_match else None,
+            "status": response.status_code,
+            "duration_ms": round(duration_ms, 3),
+            "query_count": len(recorder.queries),
+            "sql_ms": round(recorder.total_ms, 3),
+            "slowest_sql_ms": round(recorder.slowest[0], 3),
+            "slowest_sql": recorder.slowest[1],
+        }
+        if duration_ms < settings.REQUEST_TIMING_SLOW_THRESHOLD:
+            logger.info(f"요청 처리 완료 {json.dumps(record, ensure_ascii=False)}")
+            return
+
+        record["queries"] = [{"sql_ms": round(sql_ms, 3), "sql": sql} for sql_ms, sql in recorder.queries]
+        logger.warning(f"느린 요청 처리 {json.dumps(record, ensure_ascii=False)}")
+
+
+class QueryCounter:
+    """
+    DB 커넥션의 execute_wrapper로 등록되어, 요청 중에 실행된 쿼리의 개수만 세는 클래스입니다.
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+
+    def __call__(self, execute: Callable, sql: str, params, many: bool, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class MetricsMiddleware:
+    """
+    DRF 뷰 이름별 요청 처리 시간, 요청 수, 쿼리 수를 /metrics 엔드포인트의 지표로 기록하는 미들웨어입니다.
+    URL에 매칭되지 않은 요청은 경로마다 시계열이 생기지 않도록 하나의 이름으로 모읍니다.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        counter: QueryCounter = QueryCounter()
+        started_at: float = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            response: HttpResponse = self.get_response(request)
+        duration: float = time.perf_counter() - started_at
+
+        resolver_match = getattr(request, "resolver_match", None)
+        view: str = resolver_match.view_name if resolver_match else "unmatched"
+        labels: Dict[str, str] = {"view": view, "method": request.method}
+        metrics.observe("http_request_duration_seconds", labels, duration, LATENCY_BUCKETS)
+        metrics.increment("http_requests_total", {**labels, "status": str(response.status_code)})
+        metrics.increment("http_request_db_queries_total", labels, counter.count)
+        return response
@@ -66,6 +66,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "config.middleware.RequestTimingMiddleware",
+    "config.middleware.MetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -154,3 +156,14 @@ APSCHEDULER_DATETIME_FORMAT = "N j, Y, f:s a"
 APSCHEDULER_RUN_NOW_TIMEOUT = 25  # Seconds
 
 SCHEDULER_DEFAULT = True
+
+# 요청 계측 설정
+
+# 처리 시간과 쿼리를 기록할 요청의 비율입니다. (0.0 ~ 1.0)
+REQUEST_TIMING_SAMPLE_RATE = 1.0
+
+# 처리 시간이 이 값을 넘는 요청은 실행된 모든 쿼리를 로그로 남깁니다.
+REQUEST_TIMING_SLOW_THRESHOLD = 1000  # Milliseconds
+
+# 프로세스 안에서 합산한 지표를 Redis에 반영하는 간격입니다.
+METRICS_FLUSH_INTERVAL = 5.0  # Seconds
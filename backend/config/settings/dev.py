@@ -55,7 +55,7 @@ else:
 
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        "BACKEND": "config.cache.InstrumentedRedisCache",
         "LOCATION": env("REDIS_URI", default=""),
         "OPTION": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
@@ -109,6 +109,12 @@ LOGGING = {
     },
 }
 
+# 요청 계측 설정
+
+REQUEST_TIMING_SAMPLE_RATE = env.float("REQUEST_TIMING_SAMPLE_RATE", default=1.0)
+REQUEST_TIMING_SLOW_THRESHOLD = env.int("REQUEST_TIMING_SLOW_THRESHOLD", default=1000)
+METRICS_FLUSH_INTERVAL = env.float("METRICS_FLUSH_INTERVAL", default=5.0)
+
 # Celery 설정
 
 CELERY_BROKER_URL = env("CELERY_BROKER_URL", default="")
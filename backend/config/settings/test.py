@@ -12,3 +12,9 @@ DATABASES = {
         "NAME": BASE_DIR / "test_db.sqlite3",
     }
 }
+
+CACHES = {
+    "default": {
+        "BACKEND": "config.cache.InstrumentedLocMemCache",
+    }
+}
@@ -22,6 +22,8 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from config.views import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include([
@@ -34,4 +36,5 @@ urlpatterns = [
     path("docs/json/", SpectacularJSONAPIView.as_view(), name="schema-json"),
     path("docs/swagger/", SpectacularSwaggerView.as_view(url_name="schema-json"), name="swagger-ui",),
     path("docs/redoc/", SpectacularRedocView.as_view(url_name="schema-json"), name="redoc",),
+    path("metrics", metrics_view, name="metrics"),
 ]
@@ -6,6 +6,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
+from common.choices import WORKOUT_LEVELS, ChoiceRegistry, get_choice_registry
 from config.exceptions import InvalidFieldException, PermissionFailedException
 
 
@@ -58,14 +59,15 @@ class IsManager(permissions.BasePermission):
 
 
 class WorkoutLevelChoiceField(serializers.ChoiceField):
+    def __init__(self, choices=WORKOUT_LEVELS, **kwargs):
+        self.registry: ChoiceRegistry = get_choice_registry(choices)
+        super().__init__(choices, **kwargs)
+
     def to_representation(self, obj):
-        for key, val in self._choices.items():
-            if key == int(obj):
-                return val
+        return self.registry.get_label(int(obj))
 
     def to_internal_value(self, data):
         # To support inserts with the value
-        for key, val in self._choices.items():
-            if val == data:
-                return key
+        if isinstance(data, str) and data in self.registry.label_set:
+            return self.registry.values[data]
         raise InvalidFieldException("난이도가 정확하지 않습니다.")
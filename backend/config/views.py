@@ -0,0 +1,13 @@
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.http import require_GET
+
+from config.metrics import render_metrics
+
+
+@require_GET
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    누적된 지표를 Prometheus 텍스트 노출 형식으로 반환하는 메서드입니다.
+    nginx에서 외부 요청을 차단하므로, 도커 네트워크 안에서만 조회할 수 있습니다.
+    """
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,14 +1,20 @@
-from django.db.models import DurationField, ExpressionWrapper, F, Sum
+from typing import List, Optional, Tuple
+
 from drf_spectacular.utils import extend_schema_serializer
 from rest_framework import serializers
 
 from account.models import User
 from attendance.models import AttendanceStats
 from attendance.services import get_current_generation
-from common.choices import WORKOUT_LEVELS, WORKOUT_LOCATION_CHOICES
+from common.choices import (
+    WORKOUT_LEVEL_REGISTRY,
+    WORKOUT_LEVELS,
+    WORKOUT_LOCATION_REGISTRY,
+)
 from config.exceptions import InvalidFieldException, NotExistException
 from mypage.schemas import USER_UPDATE_REQUEST_EXAMPLE
-from record.models import BoulderProblem, Record
+from mypage.services import invalidate_mypage_summary
+from record.models import WorkoutStats, get_empty_level_counts
 from record.serializers import WorkoutLevelChoiceField
 
 
@@ -67,45 +73,67 @@ class MypageSerializer(serializers.ModelSerializer):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if "current_generation" in self.context:
+            self.current_generation = self.context["current_generation"]
+            return
+
         try:
             self.current_generation = get_current_generation()
         except NotExistException:
             self.current_generation = None
 
+    def get_workout_stats(self, obj) -> Tuple[int, List[int]]:
+        """
+        현재 기수의 총 운동 시간(초)과 난이도별 해결한 문제 개수를 운동 통계에서 조회하는 메서드입니다.
+        annotate_mypage_summary로 주석된 경우 추가 쿼리 없이 주석 값을 사용합니다.
+        """
+        if hasattr(obj, "workout_total_seconds"):
+            return obj.workout_total_seconds or 0, obj.workout_level_counts or get_empty_level_counts()
+
+        if not hasattr(self, "_workout_stats"):
+            workout_stats: Optional[WorkoutStats] = WorkoutStats.objects.filter(
+                user=obj, generation=self.current_generation
+            ).first()
+            self._workout_stats = (
+                (workout_stats.total_seconds, workout_stats.level_counts)
+                if workout_stats
+                else (0, get_empty_level_counts())
+            )
+        return self._workout_stats
+
     def get_records(self, obj):
         if not self.current_generation:
             return []
 
-        level_counts = (
-            BoulderProblem.objects.filter(record__user=obj, record__generation=self.current_generation)
-            .values("workout_level")
-            .annotate(total_count=Sum("count"))
-            .order_by("workout_level")
-        )
-        return LevelCountSerializer(level_counts, many=True).data
+        _, level_counts = self.get_workout_stats(obj)
+        return LevelCountSerializer(
+            [
+                {"workout_level": level, "total_count": count}
+                for (level, _), count in zip(WORKOUT_LEVELS, level_counts)
+                if count
+            ],
+            many=True,
+        ).data
 
     def get_total_workout_time(self, obj):
         if not self.current_generation:
             return 0
 
-        total_time_dict = (
-            Record.objects.filter(user=obj, generation=self.current_generation)
-            .annotate(workout_time=ExpressionWrapper(F("end_time") - F("start_time"), output_field=DurationField()))
-            .aggregate(total=Sum("workout_time"))
-        )
-        dict_result = total_time_dict["total"]
-        if dict_result is None:
-            return 0
-
-        total_seconds = dict_result.total_seconds()
-        total_minutes = int(total_seconds // 60)
-        return total_minutes
+        total_seconds, _ = self.get_workout_stats(obj)
+        return total_seconds // 60
 
     def get_attendance_stats(self, obj):
         if not self.current_generation:
             return {}
 
-        attendance_stats = AttendanceStats.objects.filter(user=obj, generation=self.current_generation).first()
+        if hasattr(obj, "stats_attendance"):
+            attendance_stats = None
+            if obj.stats_attendance is not None:
+                attendance_stats = AttendanceStats(
+                    attendance=obj.stats_attendance, late=obj.stats_late, absence=obj.stats_absence
+                )
+        else:
+            attendance_stats = AttendanceStats.objects.filter(user=obj, generation=self.current_generation).first()
         if attendance_stats:
             return AttendanceStatsSerializer(attendance_stats).data
         else:
@@ -130,15 +158,18 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         model = User
         fields = ["workout_location", "workout_level", "profile_number", "introduction"]
 
+    def update(self, instance, validated_data):
+        instance = super().update(instance, validated_data)
+        invalidate_mypage_summary([instance.id])
+        return instance
+
     def validate_workout_location(self, value: str) -> str:
-        workout_location = [choice[0] for choice in WORKOUT_LOCATION_CHOICES]
-        if value not in workout_location:
+        if value not in WORKOUT_LOCATION_REGISTRY:
             raise InvalidFieldException("지점이 정확하지 않습니다.")
         return value
 
     def validate_workout_level(self, value: int) -> int:
-        workout_level = [choice[0] for choice in WORKOUT_LEVELS]
-        if value not in workout_level:
+        if value not in WORKOUT_LEVEL_REGISTRY:
             raise InvalidFieldException("난이도가 정확하지 않습니다.")
         return value
 
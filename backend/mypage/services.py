@@ -0,0 +1,61 @@
+import uuid
+from typing import Dict, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import JSONField, OuterRef, QuerySet, Subquery
+
+from account.models import Generation
+from attendance.models import AttendanceStats
+from record.models import WorkoutStats
+
+MYPAGE_SUMMARY_CACHE_TIMEOUT = 60 * 60 * 24  # Seconds
+
+
+def get_mypage_version_key(user_id: int) -> str:
+    return f"mypage:{user_id}:version"
+
+
+def get_mypage_summary_key(user_id: int, generation: Optional[Generation]) -> str:
+    """
+    사용자의 현재 버전과 기수를 포함한 마이페이지 요약 캐시 키를 반환하는 메서드입니다.
+    버전 키가 없으면 새 버전을 발급하므로, 유실된 버전으로 이전 요약이 조회되지 않습니다.
+    """
+    version: str = cache.get_or_set(get_mypage_version_key(user_id), lambda: uuid.uuid4().hex, timeout=None)
+    generation_name: str = generation.name if generation else "-"
+    return f"mypage:{user_id}:{version}:{generation_name}"
+
+
+def invalidate_mypage_summary(user_ids: Iterable[int]) -> None:
+    """
+    사용자들의 마이페이지 요약 캐시를 무효화하는 메서드입니다.
+    트랜잭션이 커밋된 이후 버전을 바꾸며, 이전 버전의 요약은 만료 시간이 지나면 제거됩니다.
+    """
+    version_keys = [get_mypage_version_key(user_id) for user_id in set(user_ids)]
+    if not version_keys:
+        return
+
+    def bump_versions() -> None:
+        version: str = uuid.uuid4().hex
+        cache.set_many({key: version for key in version_keys}, timeout=None)
+
+    transaction.on_commit(bump_versions)
+
+
+def annotate_mypage_summary(queryset: QuerySet, generation: Optional[Generation]) -> QuerySet:
+    """
+    사용자 쿼리셋에 인자로 주어진 기수의 운동 통계와 출석 통계를 주석으로 추가하는 메서드입니다.
+    """
+    workout_stats: QuerySet = WorkoutStats.objects.filter(user=OuterRef("pk"), generation=generation)
+    attendance_stats: QuerySet = AttendanceStats.objects.filter(user=OuterRef("pk"), generation=generation).order_by(
+        "id"
+    )
+    annotations: Dict[str, Subquery] = {
+        "workout_total_seconds": Subquery(workout_stats.values("total_seconds")[:1]),
+        "workout_level_counts": Subquery(workout_stats.values("level_counts")[:1], output_field=JSONField()),
+        **{
+            f"stats_{field}": Subquery(attendance_stats.values(field)[:1])
+            for field in ("attendance", "late", "absence")
+        },
+    }
+    return queryset.annotate(**annotations)
@@ -1,11 +1,15 @@
+from typing import Dict, Optional
+
+from django.core.cache import cache
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 from rest_framework import permissions, status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from account.models import User
-from config.exceptions import UserNotExistException
+from account.models import Generation, User
+from attendance.services import get_current_generation
+from config.exceptions import NotExistException, UserNotExistException
 from mypage.schemas import (
     MYPAGE_RESPONSE_EXAMPLE,
     USER_NOT_EXIST_FAILURE_EXAMPLE,
@@ -20,6 +24,31 @@ from mypage.serializers import (
     UserProfileSerializer,
     UserUpdateSerializer,
 )
+from mypage.services import (
+    MYPAGE_SUMMARY_CACHE_TIMEOUT,
+    annotate_mypage_summary,
+    get_mypage_summary_key,
+)
+
+
+def get_mypage_summary(user: User) -> Dict:
+    """
+    사용자의 마이페이지 요약을 캐시에서 조회하고, 없으면 계산하여 캐시에 저장하는 메서드입니다.
+    """
+    try:
+        current_generation: Optional[Generation] = get_current_generation()
+    except NotExistException:
+        current_generation = None
+
+    cache_key: str = get_mypage_summary_key(user.id, current_generation)
+    summary: Optional[Dict] = cache.get(cache_key)
+    if summary is not None:
+        return summary
+
+    annotated_user: User = annotate_mypage_summary(User.objects.filter(id=user.id), current_generation).get()
+    summary = dict(MypageSerializer(annotated_user, context={"current_generation": current_generation}).data)
+    cache.set(cache_key, summary, timeout=MYPAGE_SUMMARY_CACHE_TIMEOUT)
+    return summary
 
 
 class MypageAPIView(APIView):
@@ -56,14 +85,14 @@ class MypageAPIView(APIView):
                 raise UserNotExistException()
 
             serializer = UserProfileSerializer(user)
+            data = serializer.data
         else:
-            user = request.user
-            serializer = MypageSerializer(user)
+            data = get_mypage_summary(request.user)
 
         return Response(
             data={
                 "detail": "마이페이지 조회를 성공했습니다.",
-                "data": serializer.data,
+                "data": data,
             },
             status=status.HTTP_200_OK,
         )
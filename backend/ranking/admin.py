@@ -0,0 +1,26 @@
+# mypy: ignore-errors
+
+from django.contrib import admin, messages
+
+from ranking.models import ScoringMatrix
+from ranking.scoring import get_default_multipliers
+from ranking.tasks import recompute_rankings
+
+
+@admin.register(ScoringMatrix)
+class ScoringMatrixAdmin(admin.ModelAdmin):
+    list_display = ("generation", "updated_at")
+    readonly_fields = ("updated_at",)
+    actions = ("recompute_generation_rankings",)
+
+    def get_changeform_initial_data(self, request):
+        initial = super().get_changeform_initial_data(request)
+        initial.setdefault("multipliers", get_default_multipliers())
+        return initial
+
+    @admin.action(description="선택한 기수의 랭킹 재계산")
+    def recompute_generation_rankings(self, request, queryset):
+        # 점수표를 저장하거나 삭제하면 자동으로 다시 계산되며, 재계산이 실패한 경우 직접 다시 요청할 때 사용합니다.
+        for matrix in queryset:
+            recompute_rankings.delay(matrix.generation_id)
+        self.message_user(request, f"{queryset.count()}개 기수의 랭킹 재계산을 요청했습니다.", messages.SUCCESS)
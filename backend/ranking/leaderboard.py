@@ -0,0 +1,348 @@
+import logging
+import uuid
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django_redis import get_redis_connection
+from redis import Redis
+from redis.exceptions import RedisError, WatchError
+
+from account.models import Generation, User
+from ranking.models import Ranking, get_ranking_user_fields
+
+logger = logging.getLogger("django")
+
+LEADERBOARD_GENERATIONS_KEY = "ranking:generations"
+
+# 전체 리더보드를 다시 구성했음을 나타내는 키입니다. rebuild_leaderboard만 이 키를 기록합니다.
+LEADERBOARD_POPULATED_KEY = "ranking:populated"
+
+# 재구성 중인 리더보드의 토큰을 저장하는 키의 만료 시간입니다.
+LEADERBOARD_REBUILD_TIMEOUT = 300  # Seconds
+
+# 유실된 리더보드의 재구성을 다시 요청하기까지의 최소 간격입니다.
+LEADERBOARD_REBUILD_REQUEST_INTERVAL = 60  # Seconds
+
+# 점수를 반영하는 중 다른 요청과 충돌한 경우 다시 시도하는 횟수입니다.
+LEADERBOARD_INCREMENT_RETRIES = 3
+
+LEADERBOARD_USER_FIELDS: tuple[str, ...] = (
+    "username",
+    "generation",
+    "workout_location",
+    "workout_level",
+    "profile_number",
+)
+
+
+def generation_sort_key(generation: Optional[str]) -> tuple[int, int]:
+    """
+    기수를 기수 번호 순으로 정렬하기 위한 키를 반환하는 메서드입니다. 기수가 없는 경우 마지막에 위치합니다.
+    """
+    if generation is None:
+        return (1, 0)
+    return (0, int(generation[:-1]))
+
+
+def get_weeks_key(generation: str) -> str:
+    return f"ranking:{generation}:weeks"
+
+
+def get_weekly_key(generation: str, week: int) -> str:
+    return f"ranking:{generation}:week:{week}"
+
+
+def get_generation_key(generation: str) -> str:
+    return f"ranking:{generation}:total"
+
+
+def get_populated_key(generation: Optional[str]) -> str:
+    return f"ranking:{generation}:populated" if generation is not None else LEADERBOARD_POPULATED_KEY
+
+
+def get_rebuilding_key(generation: Optional[str]) -> str:
+    return f"ranking:{generation}:rebuilding" if generation is not None else "ranking:rebuilding"
+
+
+def get_rebuild_requested_key(generation: Optional[str]) -> str:
+    return f"ranking:{generation}:rebuild_requested" if generation is not None else "ranking:rebuild_requested"
+
+
+def get_leaderboard_connection() -> Optional[Redis]:
+    """
+    리더보드 저장소로 사용할 Redis 연결을 반환하는 메서드입니다.
+    캐시 백엔드가 Redis가 아닌 경우 None을 반환합니다.
+    """
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
+
+
+def _increment_score(generation: str, week: int, user_id: int, delta: float) -> None:
+    """
+    리더보드에 점수 변화량을 반영하는 메서드입니다.
+    리더보드가 다시 구성된 적이 없거나, 일부가 유실되었거나, 재구성 중이면 점수를 반영하지 않고
+    재구성 표시를 지워, 조회할 때 데이터베이스를 사용하고 재구성을 요청하도록 합니다.
+    """
+    connection = get_leaderboard_connection()
+    if connection is None:
+        return
+
+    populated_key = get_populated_key(generation)
+    weeks_key = get_weeks_key(generation)
+    weekly_key = get_weekly_key(generation, week)
+    generation_key = get_generation_key(generation)
+    rebuilding_keys = (get_rebuilding_key(generation), get_rebuilding_key(None))
+    try:
+        for _ in range(LEADERBOARD_INCREMENT_RETRIES):
+            with connection.pipeline() as pipeline:
+                try:
+                    pipeline.watch(populated_key, weeks_key, weekly_key, generation_key, *rebuilding_keys)
+                    is_stale = (
+                        pipeline.exists(populated_key, generation_key) < 2 or pipeline.exists(*rebuilding_keys) > 0
+                    )
+                    if not is_stale and pipeline.sismember(weeks_key, week):
+                        # 집계된 주차의 리더보드만 유실된 경우입니다.
+                        is_stale = not pipeline.exists(weekly_key)
+                    pipeline.multi()
+                    if is_stale:
+                        pipeline.delete(populated_key, LEADERBOARD_POPULATED_KEY, *rebuilding_keys)
+                        pipeline.execute()
+                        return
+
+                    pipeline.zincrby(weekly_key, delta, user_id)
+                    pipeline.zincrby(generation_key, delta, user_id)
+                    pipeline.zremrangebyscore(weekly_key, "-inf", 0)
+                    pipeline.zremrangebyscore(generation_key, "-inf", 0)
+                    pipeline.sadd(weeks_key, week)
+                    pipeline.sadd(LEADERBOARD_GENERATIONS_KEY, generation)
+                    pipeline.exists(weekly_key)
+                    *_, has_weekly = pipeline.execute()
+                except WatchError:
+                    continue
+            if not has_weekly:
+                connection.srem(weeks_key, week)
+            return
+
+        # 계속 충돌하여 반영하지 못한 점수는 재구성으로 반영합니다.
+        connection.delete(populated_key, LEADERBOARD_POPULATED_KEY)
+    except RedisError as e:
+        logger.error(f"리더보드 점수 반영 실패 - {generation} {week}주차 {user_id}, 에러: {str(e)}")
+
+
+def increment_leaderboard_score(generation: Optional[str], week: int, user_id: int, delta: float) -> None:
+    """
+    주차별, 기수별 리더보드에 점수 변화량을 반영하는 메서드입니다.
+    트랜잭션이 커밋된 이후에 반영되며, 점수가 0 이하가 된 사용자는 리더보드에서 제거됩니다.
+    """
+    if generation is None or not delta:
+        return
+    transaction.on_commit(lambda: _increment_score(generation, week, user_id, delta))
+
+
+def _get_user_rows(user_ids: Iterable[int]) -> Dict[int, Dict]:
+    users = User.objects.filter(id__in=set(user_ids)).only("id", *LEADERBOARD_USER_FIELDS)
+    return {user.id: {"user_id": user.id, **get_ranking_user_fields(user)} for user in users}
+
+
+def request_leaderboard_rebuild(connection: Redis, generation: Optional[str] = None) -> None:
+    """
+    유실된 리더보드의 재구성을 요청하는 메서드입니다.
+    같은 리더보드의 재구성은 LEADERBOARD_REBUILD_REQUEST_INTERVAL마다 한 번만 요청하며, 존재하지 않는 기수는 요청하지 않습니다.
+    """
+    if generation is not None and not Generation.objects.filter(name=generation).exists():
+        return
+
+    # ranking.tasks는 ranking.services를 거쳐 이 모듈을 불러오므로, 순환 참조를 피하기 위해 여기서 불러옵니다.
+    from ranking.tasks import rebuild_leaderboard_task
+
+    try:
+        if connection.set(get_rebuild_requested_key(generation), 1, nx=True, ex=LEADERBOARD_REBUILD_REQUEST_INTERVAL):
+            rebuild_leaderboard_task.delay(generation)
+    except Exception as e:
+        logger.error(f"리더보드 재구성 요청 실패 - {generation or '전체'}, 에러: {str(e)}")
+
+
+def _build_ranking_rows(entries: List[tuple], users: Dict[int, Dict], **extra) -> List[Dict]:
+    return [{**extra, **users[int(user_id)], "score": score} for user_id, score in entries if int(user_id) in users]
+
+
+def get_weekly_leaderboard_from_store(generation: str) -> Optional[List[Dict]]:
+    """
+    Redis 리더보드에서 기수의 주차별 랭킹을 조회하는 메서드입니다.
+    리더보드가 다시 구성된 적이 없거나 일부가 유실된 경우 재구성을 요청하고 None을 반환하며,
+    다시 구성된 이후 점수가 없는 기수는 빈 목록을 반환합니다.
+    """
+    connection = get_leaderboard_connection()
+    if connection is None:
+        return None
+
+    try:
+        pipeline = connection.pipeline()
+        pipeline.exists(get_populated_key(generation))
+        pipeline.smembers(get_weeks_key(generation))
+        is_populated, weeks_members = pipeline.execute()
+        if not is_populated:
+            request_leaderboard_rebuild(connection, generation)
+            return None
+        if not weeks_members:
+            return []
+
+        weeks = sorted(int(week) for week in weeks_members)
+        pipeline = connection.pipeline()
+        for week in weeks:
+            pipeline.zrevrange(get_weekly_key(generation, week), 0, -1, withscores=True)
+        weekly_entries = pipeline.execute()
+    except RedisError as e:
+        logger.error(f"리더보드 조회 실패 - {generation}, 에러: {str(e)}")
+        return None
+
+    if any(not entries for entries in weekly_entries):
+        request_leaderboard_rebuild(connection, generation)
+        return None
+
+    users = _get_user_rows(int(user_id) for entries in weekly_entries for user_id, _ in entries)
+    return [
+        {"week": week, "ranking": _build_ranking_rows(entries, users, week=week)}
+        for week, entries in zip(weeks, weekly_entries)
+    ]
+
+
+def get_generation_leaderboard_from_store(
+    generation: Optional[str] = None, limit: Optional[int] = None
+) -> Optional[List[Dict]]:
+    """
+    Redis 리더보드에서 기수별 누적 랭킹을 조회하는 메서드입니다.
+    generation이 주어지면 해당 기수만, limit이 주어지면 기수별 상위 limit명만 조회합니다.
+    리더보드가 다시 구성된 적이 없거나 일부가 유실된 경우 재구성을 요청하고 None을 반환하며,
+    다시 구성된 이후 점수가 없는 기수는 결과에서 제외합니다.
+    """
+    connection = get_leaderboard_connection()
+    if connection is None:
+        return None
+
+    try:
+        if generation is None:
+            pipeline = connection.pipeline()
+            pipeline.exists(LEADERBOARD_POPULATED_KEY)
+            pipeline.smembers(LEADERBOARD_GENERATIONS_KEY)
+            is_populated, generations_members = pipeline.execute()
+            generations = sorted((name.decode() for name in generations_members), key=generation_sort_key)
+        else:
+            is_populated, generations = True, [generation]
+        if not is_populated:
+            request_leaderboard_rebuild(connection, None)
+            return None
+        if not generations:
+            return []
+
+        pipeline = connection.pipeline()
+        for generation_name in generations:
+            pipeline.exists(get_populated_key(generation_name))
+            pipeline.exists(get_weeks_key(generation_name))
+            pipeline.zrevrange(get_generation_key(generation_name), 0, (limit or 0) - 1, withscores=True)
+        results = pipeline.execute()
+    except RedisError as e:
+        logger.error(f"리더보드 조회 실패, 에러: {str(e)}")
+        return None
+
+    generation_entries: Dict[str, List[tuple]] = {}
+    for generation_name, is_generation_populated, has_weeks, entries in zip(
+        generations, results[0::3], results[1::3], results[2::3]
+    ):
+        # 점수가 있는 주차가 남아 있는데 누적 랭킹이 비어 있다면 누적 랭킹이 유실된 경우입니다.
+        if not is_generation_populated or (has_weeks and not entries):
+            request_leaderboard_rebuild(connection, generation)
+            return None
+        if entries:
+            generation_entries[generation_name] = entries
+
+    users = _get_user_rows(int(user_id) for entries in generation_entries.values() for user_id, _ in entries)
+    return [
+        {"generation": generation_name, "ranking": _build_ranking_rows(entries, users, generation=generation_name)}
+        for generation_name, entries in generation_entries.items()
+    ]
+
+
+def rebuild_leaderboard(generation: Optional[str] = None) -> Optional[int]:
+    """
+    Ranking 테이블을 바탕으로 Redis 리더보드를 다시 구성하는 메서드입니다.
+    generation이 주어지면 해당 기수만 다시 구성하며, 반영한 Ranking 행의 개수를 반환합니다. 존재하지 않는 기수는 구성하지 않습니다.
+    재구성하는 동안 점수가 변경되면 읽은 Ranking이 최신이 아니므로 반영하지 않고 None을 반환합니다.
+    """
+    connection = get_leaderboard_connection()
+    if connection is None:
+        return 0
+    if generation is not None and not Generation.objects.filter(name=generation).exists():
+        return 0
+
+    rebuilding_key = get_rebuilding_key(generation)
+    token = uuid.uuid4().hex
+    connection.set(rebuilding_key, token, ex=LEADERBOARD_REBUILD_TIMEOUT)
+
+    rankings = Ranking.objects.filter(generation__isnull=False)
+    if generation is not None:
+        rankings = rankings.filter(generation=generation)
+
+    weekly_scores: Dict[str, Dict[int, Dict[int, float]]] = defaultdict(lambda: defaultdict(dict))
+    generation_scores: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+    count = 0
+    for row in rankings.values_list("generation", "week", "user_id", "score").iterator():
+        generation_name, week, user_id, score = row
+        if score <= 0:
+            continue
+        weekly_scores[generation_name][week][user_id] = weekly_scores[generation_name][week].get(user_id, 0) + score
+        generation_scores[generation_name][user_id] += score
+        count += 1
+
+    try:
+        with connection.pipeline() as pipeline:
+            pipeline.watch(rebuilding_key)
+            if pipeline.get(rebuilding_key) != token.encode():
+                logger.warning(f"리더보드 재구성 중 점수가 변경되어 반영하지 않습니다 - {generation or '전체'}")
+                return None
+
+            if generation is None:
+                stale_generations = {name.decode() for name in pipeline.smembers(LEADERBOARD_GENERATIONS_KEY)}
+            else:
+                stale_generations = {generation}
+            stale_weeks = {
+                generation_name: pipeline.smembers(get_weeks_key(generation_name))
+                for generation_name in stale_generations | set(generation_scores)
+            }
+
+            pipeline.multi()
+            if generation is None:
+                pipeline.delete(LEADERBOARD_GENERATIONS_KEY)
+            else:
+                pipeline.srem(LEADERBOARD_GENERATIONS_KEY, generation)
+
+            for generation_name, weeks in stale_weeks.items():
+                for week in weeks:
+                    pipeline.delete(get_weekly_key(generation_name, int(week)))
+                pipeline.delete(
+                    get_weeks_key(generation_name),
+                    get_generation_key(generation_name),
+                    get_populated_key(generation_name),
+                )
+
+            for generation_name, weeks in weekly_scores.items():
+                for week, scores in weeks.items():
+                    pipeline.zadd(get_weekly_key(generation_name, week), scores)
+                    pipeline.sadd(get_weeks_key(generation_name), week)
+                pipeline.zadd(get_generation_key(generation_name), generation_scores[generation_name])
+                pipeline.sadd(LEADERBOARD_GENERATIONS_KEY, generation_name)
+                pipeline.set(get_populated_key(generation_name), 1)
+
+            if generation is None:
+                pipeline.set(LEADERBOARD_POPULATED_KEY, 1)
+            else:
+                pipeline.set(get_populated_key(generation), 1)
+            pipeline.delete(rebuilding_key)
+            pipeline.execute()
+    except WatchError:
+        logger.warning(f"리더보드 재구성 중 점수가 변경되어 반영하지 않습니다 - {generation or '전체'}")
+        return None
+    return count
@@ -0,0 +1,19 @@
+from django.core.management import BaseCommand, CommandError
+
+from ranking.leaderboard import get_leaderboard_connection, rebuild_leaderboard
+
+
+class Command(BaseCommand):
+    help = "Ranking 테이블을 바탕으로 Redis 리더보드를 다시 구성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--generation", type=str, default=None, help="다시 구성할 기수 (예: 11기)")
+
+    def handle(self, *args, **options):
+        if get_leaderboard_connection() is None:
+            raise CommandError("Redis 캐시가 설정되어 있지 않아 리더보드를 구성할 수 없습니다.")
+
+        count = rebuild_leaderboard(options["generation"])
+        if count is None:
+            raise CommandError("리더보드를 구성하는 동안 점수가 변경되었습니다. 다시 실행해 주세요.")
+        self.stdout.write(self.style.SUCCESS(f"리더보드 재구성 완료 - 랭킹 {count}건"))
@@ -0,0 +1,33 @@
+from django.core.management import BaseCommand, CommandError
+
+from config.exceptions import NotExistException
+from ranking.services import recompute_generation_rankings
+from ranking.tasks import recompute_rankings
+
+
+class Command(BaseCommand):
+    help = "해결한 문제 기록을 바탕으로 기수의 랭킹 점수를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("generation", type=str, help="다시 계산할 기수 (예: 11기)")
+        parser.add_argument("--async", action="store_true", dest="run_async", help="Celery 워커에서 실행합니다.")
+
+    def handle(self, *args, **options):
+        generation = options["generation"]
+        if options["run_async"]:
+            result = recompute_rankings.delay(generation)
+            self.stdout.write(self.style.SUCCESS(f"랭킹 재계산 요청 완료 - 테스크 ID: {result.id}"))
+            return
+
+        try:
+            result = recompute_generation_rankings(generation)
+        except NotExistException as e:
+            raise CommandError(str(e.detail))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"랭킹 재계산 완료 - 문제 {result['rows']}건, 기간 외 문제 {result['skipped']}건, "
+                f"랭킹 {result['rankings']}건, "
+                f"소요 시간: {result['elapsed']}초, 초당 {result['rows_per_second']}행"
+            )
+        )
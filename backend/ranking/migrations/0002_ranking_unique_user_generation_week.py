@@ -0,0 +1,37 @@
+# Generated by Django 4.2.9 on 2026-10-18 15:22
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def merge_duplicate_rankings(apps, schema_editor):
+    Ranking = apps.get_model("ranking", "Ranking")
+    duplicates = (
+        Ranking.objects.values("user", "generation", "week")
+        .annotate(row_count=Count("id"), total_score=Sum("score"))
+        .filter(row_count__gt=1)
+    )
+    for duplicate in duplicates:
+        rankings = Ranking.objects.filter(
+            user=duplicate["user"], generation=duplicate["generation"], week=duplicate["week"]
+        ).order_by("id")
+        kept = rankings.first()
+        rankings.exclude(id=kept.id).delete()
+        Ranking.objects.filter(id=kept.id).update(score=duplicate["total_score"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ranking", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_rankings, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="ranking",
+            constraint=models.UniqueConstraint(
+                fields=("user", "generation", "week"), name="unique_ranking_user_generation_week"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.9 on 2026-10-18 15:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ranking", "0002_ranking_unique_user_generation_week"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ranking",
+            index=models.Index(fields=["generation", "week", "-score"], name="ranking_generation_week_idx"),
+        ),
+    ]
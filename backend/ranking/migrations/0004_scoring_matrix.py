@@ -0,0 +1,43 @@
+# Generated by Django 4.2.9 on 2026-10-18 15:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+import ranking.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0002_generation_date_range_index"),
+        ("ranking", "0003_ranking_generation_week_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScoringMatrix",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "multipliers",
+                    models.JSONField(
+                        validators=[ranking.models.validate_multipliers], verbose_name="난이도별 문제당 점수"
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정 시각")),
+                (
+                    "generation",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scoring_matrix",
+                        to="account.generation",
+                        verbose_name="운영 기수",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "점수표",
+                "verbose_name_plural": "점수표",
+                "db_table": "scoring_matrix",
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.2.9 on 2026-10-18 16:01
+
+from django.db import migrations, models
+from django.db.models import Case, OuterRef, Subquery, Value, When
+
+from common.choices import WORKOUT_LEVELS
+
+
+def backfill_ranking_user_fields(apps, schema_editor):
+    Ranking = apps.get_model("ranking", "Ranking")
+    User = apps.get_model("account", "User")
+    users = User.objects.filter(id=OuterRef("user_id"))
+    Ranking.objects.update(
+        username=Subquery(users.values("username")[:1]),
+        user_generation=Subquery(users.values("generation")[:1]),
+        workout_location=Subquery(users.values("workout_location")[:1]),
+        workout_level=Subquery(users.values("workout_level")[:1]),
+        profile_number=Subquery(users.values("profile_number")[:1]),
+    )
+    Ranking.objects.update(
+        workout_level_label=Case(
+            *(When(workout_level=level, then=Value(label)) for level, label in WORKOUT_LEVELS),
+            default=Value(""),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0002_generation_date_range_index"),
+        ("ranking", "0004_scoring_matrix"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ranking",
+            name="profile_number",
+            field=models.IntegerField(blank=True, null=True, verbose_name="프로필 번호"),
+        ),
+        migrations.AddField(
+            model_name="ranking",
+            name="user_generation",
+            field=models.CharField(blank=True, max_length=10, null=True, verbose_name="가입 기수"),
+        ),
+        migrations.AddField(
+            model_name="ranking",
+            name="username",
+            field=models.CharField(blank=True, default="", max_length=20, verbose_name="사용자 이름"),
+        ),
+        migrations.AddField(
+            model_name="ranking",
+            name="workout_level",
+            field=models.IntegerField(blank=True, null=True, verbose_name="난이도"),
+        ),
+        migrations.AddField(
+            model_name="ranking",
+            name="workout_level_label",
+            field=models.CharField(blank=True, default="", max_length=10, verbose_name="난이도 색상"),
+        ),
+        migrations.AddField(
+            model_name="ranking",
+            name="workout_location",
+            field=models.CharField(blank=True, default="", max_length=100, verbose_name="지점"),
+        ),
+        migrations.RunPython(backfill_ranking_user_fields, migrations.RunPython.noop),
+    ]
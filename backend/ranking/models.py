@@ -1,9 +1,51 @@
 # mypy: ignore-errors
 
+from django.core.exceptions import ValidationError
 from django.db import models
 
 from account.models import User
 from attendance.models import Generation
+from common.choices import WORKOUT_LEVEL_REGISTRY, WORKOUT_LEVELS
+
+SCORING_LEVEL_COUNT = len(WORKOUT_LEVELS)
+
+# 리더보드를 조회할 때 user를 조인하지 않도록 Ranking에 함께 저장하는 사용자의 표시 정보입니다.
+RANKING_USER_FIELDS: tuple[str, ...] = (
+    "username",
+    "user_generation",
+    "workout_location",
+    "workout_level",
+    "workout_level_label",
+    "profile_number",
+)
+
+
+def get_ranking_user_fields(user: User) -> dict:
+    """
+    사용자의 표시 정보를 Ranking에 저장하는 형태로 반환하는 메서드입니다.
+    """
+    return {
+        "username": user.username,
+        "user_generation": user.generation_id,
+        "workout_location": user.workout_location,
+        "workout_level": user.workout_level,
+        "workout_level_label": WORKOUT_LEVEL_REGISTRY.get_label(user.workout_level, ""),
+        "profile_number": user.profile_number,
+    }
+
+
+def validate_multipliers(value):
+    """
+    점수표가 (사용자 난이도 x 문제 난이도) 크기의 0 이상인 숫자 행렬인지 검증하는 메서드입니다.
+    """
+    if not isinstance(value, list) or len(value) != SCORING_LEVEL_COUNT:
+        raise ValidationError(f"점수표는 {SCORING_LEVEL_COUNT}개의 행으로 이루어져야 합니다.")
+    for row in value:
+        if not isinstance(row, list) or len(row) != SCORING_LEVEL_COUNT:
+            raise ValidationError(f"점수표의 각 행은 {SCORING_LEVEL_COUNT}개의 값으로 이루어져야 합니다.")
+        for multiplier in row:
+            if isinstance(multiplier, bool) or not isinstance(multiplier, (int, float)) or multiplier < 0:
+                raise ValidationError("점수표의 값은 0 이상의 숫자여야 합니다.")
 
 
 class Ranking(models.Model):
@@ -13,10 +55,44 @@ class Ranking(models.Model):
     )
     week = models.PositiveIntegerField(verbose_name="주차")
     score = models.FloatField(default=0.0, verbose_name="점수 합산")
+    username = models.CharField(max_length=20, blank=True, default="", verbose_name="사용자 이름")
+    user_generation = models.CharField(max_length=10, null=True, blank=True, verbose_name="가입 기수")
+    workout_location = models.CharField(max_length=100, blank=True, default="", verbose_name="지점")
+    workout_level = models.IntegerField(null=True, blank=True, verbose_name="난이도")
+    workout_level_label = models.CharField(max_length=10, blank=True, default="", verbose_name="난이도 색상")
+    profile_number = models.IntegerField(null=True, blank=True, verbose_name="프로필 번호")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성 시각")
 
     class Meta:
         db_table = "ranking"
         ordering = ["week"]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "generation", "week"], name="unique_ranking_user_generation_week"),
+        ]
+        indexes = [
+            models.Index(fields=["generation", "week", "-score"], name="ranking_generation_week_idx"),
+        ]
         verbose_name = "랭킹"
         verbose_name_plural = "랭킹"
+
+    def save(self, *args, **kwargs):
+        if self._state.adding and not self.username:
+            for field, value in get_ranking_user_fields(self.user).items():
+                setattr(self, field, value)
+        super().save(*args, **kwargs)
+
+
+class ScoringMatrix(models.Model):
+    generation = models.OneToOneField(
+        Generation, on_delete=models.CASCADE, related_name="scoring_matrix", verbose_name="운영 기수"
+    )
+    multipliers = models.JSONField(validators=[validate_multipliers], verbose_name="난이도별 문제당 점수")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 시각")
+
+    class Meta:
+        db_table = "scoring_matrix"
+        verbose_name = "점수표"
+        verbose_name_plural = "점수표"
+
+    def __str__(self):
+        return f"{self.generation_id} 점수표"
@@ -0,0 +1,91 @@
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ranking.models import SCORING_LEVEL_COUNT, ScoringMatrix
+
+SCORING_MATRIX_CACHE_TIMEOUT = 60 * 60 * 24  # Seconds
+
+# 점수표가 없는 기수를 캐시에 기록하기 위한 값입니다.
+DEFAULT_SCORING_MATRIX = "default"
+
+
+def get_default_multiplier(user_level: int, problem_level: int) -> float:
+    """
+    점수표가 없거나 점수표 범위를 벗어난 난이도에 적용하는 기본 규칙으로 문제당 점수를 반환하는 메서드입니다.
+    사용자보다 낮은 난이도는 0.5점, 같은 난이도는 1점, 높은 난이도는 2점입니다.
+    """
+    if problem_level < user_level:
+        return 0.5
+    elif problem_level == user_level:
+        return 1.0
+    else:
+        return 2.0
+
+
+def get_default_multipliers() -> List[List[float]]:
+    """
+    기본 규칙으로 계산한 (사용자 난이도 x 문제 난이도) 점수표를 반환하는 메서드입니다.
+    """
+    levels = range(1, SCORING_LEVEL_COUNT + 1)
+    return [[get_default_multiplier(user_level, problem_level) for problem_level in levels] for user_level in levels]
+
+
+class ScoringEngine:
+    """
+    (사용자 난이도 x 문제 난이도)별 문제당 점수를 미리 계산한 표로 점수를 계산하는 클래스입니다.
+    표는 (사용자 난이도 - 1) * 난이도 개수 + (문제 난이도 - 1) 위치에 저장된 1차원 목록이며,
+    관리자의 난이도(0)처럼 표의 범위를 벗어난 난이도는 기본 규칙으로 계산합니다.
+    """
+
+    def __init__(self, multipliers: Sequence[Sequence[float]]) -> None:
+        self.table: Tuple[float, ...] = tuple(float(multiplier) for row in multipliers for multiplier in row)
+
+    def get_multiplier(self, user_level: int, problem_level: int) -> float:
+        """
+        인자로 주어진 사용자 난이도와 문제 난이도의 문제당 점수를 반환하는 메서드입니다.
+        """
+        if 0 < user_level <= SCORING_LEVEL_COUNT and 0 < problem_level <= SCORING_LEVEL_COUNT:
+            return self.table[(user_level - 1) * SCORING_LEVEL_COUNT + problem_level - 1]
+        return get_default_multiplier(user_level, problem_level)
+
+    def score(self, user_level: int, problems: Iterable[Tuple[int, int]]) -> float:
+        """
+        (난이도, 해결한 문제 개수)의 목록으로 사용자의 점수를 계산하는 메서드입니다.
+        """
+        return sum(count * self.get_multiplier(user_level, level) for level, count in problems)
+
+
+default_scoring_engine = ScoringEngine(get_default_multipliers())
+
+
+def get_scoring_matrix_key(generation: str) -> str:
+    return f"ranking:{generation}:scoring"
+
+
+def get_scoring_engine(generation: Optional[str]) -> ScoringEngine:
+    """
+    기수의 점수표로 구성한 ScoringEngine을 반환하는 메서드입니다.
+    점수표는 캐시에 저장되며, 점수표가 없는 기수는 기본 규칙의 점수표를 사용합니다.
+    """
+    if generation is None:
+        return default_scoring_engine
+
+    key: str = get_scoring_matrix_key(generation)
+    multipliers = cache.get(key)
+    if multipliers is None:
+        matrix: Optional[ScoringMatrix] = ScoringMatrix.objects.filter(generation_id=generation).first()
+        multipliers = matrix.multipliers if matrix is not None else DEFAULT_SCORING_MATRIX
+        cache.set(key, multipliers, timeout=SCORING_MATRIX_CACHE_TIMEOUT)
+
+    if multipliers == DEFAULT_SCORING_MATRIX:
+        return default_scoring_engine
+    return ScoringEngine(multipliers)
+
+
+def invalidate_scoring_engine(generation: str) -> None:
+    """
+    캐시에 저장된 기수의 점수표를 트랜잭션이 커밋된 이후 무효화하는 메서드입니다.
+    """
+    transaction.on_commit(lambda: cache.delete(get_scoring_matrix_key(generation)))
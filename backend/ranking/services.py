@@ -1,29 +1,276 @@
+import time
+from collections import defaultdict
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from account.models import Generation
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from account.models import Generation, User
+from account.services import get_generation_by_date
 from config import exceptions
+from ranking.leaderboard import (
+    LEADERBOARD_USER_FIELDS,
+    generation_sort_key,
+    get_generation_leaderboard_from_store,
+    get_weekly_leaderboard_from_store,
+    increment_leaderboard_score,
+    rebuild_leaderboard,
+)
+from ranking.models import RANKING_USER_FIELDS, Ranking, get_ranking_user_fields
+from ranking.scoring import ScoringEngine, get_default_multiplier, get_scoring_engine
+from record.models import BoulderProblem, Record
+
+RankingKey = Tuple[str, int]
+
+RANKING_VALUES_FIELDS: tuple[str, ...] = ("week", "user_id", *RANKING_USER_FIELDS, "score")
+
+# 기수별 랭킹 잠금에 사용하는 PostgreSQL 권고 잠금의 네임스페이스입니다.
+RANKING_LOCK_NAMESPACE = 901
 
 
 def get_problems_score(user_level: int, problem_level: int, count: int) -> float:
     """
-    사용자의 레벨과 문제의 레벨을 바탕으로 점수를 계산하는 메서드입니다.
+    사용자의 레벨과 문제의 레벨을 바탕으로 기본 규칙의 점수를 계산하는 메서드입니다.
+    기수별 점수표를 적용하려면 get_scoring_engine으로 조회한 ScoringEngine을 사용합니다.
     """
-    if problem_level < user_level:
-        return count * 0.5
-    elif problem_level == user_level:
-        return count * 1.0
-    else:
-        return count * 2.0
+    return count * get_default_multiplier(user_level, problem_level)
 
 
-def get_weeks_in_generation(target_date: datetime.date) -> int:  # type: ignore
+def get_weeks_in_generation(target_date: datetime.date, generation: Optional[Generation] = None) -> int:  # type: ignore
     """
     기수의 시작일과 종료일을 바탕으로 몇 주차인지 계산하는 메서드입니다.
     """
-    try:
-        generation = Generation.objects.get(start_date__lte=target_date, end_date__gte=target_date)
-    except Exception:
-        raise exceptions.NotExistException("기수 정보가 존재하지 않습니다.")
+    if generation is None:
+        generation = get_generation_by_date(target_date)
+        if generation is None:
+            raise exceptions.NotExistException("기수 정보가 존재하지 않습니다.")
     delta = target_date - generation.start_date
     week = delta.days // 7 + 1
     return week
+
+
+def get_record_ranking_scores(
+    record: Record, problems: Iterable[Tuple[int, int]], user_level: int
+) -> Dict[RankingKey, float]:
+    """
+    기록이 랭킹에 기여하는 점수를 (기수, 주차)별로 계산하는 메서드입니다.
+    problems는 (난이도, 해결한 문제 개수)의 목록이며, 기수에 속하지 않는 기록은 점수가 없습니다.
+    """
+    if record.generation_id is None or record.generation.start_date is None:
+        return {}
+    week: int = get_weeks_in_generation(record.start_time.date(), record.generation)
+    score: float = get_scoring_engine(record.generation_id).score(user_level, problems)
+    return {(record.generation_id, week): score}
+
+
+def lock_generation_rankings(generation: str, shared: bool) -> None:
+    """
+    트랜잭션이 끝날 때까지 기수의 랭킹을 잠그는 메서드입니다.
+    점수 증감은 공유 잠금을, 랭킹 재계산은 배타 잠금을 사용하므로 증감끼리는 동시에 실행되고 재계산과는 순서대로 실행됩니다.
+    PostgreSQL이 아닌 데이터베이스에서는 잠그지 않습니다.
+    """
+    if connection.vendor != "postgresql":
+        return
+    lock_function: str = "pg_advisory_xact_lock_shared" if shared else "pg_advisory_xact_lock"
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {lock_function}(%s, hashtext(%s))", [RANKING_LOCK_NAMESPACE, generation])
+
+
+def apply_ranking_deltas(user: User, old_scores: Dict[RankingKey, float], new_scores: Dict[RankingKey, float]) -> None:
+    """
+    기록 변경 전후의 점수 차이를 계산하여 Ranking 모델에 한 번에 반영하는 메서드입니다.
+    (기수, 주차)마다 점수를 원자적으로 증감하며, 점수가 0 이하가 된 Ranking 인스턴스는 삭제됩니다.
+    진행 중인 랭킹 재계산과 겹치지 않도록 기수의 랭킹을 공유 잠금으로 잠근 뒤 반영하며,
+    잠금은 트랜잭션이 끝날 때 풀리므로 기록을 저장하는 트랜잭션 안에서 호출합니다.
+    """
+    deltas: Dict[RankingKey, float] = defaultdict(float)
+    for key, score in new_scores.items():
+        deltas[key] += score
+    for key, score in old_scores.items():
+        deltas[key] -= score
+
+    for generation in sorted({generation for (generation, _), delta in deltas.items() if delta}):
+        lock_generation_rankings(generation, shared=True)
+    for (generation, week), delta in deltas.items():
+        if delta and increment_ranking_score(user, generation, week, delta):
+            increment_leaderboard_score(generation, week, user.id, delta)
+
+
+def increment_ranking_score(user: User, generation: str, week: int, delta: float) -> bool:
+    """
+    Ranking 인스턴스의 점수를 원자적으로 증감하는 메서드입니다.
+    인스턴스가 없으면 사용자의 표시 정보와 함께 새로 생성하며, 동시에 생성되어 유니크 제약 조건에 걸린 경우 다시 증감합니다.
+    점수가 0 이하가 된 인스턴스는 삭제되며, 반영된 변화가 없으면 False를 반환합니다.
+    """
+    rankings = Ranking.objects.filter(user=user, generation_id=generation, week=week)
+    if rankings.update(score=F("score") + delta):
+        if delta < 0:
+            rankings.filter(score__lte=0).delete()
+        return True
+
+    if delta < 0:
+        return False
+
+    try:
+        with transaction.atomic():
+            Ranking.objects.create(
+                user=user, generation_id=generation, week=week, score=delta, **get_ranking_user_fields(user)
+            )
+    except IntegrityError:
+        rankings.update(score=F("score") + delta)
+    return True
+
+
+def get_weekly_leaderboard(generation: Generation) -> List[Dict]:
+    """
+    기수의 주차별 랭킹을 반환하는 메서드입니다.
+    Redis 리더보드를 우선 조회하고, 리더보드를 사용할 수 없으면 데이터베이스에서 조회합니다.
+    """
+    leaderboard: Optional[List[Dict]] = get_weekly_leaderboard_from_store(generation.name)
+    if leaderboard is None:
+        leaderboard = query_weekly_leaderboard(generation)
+    return leaderboard
+
+
+def query_weekly_leaderboard(generation: Generation) -> List[Dict]:
+    """
+    기수의 모든 주차 랭킹을 한 번의 쿼리로 조회한 뒤, 주차별로 묶어 반환하는 메서드입니다.
+    """
+    rankings = Ranking.objects.filter(generation=generation).values(*RANKING_VALUES_FIELDS).order_by("week", "-score")
+    return [{"week": week, "ranking": list(rows)} for week, rows in groupby(rankings, key=itemgetter("week"))]
+
+
+def get_generation_leaderboard(generation: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+    """
+    기수별 누적 랭킹을 반환하는 메서드입니다.
+    Redis 리더보드를 우선 조회하고, 리더보드를 사용할 수 없으면 데이터베이스에서 조회합니다.
+    """
+    leaderboard: Optional[List[Dict]] = get_generation_leaderboard_from_store(generation, limit)
+    if leaderboard is None:
+        leaderboard = query_generation_leaderboard(generation, limit)
+    return leaderboard
+
+
+def get_leaderboard_row(row: Dict) -> Dict:
+    """
+    기수별 누적 랭킹 쿼리의 결과 행에서 집계한 표시 정보의 이름을 Ranking의 필드 이름으로 되돌리는 메서드입니다.
+    """
+    return {
+        "generation": row["generation"],
+        "user_id": row["user_id"],
+        **{field: row[f"display_{field}"] for field in RANKING_USER_FIELDS},
+        "score": row["score"],
+        "rank": row["rank"],
+    }
+
+
+def query_generation_leaderboard(generation: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+    """
+    기수와 사용자별로 점수를 합산하는 한 번의 쿼리로 기수별 누적 랭킹을 조회하는 메서드입니다.
+    사용자의 표시 정보는 Ranking에 함께 저장되어 있으므로 user를 조인하지 않습니다.
+    표시 정보가 주차마다 다르게 저장되어 있어도 사용자가 두 번 집계되지 않도록 기수와 사용자로만 묶고,
+    표시 정보는 각 필드의 최댓값을 사용합니다.
+    limit이 주어지면 기수별 순위를 매겨 상위 limit명만 조회합니다.
+    """
+    rankings = Ranking.objects.all()
+    if generation is not None:
+        rankings = rankings.filter(generation=generation)
+
+    rankings = (
+        rankings.values("generation", "user_id")
+        .annotate(
+            score=models.Sum("score"),
+            **{f"display_{field}": models.Max(field) for field in RANKING_USER_FIELDS},
+        )
+        .annotate(
+            rank=Window(
+                expression=RowNumber(),
+                partition_by=[F("generation")],
+                order_by=[F("score").desc(), F("user_id").asc()],
+            )
+        )
+        .order_by("generation", "rank")
+    )
+    if limit is not None:
+        rankings = rankings.filter(rank__lte=limit)
+
+    leaderboard: List[Dict] = [
+        {"generation": generation_name, "ranking": [get_leaderboard_row(row) for row in rows]}
+        for generation_name, rows in groupby(rankings.iterator(), key=itemgetter("generation"))
+    ]
+    return sorted(leaderboard, key=lambda generation_ranking: generation_sort_key(generation_ranking["generation"]))
+
+
+def recompute_generation_rankings(generation_name: str, chunk_size: int = 5000) -> Dict[str, float]:
+    """
+    기수의 모든 해결한 문제를 한 번의 스트리밍 쿼리로 읽어 기수의 점수표로 랭킹 점수를 다시 계산하고,
+    기수의 Ranking 인스턴스를 하나의 트랜잭션 안에서 교체하는 메서드입니다.
+    재계산하는 동안 저장된 기록의 점수가 유실되지 않도록 기수의 랭킹을 배타 잠금으로 잠근 뒤 기록을 읽습니다.
+    기수의 기간이 변경되어 기간을 벗어난 기록은 제외하며,
+    처리한 문제 행 수, 제외한 문제 행 수, 생성한 랭킹 수, 소요 시간과 초당 처리 행 수를 반환합니다.
+    """
+    generation: Optional[Generation] = Generation.objects.filter(name=generation_name).first()
+    if generation is None or generation.start_date is None:
+        raise exceptions.NotExistException("기수 정보가 존재하지 않습니다.")
+
+    started_at: float = time.perf_counter()
+    engine: ScoringEngine = get_scoring_engine(generation.name)
+    with transaction.atomic():
+        # 기록의 점수 변화는 잠금이 풀린 뒤 새로 생성한 Ranking 인스턴스에 반영됩니다.
+        lock_generation_rankings(generation.name, shared=False)
+        rows = (
+            BoulderProblem.objects.filter(record__generation=generation)
+            .values_list(
+                "record__user_id", "record__user__workout_level", "workout_level", "count", "record__start_time"
+            )
+            .order_by()
+            .iterator(chunk_size=chunk_size)
+        )
+
+        scores: Dict[Tuple[int, int], float] = defaultdict(float)
+        row_count: int = 0
+        skipped_count: int = 0
+        for user_id, user_level, problem_level, count, start_time in rows:
+            row_count += 1
+            record_date = start_time.date()
+            if record_date < generation.start_date or (generation.end_date and record_date > generation.end_date):
+                skipped_count += 1
+                continue
+            week: int = (record_date - generation.start_date).days // 7 + 1
+            scores[(user_id, week)] += count * engine.get_multiplier(user_level, problem_level)
+
+        users: Dict[int, Dict] = {
+            user.id: get_ranking_user_fields(user)
+            for user in User.objects.filter(id__in={user_id for user_id, _ in scores}).only(
+                "id", *LEADERBOARD_USER_FIELDS
+            )
+        }
+        rankings: List[Ranking] = [
+            Ranking(user_id=user_id, generation=generation, week=week, score=score, **users[user_id])
+            for (user_id, week), score in scores.items()
+            if score > 0
+        ]
+        Ranking.objects.filter(generation=generation).delete()
+        Ranking.objects.bulk_create(rankings, batch_size=1000)
+        transaction.on_commit(lambda: rebuild_leaderboard(generation.name))
+
+    elapsed: float = time.perf_counter() - started_at
+    return {
+        "rows": row_count,
+        "skipped": skipped_count,
+        "rankings": len(rankings),
+        "elapsed": round(elapsed, 3),
+        "rows_per_second": round(row_count / elapsed, 1) if elapsed else float(row_count),
+    }
+
+
+def sync_ranking_user_fields(user: User) -> int:
+    """
+    사용자의 모든 Ranking 인스턴스에 저장된 표시 정보를 사용자의 현재 정보로 갱신하는 메서드입니다.
+    갱신한 Ranking 인스턴스의 개수를 반환합니다.
+    """
+    return Ranking.objects.filter(user=user).update(**get_ranking_user_fields(user))
@@ -1,77 +1,67 @@
-from django.db.models.signals import post_save, pre_delete, pre_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
 from django.dispatch import receiver
 
-from account.models import Generation
-from ranking.models import Ranking
-from ranking.services import get_problems_score, get_weeks_in_generation
-from record.models import BoulderProblem
+from account.models import User
+from ranking.models import ScoringMatrix, get_ranking_user_fields
+from ranking.scoring import invalidate_scoring_engine
+from ranking.services import sync_ranking_user_fields
+from ranking.tasks import recompute_rankings
 
+# Ranking에 저장하는 표시 정보의 원본인 User 필드입니다.
+RANKING_USER_SOURCE_FIELDS: frozenset = frozenset(
+    {"username", "generation", "generation_id", "workout_location", "workout_level", "profile_number"}
+)
 
-@receiver(post_save, sender=BoulderProblem)
-def update_ranking_on_post_save(
-    sender: BoulderProblem, instance: BoulderProblem, created: bool, raw: bool, using: str, **kwargs
-) -> None:
+
+def refresh_generation_rankings(generation: str) -> None:
     """
-    BoulderProblem 모델의 인스턴스가 생성되거나 업데이트될 때 호출되는 함수입니다.
-    인스턴스의 workout_level과 count를 기반으로 계산된 score가 Ranking 모델에 합산됩니다.
-    인스턴스에 연결된 Record 모델의 generation과 week에 Ranking 인스턴스가 존재하지 않으면, 새로 생성됩니다.
+    기수의 점수표가 변경되었을 때 캐시된 점수표를 무효화하고, 랭킹 재계산을 요청하는 메서드입니다.
+    기존 랭킹 점수는 이전 점수표로 계산되었으므로, 트랜잭션이 커밋된 이후 새 점수표로 다시 계산합니다.
     """
-    generation: Generation = instance.record.generation
-    try:
-        week: int = get_weeks_in_generation(instance.record.start_time.date())
-    except Exception:
-        return
-    ranking, _ = Ranking.objects.get_or_create(user=instance.record.user, generation=generation, week=week)
-    ranking.score += get_problems_score(instance.record.user.workout_level, instance.workout_level, instance.count)
-    ranking.save()
+    invalidate_scoring_engine(generation)
+    transaction.on_commit(lambda: recompute_rankings.delay(generation))
 
 
-@receiver(pre_save, sender=BoulderProblem)
-def update_ranking_on_pre_save(
-    sender: BoulderProblem, instance: BoulderProblem, raw: bool, using: str, update_fields: list, **kwargs
-) -> None:
+@receiver(post_save, sender=ScoringMatrix)
+def refresh_generation_rankings_on_save(sender: ScoringMatrix, instance: ScoringMatrix, **kwargs) -> None:
     """
-    BoulderProblem 모델의 인스턴스가 업데이트되기 전에 호출되는 함수입니다.
-    인스턴스의 workout_level과 count를 기반으로 계산된 score가 Ranking 모델에 감산됩니다.
-    Ranking 인스턴스의 score가 0 이하일 경우 삭제됩니다.
+    ScoringMatrix 모델의 인스턴스가 생성되거나 수정될 때 호출되는 함수입니다.
+    캐시에 저장된 기수의 점수표를 무효화하고 기수의 랭킹을 다시 계산합니다.
     """
-    try:
-        old_instance: BoulderProblem = BoulderProblem.objects.get(pk=instance.pk)
-    except BoulderProblem.DoesNotExist:
-        return
-    generation: Generation = old_instance.record.generation
-    try:
-        week: int = get_weeks_in_generation(old_instance.record.start_time.date())
-    except Exception:
-        return
-    ranking: Ranking = Ranking.objects.get(user=old_instance.record.user, generation=generation, week=week)
-    ranking.score -= get_problems_score(
-        old_instance.record.user.workout_level, old_instance.workout_level, old_instance.count
-    )
-    if ranking.score <= 0:
-        ranking.delete()
-    else:
-        ranking.save()
+    refresh_generation_rankings(instance.generation_id)
+
+
+@receiver(post_delete, sender=ScoringMatrix)
+def refresh_generation_rankings_on_delete(sender: ScoringMatrix, instance: ScoringMatrix, **kwargs) -> None:
+    """
+    ScoringMatrix 모델의 인스턴스가 삭제될 때 호출되는 함수입니다.
+    캐시에 저장된 기수의 점수표를 무효화하고 기수의 랭킹을 다시 계산합니다.
+    """
+    refresh_generation_rankings(instance.generation_id)
 
 
-@receiver(pre_delete, sender=BoulderProblem)
-def update_ranking_on_delete(sender: BoulderProblem, instance: BoulderProblem, using: str, **kwargs) -> None:
+@receiver(post_init, sender=User)
+def remember_ranking_user_fields(sender: User, instance: User, **kwargs) -> None:
     """
-    BoulderProblem 모델의 인스턴스가 삭제되기 전에 호출되는 함수입니다.
-    인스턴스의 workout_level과 count를 기반으로 계산된 score가 Ranking 모델에 감산됩니다.
-    Ranking 인스턴스의 score가 0 이하일 경우 삭제됩니다.
+    User 모델의 인스턴스가 생성될 때 호출되는 함수입니다.
+    저장할 때 표시 정보가 변경되었는지 비교할 수 있도록 불러온 표시 정보를 기억합니다.
+    일부 필드만 불러온 인스턴스는 추가 쿼리가 실행되지 않도록 기억하지 않습니다.
     """
-    generation: Generation = instance.record.generation
-    try:
-        week: int = get_weeks_in_generation(instance.record.start_time.date())
-    except Exception:
+    if instance.pk is None or instance.get_deferred_fields() & RANKING_USER_SOURCE_FIELDS:
         return
-    try:
-        ranking: Ranking = Ranking.objects.get(user=instance.record.user, generation=generation, week=week)
-    except Ranking.DoesNotExist:
+    instance._ranking_user_fields = get_ranking_user_fields(instance)
+
+
+@receiver(post_save, sender=User)
+def sync_ranking_user_fields_on_save(sender: User, instance: User, created: bool, update_fields=None, **kwargs) -> None:
+    """
+    User 모델의 인스턴스가 생성되거나 수정될 때 호출되는 함수입니다.
+    표시 정보가 변경되었다면 사용자의 모든 Ranking 인스턴스에 저장된 표시 정보를 갱신합니다.
+    """
+    ranking_user_fields: dict = get_ranking_user_fields(instance)
+    changed: bool = getattr(instance, "_ranking_user_fields", None) != ranking_user_fields
+    instance._ranking_user_fields = ranking_user_fields
+    if created or not changed or (update_fields is not None and not update_fields & RANKING_USER_SOURCE_FIELDS):
         return
-    ranking.score -= get_problems_score(instance.record.user.workout_level, instance.workout_level, instance.count)
-    if ranking.score <= 0:
-        ranking.delete()
-    else:
-        ranking.save()
+    sync_ranking_user_fields(instance)
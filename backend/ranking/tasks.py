@@ -0,0 +1,38 @@
+import logging
+from typing import Dict, Optional
+
+from config.celery import app
+from ranking.leaderboard import rebuild_leaderboard
+from ranking.services import recompute_generation_rankings
+
+logger = logging.getLogger("django")
+
+
+@app.task(name="recompute_rankings")
+def recompute_rankings(generation: str) -> Dict[str, float]:
+    """
+    기수의 랭킹 점수를 해결한 문제 기록으로부터 다시 계산하는 테스크입니다.
+    기수의 기간이나 부원의 운동 난이도가 변경되어 랭킹이 어긋난 경우 실행합니다.
+    """
+
+    result: Dict[str, float] = recompute_generation_rankings(generation)
+    logger.info(
+        f"랭킹 재계산 완료 - {generation}, 문제 {result['rows']}건, 기간 외 문제 {result['skipped']}건, "
+        f"랭킹 {result['rankings']}건, "
+        f"소요 시간: {result['elapsed']}초, 초당 {result['rows_per_second']}행"
+    )
+    return result
+
+
+@app.task(name="rebuild_leaderboard")
+def rebuild_leaderboard_task(generation: Optional[str] = None) -> Optional[int]:
+    """
+    유실되었거나 일부만 남은 Redis 리더보드를 Ranking 테이블로부터 다시 구성하는 테스크입니다.
+    """
+
+    count: Optional[int] = rebuild_leaderboard(generation)
+    if count is None:
+        logger.warning(f"리더보드 재구성 중단 - {generation or '전체'}, 다음 조회 시 다시 요청합니다.")
+    else:
+        logger.info(f"리더보드 재구성 완료 - {generation or '전체'}, 랭킹 {count}건")
+    return count
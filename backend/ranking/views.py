@@ -1,15 +1,15 @@
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from django.db import models
-from drf_spectacular.utils import OpenApiResponse, extend_schema
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 from rest_framework import permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from account.models import Generation
-from ranking.models import Ranking
+from account.services import generation_calendar, get_generation_by_date
+from config.exceptions import InvalidFieldException
 from ranking.schemas import (
     RANKING_401_FAILURE_EXAMPLE,
     RANKING_500_FAILURE_EXAMPLE,
@@ -18,7 +18,11 @@ from ranking.schemas import (
     ErrorResponseSerializer,
 )
 from ranking.serializers import RankingSerializer
-from ranking.services import get_weeks_in_generation
+from ranking.services import (
+    get_generation_leaderboard,
+    get_weekly_leaderboard,
+    get_weeks_in_generation,
+)
 
 
 @extend_schema(
@@ -43,38 +47,21 @@ from ranking.services import get_weeks_in_generation
 @permission_classes([permissions.IsAuthenticated])
 def get_weekly_rankings(request: Request) -> Response:
     today = datetime.now().date()
-    cur_generation: Optional[Generation] = Generation.objects.filter(start_date__lte=today, end_date__gte=today).first()
+    cur_generation: Optional[Generation] = get_generation_by_date(today)
 
     if cur_generation:
-        weeks = (
-            Ranking.objects.filter(generation=cur_generation).values_list("week", flat=True).distinct().order_by("week")
-        )
-        data: List[Dict] = []
-        for week in weeks:
-            weekly_ranking = {
-                "week": week,
-                "ranking": RankingSerializer(
-                    Ranking.objects.filter(generation=cur_generation, week=week)
-                    .values(
-                        "week",
-                        "user__id",
-                        "user__username",
-                        "user__generation",
-                        "user__workout_location",
-                        "user__workout_level",
-                        "user__profile_number",
-                        "score",
-                    )
-                    .order_by("-score"),
-                    many=True,
-                ).data,
+        data: List[Dict] = [
+            {
+                "week": weekly_ranking["week"],
+                "ranking": RankingSerializer(weekly_ranking["ranking"], many=True).data,
             }
-            data.append(weekly_ranking)
+            for weekly_ranking in get_weekly_leaderboard(cur_generation)
+        ]
         return Response(
             data={
                 "detail": "주차별 랭킹 목록 조회를 성공했습니다.",
                 "data": {
-                    "current_generation_week": get_weeks_in_generation(datetime.now().date()),
+                    "current_generation_week": get_weeks_in_generation(today, cur_generation),
                     "weekly_rankings": data,
                 },
             },
@@ -96,6 +83,10 @@ def get_weekly_rankings(request: Request) -> Response:
 @extend_schema(
     tags=["랭킹"],
     summary="기수별 랭킹 조회",
+    parameters=[
+        OpenApiParameter(name="generation", description="조회할 기수 (예: 11기)", required=False, type=str),
+        OpenApiParameter(name="limit", description="기수별로 조회할 상위 랭킹 수", required=False, type=int),
+    ],
     responses={
         status.HTTP_200_OK: OpenApiResponse(
             response=RankingSerializer,
@@ -114,31 +105,20 @@ def get_weekly_rankings(request: Request) -> Response:
 @api_view(["GET"])
 @permission_classes([permissions.IsAuthenticated])
 def get_generation_rankings(request: Request) -> Response:
-    generation_rankings = (
-        Ranking.objects.select_related("user")
-        .values(
-            "generation",
-            "user__id",
-            "user__username",
-            "user__generation",
-            "user__workout_location",
-            "user__workout_level",
-            "user__profile_number",
-        )
-        .annotate(score=models.Sum("score"))
-        .order_by("-score")
-    )
+    generation: Optional[str] = request.query_params.get("generation") or None
+    limit: Optional[str] = request.query_params.get("limit")
+    if limit is not None and (not limit.isdigit() or int(limit) < 1):
+        raise InvalidFieldException("조회할 랭킹 수는 1 이상의 정수여야 합니다.")
+    if generation is not None and not generation_calendar.has_generation(generation):
+        raise InvalidFieldException("존재하지 않는 기수입니다.")
 
-    generations = list(set([generation_ranking["generation"] for generation_ranking in generation_rankings]))
     data = {
         "generation_rankings": [
             {
-                "generation": generation,
-                "ranking": RankingSerializer(
-                    generation_rankings.filter(generation=generation).order_by("-score"), many=True
-                ).data,
+                "generation": generation_ranking["generation"],
+                "ranking": RankingSerializer(generation_ranking["ranking"], many=True).data,
             }
-            for generation in generations
+            for generation_ranking in get_generation_leaderboard(generation, int(limit) if limit else None)
         ],
     }
     return Response(
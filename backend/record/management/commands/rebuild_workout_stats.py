@@ -0,0 +1,14 @@
+from django.core.management import BaseCommand
+
+from record.services import rebuild_workout_stats
+
+
+class Command(BaseCommand):
+    help = "기록과 해결한 문제를 바탕으로 기수별 운동 통계를 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--generation", type=str, default=None, help="다시 생성할 기수 (예: 11기)")
+
+    def handle(self, *args, **options):
+        count = rebuild_workout_stats(options["generation"])
+        self.stdout.write(self.style.SUCCESS(f"운동 통계 재생성 완료 - 통계 {count}건"))
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.9 on 2026-10-18 15:34
+
+from django.db import migrations, models
+import django.db.models.functions.datetime
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("record", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                models.F("user"),
+                django.db.models.functions.datetime.TruncDate("end_time"),
+                name="record_user_end_date_idx",
+            ),
+        ),
+    ]
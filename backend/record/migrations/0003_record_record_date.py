@@ -0,0 +1,63 @@
+# Generated by Django 4.2.9 on 2026-10-18 15:36
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_record_date(apps, schema_editor):
+    Record = apps.get_model("record", "Record")
+    BoulderProblem = apps.get_model("record", "BoulderProblem")
+    records = Record.objects.annotate(end_date=TruncDate("end_time"))
+
+    # 같은 날짜에 중복으로 저장된 기록은 가장 먼저 생성된 기록으로 합칩니다.
+    # 운동 시간은 가장 이른 시작 시간부터 가장 늦은 종료 시간까지로, 해결한 문제는 난이도별로 합산합니다.
+    duplicates = (
+        records.values("user", "end_date")
+        .annotate(row_count=Count("id"), kept_id=Min("id"))
+        .filter(row_count__gt=1)
+        .order_by()
+    )
+    for duplicate in duplicates:
+        same_day_records = records.filter(user=duplicate["user"], end_date=duplicate["end_date"])
+        merged_ids = list(same_day_records.exclude(id=duplicate["kept_id"]).values_list("id", flat=True))
+        span = same_day_records.aggregate(start_time=Min("start_time"), end_time=Max("end_time"))
+        Record.objects.filter(id=duplicate["kept_id"]).update(start_time=span["start_time"], end_time=span["end_time"])
+
+        problems = BoulderProblem.objects.filter(record__in=[duplicate["kept_id"], *merged_ids])
+        level_counts = problems.values("workout_level").annotate(total_count=Sum("count")).order_by()
+        merged_problems = [
+            BoulderProblem(
+                record_id=duplicate["kept_id"], workout_level=level["workout_level"], count=level["total_count"]
+            )
+            for level in level_counts
+        ]
+        problems.delete()
+        BoulderProblem.objects.bulk_create(merged_problems)
+        Record.objects.filter(id__in=merged_ids).delete()
+
+    Record.objects.update(record_date=TruncDate("end_time"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("record", "0002_record_user_end_date_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="record",
+            name="record_user_end_date_idx",
+        ),
+        migrations.AddField(
+            model_name="record",
+            name="record_date",
+            field=models.DateField(blank=True, null=True, verbose_name="운동 날짜"),
+        ),
+        migrations.RunPython(backfill_record_date, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="record",
+            constraint=models.UniqueConstraint(fields=("user", "record_date"), name="unique_record_user_record_date"),
+        ),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 4.2.9 on 2026-10-18 15:41
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Sum
+
+import record.models
+from common.choices import WORKOUT_LEVELS
+
+
+def backfill_workout_stats(apps, schema_editor):
+    Record = apps.get_model("record", "Record")
+    BoulderProblem = apps.get_model("record", "BoulderProblem")
+    WorkoutStats = apps.get_model("record", "WorkoutStats")
+    level_indexes = {level: index for index, (level, _) in enumerate(WORKOUT_LEVELS)}
+
+    workout_stats = {}
+    for user_id, generation_id, start_time, end_time in (
+        Record.objects.filter(generation__isnull=False)
+        .values_list("user_id", "generation_id", "start_time", "end_time")
+        .iterator()
+    ):
+        stats = workout_stats.setdefault(
+            (user_id, generation_id),
+            WorkoutStats(user_id=user_id, generation_id=generation_id),
+        )
+        stats.total_seconds += int((end_time - start_time).total_seconds())
+        stats.session_count += 1
+
+    level_totals = (
+        BoulderProblem.objects.filter(record__generation__isnull=False)
+        .values_list("record__user_id", "record__generation_id", "workout_level")
+        .annotate(total_count=Sum("count"))
+        .order_by()
+    )
+    for user_id, generation_id, level, total_count in level_totals.iterator():
+        workout_stats[(user_id, generation_id)].level_counts[level_indexes[level]] = total_count
+
+    WorkoutStats.objects.bulk_create(workout_stats.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0002_generation_date_range_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("record", "0003_record_record_date"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkoutStats",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("total_seconds", models.IntegerField(default=0, verbose_name="총 운동 시간(초)")),
+                ("session_count", models.IntegerField(default=0, verbose_name="운동 횟수")),
+                (
+                    "level_counts",
+                    models.JSONField(
+                        default=record.models.get_empty_level_counts, verbose_name="난이도별 해결한 문제 개수"
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정 일시")),
+                (
+                    "generation",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="workout_stats",
+                        to="account.generation",
+                        verbose_name="운영 기수",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="workout_stats",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "운동 통계",
+                "verbose_name_plural": "운동 통계",
+                "db_table": "workout_stats",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="workoutstats",
+            constraint=models.UniqueConstraint(
+                fields=("user", "generation"), name="unique_workout_stats_user_generation"
+            ),
+        ),
+        migrations.RunPython(backfill_workout_stats, migrations.RunPython.noop),
+    ]
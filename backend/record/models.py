@@ -1,6 +1,9 @@
 # mypy: ignore-errors
 
+from datetime import date, datetime
+
 from django.db import models
+from django.utils import timezone
 
 from account.models import User
 from attendance.models import Generation
@@ -15,6 +18,7 @@ class Record(models.Model):
     workout_location = models.CharField(max_length=100, choices=WORKOUT_LOCATION_CHOICES, verbose_name="지점")
     start_time = models.DateTimeField(verbose_name="운동 시작 시간")
     end_time = models.DateTimeField(verbose_name="운동 종료 시간")
+    record_date = models.DateField(null=True, blank=True, verbose_name="운동 날짜")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성 일시")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 일시")
 
@@ -22,6 +26,25 @@ class Record(models.Model):
         db_table = "record"
         verbose_name = "기록"
         verbose_name_plural = "기록"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "record_date"], name="unique_record_user_record_date"),
+        ]
+
+    @staticmethod
+    def get_record_date(end_time: datetime) -> date:
+        """
+        운동 종료 시간을 현재 시간대의 날짜로 변환하는 메서드입니다.
+        """
+        if timezone.is_aware(end_time):
+            end_time = timezone.localtime(end_time)
+        return end_time.date()
+
+    def save(self, *args, **kwargs):
+        self.record_date = self.get_record_date(self.end_time)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "end_time" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "record_date"}
+        super().save(*args, **kwargs)
 
 
 class BoulderProblem(models.Model):
@@ -33,3 +56,26 @@ class BoulderProblem(models.Model):
         db_table = "boulder_problem"
         verbose_name = "해결한 문제"
         verbose_name_plural = "해결한 문제"
+
+
+def get_empty_level_counts() -> list:
+    return [0] * len(WORKOUT_LEVELS)
+
+
+class WorkoutStats(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="workout_stats", verbose_name="사용자")
+    generation = models.ForeignKey(
+        Generation, on_delete=models.CASCADE, related_name="workout_stats", verbose_name="운영 기수"
+    )
+    total_seconds = models.IntegerField(default=0, verbose_name="총 운동 시간(초)")
+    session_count = models.IntegerField(default=0, verbose_name="운동 횟수")
+    level_counts = models.JSONField(default=get_empty_level_counts, verbose_name="난이도별 해결한 문제 개수")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 일시")
+
+    class Meta:
+        db_table = "workout_stats"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "generation"], name="unique_workout_stats_user_generation"),
+        ]
+        verbose_name = "운동 통계"
+        verbose_name_plural = "운동 통계"
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class RecordCursorPagination(CursorPagination):
+    """
+    운동 기록을 운동 시작 시간의 역순으로 커서 기반 페이지네이션하기 위한 클래스입니다.
+    """
+
+    ordering = "-start_time"
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
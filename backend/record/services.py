@@ -0,0 +1,179 @@
+import hashlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, Max, QuerySet, Sum
+from django.utils import timezone
+
+from common.choices import WORKOUT_LEVELS
+from record.models import BoulderProblem, Record, WorkoutStats
+
+
+def get_level_counts(probs_data: List[Dict[str, Any]]) -> Dict[int, int]:
+    """
+    난이도별로 해결한 문제 개수를 합산하는 메서드입니다.
+    """
+    level_counts: Dict[int, int] = defaultdict(int)
+    for prob_data in probs_data:
+        level_counts[prob_data["workout_level"]] += prob_data["count"]
+    return level_counts
+
+
+def create_boulder_problems(record: Record, probs_data: List[Dict[str, Any]]) -> List[BoulderProblem]:
+    """
+    기록에 해결한 문제들을 한 번의 INSERT로 생성하는 메서드입니다.
+    """
+    return BoulderProblem.objects.bulk_create(
+        [
+            BoulderProblem(record=record, workout_level=level, count=count)
+            for level, count in get_level_counts(probs_data).items()
+        ]
+    )
+
+
+def sync_boulder_problems(
+    record: Record, existing_problems: List[BoulderProblem], probs_data: List[Dict[str, Any]]
+) -> None:
+    """
+    기록의 해결한 문제들을 요청 데이터와 비교하여 변경된 난이도만 반영하는 메서드입니다.
+    사라진 난이도는 삭제하고, 개수가 바뀐 난이도는 수정하며, 새로운 난이도는 생성합니다.
+    """
+    level_counts: Dict[int, int] = get_level_counts(probs_data)
+
+    problems_by_level: Dict[int, BoulderProblem] = {}
+    stale_problem_ids: List[int] = []
+    for problem in existing_problems:
+        if problem.workout_level in problems_by_level or problem.workout_level not in level_counts:
+            stale_problem_ids.append(problem.id)
+        else:
+            problems_by_level[problem.workout_level] = problem
+
+    changed_problems: List[BoulderProblem] = []
+    for level, problem in problems_by_level.items():
+        if problem.count != level_counts[level]:
+            problem.count = level_counts[level]
+            changed_problems.append(problem)
+
+    new_problems: List[BoulderProblem] = [
+        BoulderProblem(record=record, workout_level=level, count=count)
+        for level, count in level_counts.items()
+        if level not in problems_by_level
+    ]
+
+    if stale_problem_ids:
+        BoulderProblem.objects.filter(id__in=stale_problem_ids).delete()
+    if changed_problems:
+        BoulderProblem.objects.bulk_update(changed_problems, ["count"])
+    if new_problems:
+        BoulderProblem.objects.bulk_create(new_problems)
+
+
+def get_record_dates_validators(queryset: QuerySet, scope: str) -> Tuple[str, Optional[int]]:
+    """
+    기록 날짜 목록의 ETag와 Last-Modified 시각을 한 번의 쿼리로 계산하는 메서드입니다.
+    기록의 개수와 가장 최근 수정 시각이 바뀌지 않았다면 같은 ETag를 반환하므로, 날짜 목록을 다시 조회하지 않아도 됩니다.
+    If-Modified-Since 헤더는 초 단위이므로 Last-Modified 시각도 초 단위로 내림하여 반환합니다.
+    """
+    summary: Dict[str, Any] = queryset.aggregate(count=Count("id"), last_modified=Max("updated_at"))
+    last_modified: Optional[datetime] = summary["last_modified"]
+
+    digest: str = hashlib.md5(
+        f"{scope}:{summary['count']}:{last_modified.isoformat() if last_modified else ''}".encode()
+    ).hexdigest()
+    if last_modified is None:
+        return f'"{digest}"', None
+
+    if timezone.is_naive(last_modified):
+        last_modified = timezone.make_aware(last_modified)
+    return f'"{digest}"', int(last_modified.timestamp())
+
+
+# 기록이 기수별 운동 통계에 기여하는 값으로, (운동 시간(초), 난이도별 해결한 문제 개수)입니다.
+WorkoutContribution = Tuple[int, Dict[int, int]]
+
+WORKOUT_LEVEL_INDEXES: Dict[int, int] = {level: index for index, (level, _) in enumerate(WORKOUT_LEVELS)}
+
+
+def get_record_workout_contribution(
+    record: Record, problems: Iterable[Tuple[int, int]]
+) -> Dict[str, WorkoutContribution]:
+    """
+    기록이 기수별 운동 통계에 기여하는 값을 반환하는 메서드입니다. 기수가 없는 기록은 집계하지 않습니다.
+    """
+    if record.generation_id is None:
+        return {}
+
+    level_counts: Dict[int, int] = defaultdict(int)
+    for level, count in problems:
+        level_counts[level] += count
+    seconds: int = int((record.end_time - record.start_time).total_seconds())
+    return {record.generation_id: (seconds, dict(level_counts))}
+
+
+def apply_workout_stats_deltas(
+    user_id: int, old_contributions: Dict[str, WorkoutContribution], new_contributions: Dict[str, WorkoutContribution]
+) -> None:
+    """
+    기록의 이전 기여와 새로운 기여의 차이를 기수별 운동 통계에 반영하는 메서드입니다.
+    통계 행을 잠근 뒤 갱신하므로 같은 사용자의 기록이 동시에 수정되어도 값이 유실되지 않습니다.
+    """
+    for generation in old_contributions.keys() | new_contributions.keys():
+        old_seconds, old_levels = old_contributions.get(generation, (0, {}))
+        new_seconds, new_levels = new_contributions.get(generation, (0, {}))
+        session_delta: int = (generation in new_contributions) - (generation in old_contributions)
+        level_deltas: Dict[int, int] = {
+            level: new_levels.get(level, 0) - old_levels.get(level, 0)
+            for level in old_levels.keys() | new_levels.keys()
+        }
+        if not session_delta and old_seconds == new_seconds and not any(level_deltas.values()):
+            continue
+
+        with transaction.atomic():
+            workout_stats, _ = WorkoutStats.objects.select_for_update().get_or_create(
+                user_id=user_id, generation_id=generation
+            )
+            workout_stats.total_seconds += new_seconds - old_seconds
+            workout_stats.session_count += session_delta
+            for level, delta in level_deltas.items():
+                workout_stats.level_counts[WORKOUT_LEVEL_INDEXES[level]] += delta
+            workout_stats.save(update_fields=["total_seconds", "session_count", "level_counts", "updated_at"])
+
+
+def rebuild_workout_stats(generation: Optional[str] = None) -> int:
+    """
+    기록과 해결한 문제를 집계하여 기수별 운동 통계를 다시 생성하는 메서드입니다.
+    generation이 주어지면 해당 기수만 다시 생성하며, 생성한 통계의 개수를 반환합니다.
+    """
+    records: QuerySet = Record.objects.filter(generation__isnull=False)
+    problems: QuerySet = BoulderProblem.objects.filter(record__generation__isnull=False)
+    if generation is not None:
+        records = records.filter(generation=generation)
+        problems = problems.filter(record__generation=generation)
+
+    workout_stats: Dict[Tuple[int, str], WorkoutStats] = {}
+    for user_id, generation_id, start_time, end_time in records.values_list(
+        "user_id", "generation_id", "start_time", "end_time"
+    ).iterator():
+        stats = workout_stats.setdefault(
+            (user_id, generation_id), WorkoutStats(user_id=user_id, generation_id=generation_id)
+        )
+        stats.total_seconds += int((end_time - start_time).total_seconds())
+        stats.session_count += 1
+
+    level_totals = (
+        problems.values_list("record__user_id", "record__generation_id", "workout_level")
+        .annotate(total_count=Sum("count"))
+        .order_by()
+    )
+    for user_id, generation_id, level, total_count in level_totals.iterator():
+        workout_stats[(user_id, generation_id)].level_counts[WORKOUT_LEVEL_INDEXES[level]] = total_count
+
+    with transaction.atomic():
+        stale_stats: QuerySet = WorkoutStats.objects.all()
+        if generation is not None:
+            stale_stats = stale_stats.filter(generation=generation)
+        stale_stats.delete()
+        WorkoutStats.objects.bulk_create(workout_stats.values(), batch_size=500)
+    return len(workout_stats)
@@ -1,5 +1,13 @@
-from django.db.models.functions import TruncDate
-from django.http import Http404
+import calendar
+from datetime import date
+from typing import Optional, Tuple, Union
+
+from django.db import transaction
+from django.http import Http404, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_date
+from django.utils.http import http_date
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     OpenApiParameter,
     OpenApiResponse,
@@ -11,8 +19,15 @@ from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from config.exceptions import NotExistException, PermissionFailedException
+from config.exceptions import (
+    InvalidFieldException,
+    NotExistException,
+    PermissionFailedException,
+)
+from mypage.services import invalidate_mypage_summary
+from ranking.services import apply_ranking_deltas, get_record_ranking_scores
 from record.models import Record
+from record.pagination import RecordCursorPagination
 from record.schemas import (
     RECORD_401_FAILURE_EXAMPLE,
     RECORD_403_FAILURE_EXAMPLE,
@@ -27,6 +42,39 @@ from record.schemas import (
     ErrorResponseSerializer,
 )
 from record.serializers import RecordCreateSerializer, RecordSerializer
+from record.services import (
+    apply_workout_stats_deltas,
+    get_record_dates_validators,
+    get_record_workout_contribution,
+)
+
+
+def parse_date_param(value: Optional[str]) -> Optional[date]:
+    """
+    쿼리 파라미터로 전달된 날짜 문자열을 날짜로 변환하는 메서드입니다.
+    """
+    if value is None:
+        return None
+
+    try:
+        parsed_date: Optional[date] = parse_date(value)
+    except ValueError:
+        parsed_date = None
+    if parsed_date is None:
+        raise InvalidFieldException("날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+    return parsed_date
+
+
+def parse_month_param(value: str) -> Tuple[date, date]:
+    """
+    쿼리 파라미터로 전달된 월 문자열을 해당 월의 첫째 날과 마지막 날로 변환하는 메서드입니다.
+    """
+    try:
+        year, month = (int(part) for part in value.split("-"))
+        last_day: int = calendar.monthrange(year, month)[1]
+        return date(year, month, 1), date(year, month, last_day)
+    except ValueError:
+        raise InvalidFieldException("월 형식이 올바르지 않습니다. (YYYY-MM)")
 
 
 @extend_schema_view(
@@ -38,6 +86,7 @@ class RecordViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     queryset = Record.objects.all()
     serializer_class = RecordSerializer
+    pagination_class = RecordCursorPagination
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -133,6 +182,19 @@ class RecordViewSet(viewsets.ModelViewSet):
     @extend_schema(
         tags=["운동 기록"],
         summary="운동 기록 전체 조회",
+        description="운동 기록을 최근 기록부터 커서 기반 페이지 단위로 조회합니다.",
+        parameters=[
+            OpenApiParameter(name="cursor", description="다음 또는 이전 페이지의 커서", required=False, type=str),
+            OpenApiParameter(
+                name="page_size", description="페이지당 기록 수 (기본값 20, 최대 100)", required=False, type=int
+            ),
+            OpenApiParameter(
+                name="start_date", description="조회 시작 날짜 (YYYY-MM-DD)", required=False, type=OpenApiTypes.DATE
+            ),
+            OpenApiParameter(
+                name="end_date", description="조회 종료 날짜 (YYYY-MM-DD)", required=False, type=OpenApiTypes.DATE
+            ),
+        ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
                 response=RecordSerializer,
@@ -153,13 +215,24 @@ class RecordViewSet(viewsets.ModelViewSet):
         },
     )
     def list(self, request, *args, **kwargs):
-        data = Record.objects.filter(user=request.user)
-        data = self.get_serializer(data, many=True).data
+        queryset = Record.objects.filter(user=request.user).prefetch_related("boulder_problems")
+
+        start_date: Optional[date] = parse_date_param(request.query_params.get("start_date"))
+        end_date: Optional[date] = parse_date_param(request.query_params.get("end_date"))
+        if start_date is not None:
+            queryset = queryset.filter(record_date__gte=start_date)
+        if end_date is not None:
+            queryset = queryset.filter(record_date__lte=end_date)
+
+        page = self.paginate_queryset(queryset)
+        data = self.get_serializer(page, many=True).data
         return Response(
             data={
                 "detail": "모든 운동 기록을 가져왔습니다.",
                 "data": {
                     "records": data,
+                    "next": self.paginator.get_next_link(),
+                    "previous": self.paginator.get_previous_link(),
                 },
             },
             status=status.HTTP_200_OK,
@@ -209,9 +282,31 @@ class RecordViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK,
         )
 
+    @transaction.atomic
+    def perform_destroy(self, instance: Record) -> None:
+        problems = list(instance.boulder_problems.values_list("workout_level", "count"))
+        scores = get_record_ranking_scores(instance, problems, instance.user.workout_level)
+        apply_ranking_deltas(instance.user, scores, {})
+        apply_workout_stats_deltas(instance.user_id, get_record_workout_contribution(instance, problems), {})
+        invalidate_mypage_summary([instance.user_id])
+        instance.delete()
+
     @extend_schema(
         tags=["운동 기록"],
         summary="운동 기록 날짜 조회",
+        description=(
+            "운동 기록이 있는 날짜 목록을 조회합니다. month 또는 start_date, end_date로 조회 기간을 지정할 수 있습니다. "
+            "응답의 ETag를 If-None-Match로 전달하면, 기록이 변경되지 않은 경우 304 응답을 반환합니다."
+        ),
+        parameters=[
+            OpenApiParameter(name="month", description="조회할 월 (YYYY-MM)", required=False, type=str),
+            OpenApiParameter(
+                name="start_date", description="조회 시작 날짜 (YYYY-MM-DD)", required=False, type=OpenApiTypes.DATE
+            ),
+            OpenApiParameter(
+                name="end_date", description="조회 종료 날짜 (YYYY-MM-DD)", required=False, type=OpenApiTypes.DATE
+            ),
+        ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
                 response=ErrorResponseSerializer,
@@ -228,16 +323,28 @@ class RecordViewSet(viewsets.ModelViewSet):
         },
     )
     @action(detail=False, methods=["get"], url_path="dates")
-    def dates(self, request: Request) -> Response:
-        dates = (
-            Record.objects.filter(user=request.user)
-            .annotate(date=TruncDate("start_time"))
-            .values_list("date", flat=True)
-            .order_by("date")
-            .all()
-        )
+    def dates(self, request: Request) -> Union[Response, HttpResponseBase]:
+        queryset = Record.objects.filter(user=request.user, record_date__isnull=False)
 
-        return Response(
+        month: Optional[str] = request.query_params.get("month")
+        if month is not None:
+            start_date, end_date = parse_month_param(month)
+        else:
+            start_date = parse_date_param(request.query_params.get("start_date"))
+            end_date = parse_date_param(request.query_params.get("end_date"))
+        if start_date is not None:
+            queryset = queryset.filter(record_date__gte=start_date)
+        if end_date is not None:
+            queryset = queryset.filter(record_date__lte=end_date)
+
+        etag, last_modified = get_record_dates_validators(queryset, f"{request.user.id}:{start_date}:{end_date}")
+        not_modified_response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        dates = queryset.values_list("record_date", flat=True).order_by("record_date")
+
+        response = Response(
             data={
                 "detail": "운동 기록 날짜 목록 조회를 성공했습니다.",
                 "data": {
@@ -246,3 +353,7 @@ class RecordViewSet(viewsets.ModelViewSet):
             },
             status=status.HTTP_200_OK,
         )
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
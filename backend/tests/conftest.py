@@ -1,13 +1,131 @@
 import datetime
 
 import pytest
+from django.core.cache import cache
+from django.utils import timezone
 from model_bakery import baker
 from rest_framework.test import APIClient
 
-from account.models import User
+from account.models import Generation, User
+from account.services import generation_calendar
 from record.models import BoulderProblem, Record
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark", action="store_true", help="API 벤치마크만 실행하고 기준 파일과 비교합니다.")
+    group.addoption(
+        "--benchmark-update", action="store_true", help="API 벤치마크만 실행하고 결과로 기준 파일을 갱신합니다."
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=1.5,
+        help="기준 대비 p95 응답 시간이 이 비율을 넘어서면 경고합니다. 응답 시간은 실패로 판단하지 않습니다. (기본값 1.5)",
+    )
+    group.addoption("--benchmark-output", default=None, help="측정 결과를 저장할 JSON 파일 경로입니다.")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    벤치마크는 --benchmark 또는 --benchmark-update 옵션이 주어진 경우에만 실행하며, 이때 다른 테스트는 제외합니다.
+    """
+    run_benchmark = config.getoption("--benchmark") or config.getoption("--benchmark-update")
+    selected, deselected = [], []
+    for item in items:
+        is_benchmark = item.get_closest_marker("benchmark") is not None
+        (selected if is_benchmark == run_benchmark else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(autouse=True)
+def reset_generation_calendar():
+    yield
+    generation_calendar.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def generation_window():
+    """
+    current_generation의 기간을 (오늘 이전 주 수, 오늘 이후 주 수)로 정하는 픽스처입니다.
+    다른 기간이 필요한 테스트 패키지는 conftest에서 이 픽스처를 재정의합니다.
+    """
+    return (4, 12)
+
+
+@pytest.fixture
+def make_generation(generation_window):
+    """
+    기수를 생성하는 함수를 반환하는 픽스처입니다. 날짜를 생략하면 generation_window의 기간을 사용합니다.
+    """
+
+    def _make_generation(name, start_date=None, end_date=None):
+        today = timezone.now().date()
+        weeks_before, weeks_after = generation_window
+        return baker.make(
+            Generation,
+            name=name,
+            start_date=start_date or today - datetime.timedelta(weeks=weeks_before),
+            end_date=end_date or today + datetime.timedelta(weeks=weeks_after),
+        )
+
+    return _make_generation
+
+
+@pytest.fixture
+def current_generation(make_generation):
+    return make_generation("11기")
+
+
+@pytest.fixture
+def make_member():
+    """
+    활성화된 부원을 생성하는 함수를 반환하는 픽스처입니다. 기본값과 다른 정보는 키워드 인자로 지정합니다.
+    """
+
+    def _make_member(generation, index, **fields):
+        return baker.make(
+            User,
+            **{
+                "email": f"member{index}@example.com",
+                "username": f"부원{index}",
+                "generation": generation,
+                "role": "부원",
+                "workout_location": "더클라임 양재",
+                "workout_level": 3,
+                "profile_number": 1,
+                "is_active": True,
+                **fields,
+            },
+        )
+
+    return _make_member
+
+
+@pytest.fixture
+def make_record():
+    """
+    운동 기록과 해결한 문제를 생성하는 함수를 반환하는 픽스처입니다.
+    problems는 (난이도, 해결한 문제 개수)의 목록입니다.
+    """
+
+    def _make_record(user, start_time, problems=(), duration=datetime.timedelta(hours=2), **fields):
+        record = baker.make(Record, user=user, start_time=start_time, end_time=start_time + duration, **fields)
+        for level, count in problems:
+            baker.make(BoulderProblem, record=record, workout_level=level, count=count)
+        return record
+
+    return _make_record
+
+
 @pytest.fixture
 def default_user(mock_records):
     instance = baker.make(
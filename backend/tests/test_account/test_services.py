@@ -0,0 +1,74 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+
+from account.models import Generation
+from account.services import generation_calendar, get_generation_by_date
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def generations():
+    return [
+        baker.make(
+            Generation,
+            name="10기",
+            start_date=datetime.date(2024, 3, 1),
+            end_date=datetime.date(2024, 6, 30),
+        ),
+        baker.make(
+            Generation,
+            name="11기",
+            start_date=datetime.date(2024, 9, 1),
+            end_date=datetime.date(2024, 12, 31),
+        ),
+    ]
+
+
+class TestGenerationCalendar:
+
+    @pytest.mark.parametrize(
+        "target_date, expected",
+        [
+            (datetime.date(2024, 3, 1), "10기"),
+            (datetime.date(2024, 6, 30), "10기"),
+            (datetime.date(2024, 9, 15), "11기"),
+            (datetime.date(2024, 2, 29), None),
+            (datetime.date(2024, 7, 15), None),
+            (datetime.date(2025, 1, 1), None),
+        ],
+    )
+    def test_get_generation_by_date(self, generations, target_date, expected):
+        generation = get_generation_by_date(target_date)
+
+        assert (generation.name if generation else None) == expected
+
+    def test_get_week(self, generations):
+        assert generation_calendar.get_week(datetime.date(2024, 9, 1)) == 1
+        assert generation_calendar.get_week(datetime.date(2024, 9, 15)) == 3
+        assert generation_calendar.get_week(datetime.date(2024, 8, 1)) is None
+
+    def test_repeated_lookup_does_not_query(self, generations):
+        get_generation_by_date(datetime.date(2024, 9, 1))
+
+        with CaptureQueriesContext(connection) as queries:
+            for day in range(30):
+                get_generation_by_date(datetime.date(2024, 9, 1) + datetime.timedelta(days=day))
+
+        assert len(queries) == 0
+
+    def test_generation_change_invalidates_calendar(self, generations):
+        assert get_generation_by_date(datetime.date(2025, 3, 1)) is None
+
+        baker.make(
+            Generation,
+            name="12기",
+            start_date=datetime.date(2025, 3, 1),
+            end_date=datetime.date(2025, 6, 30),
+        )
+
+        assert get_generation_by_date(datetime.date(2025, 3, 1)).name == "12기"
@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+import pytest
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def old_generation(make_generation, current_generation):
+    return make_generation(
+        "9기",
+        start_date=current_generation.start_date - timedelta(weeks=40),
+        end_date=current_generation.start_date - timedelta(weeks=24),
+    )
+
+
+@pytest.fixture
+def manager_client(current_generation, make_member):
+    manager = make_member(
+        current_generation, 0, email="manager@example.com", username="운영진", role="운영진", workout_level=5
+    )
+    client = APIClient()
+    client.force_authenticate(user=manager)
+    return client
@@ -0,0 +1,55 @@
+import pytest
+from django.contrib.admin.sites import site
+from django.db.models import F
+from model_bakery import baker
+
+from attendance.models import AttendanceStats
+from attendance.services import refresh_attendance_rate
+
+pytestmark = pytest.mark.django_db
+
+
+class TestRefreshAttendanceRate:
+
+    def test_late_counts_are_split_for_recent_members(self, current_generation, make_member):
+        member = make_member(current_generation, 1)
+        attendance_stats = baker.make(
+            AttendanceStats, user=member, generation=current_generation, attendance=3, late=2, absence=1
+        )
+
+        attendance_stats.late = F("late") + 1
+        attendance_stats.save()
+        refresh_attendance_rate(attendance_stats, member.generation_id)
+
+        attendance_stats.refresh_from_db()
+        assert attendance_stats.attendance_rate == pytest.approx(4 / 6 * 100)
+
+    def test_senior_members_attending_once_have_full_rate(self, current_generation, old_generation, make_member):
+        member = make_member(old_generation, 1)
+        attendance_stats = baker.make(AttendanceStats, user=member, generation=current_generation, absence=4)
+
+        attendance_stats.attendance = F("attendance") + 1
+        attendance_stats.save()
+        refresh_attendance_rate(attendance_stats, member.generation_id)
+
+        attendance_stats.refresh_from_db()
+        assert attendance_stats.attendance_rate == 100
+
+    def test_member_without_generation_has_zero_rate(self, current_generation, make_member):
+        member = make_member(None, 1)
+        attendance_stats = baker.make(AttendanceStats, user=member, generation=current_generation, attendance=1)
+
+        refresh_attendance_rate(attendance_stats, member.generation_id)
+
+        attendance_stats.refresh_from_db()
+        assert attendance_stats.attendance_rate == 0
+
+    def test_admin_edit_refreshes_rate(self, current_generation, make_member):
+        member = make_member(current_generation, 1)
+        attendance_stats = baker.make(AttendanceStats, user=member, generation=current_generation, attendance=1)
+
+        attendance_stats.absence = 3
+        site._registry[AttendanceStats].save_model(None, attendance_stats, None, True)
+
+        attendance_stats.refresh_from_db()
+        assert attendance_stats.attendance_rate == pytest.approx(1 / 4 * 100)
@@ -0,0 +1,188 @@
+from datetime import time, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Value
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+
+from account.models import Generation
+from account.services import generation_calendar
+from attendance.models import (
+    Attendance,
+    AttendanceStats,
+    UnavailableDates,
+    WeeklyStaffInfo,
+)
+from attendance.services import get_day_of_week, get_weeks_since_start
+from attendance.tasks import (
+    NIGHTLY_CLOSING_LOCK_KEY,
+    NIGHTLY_CLOSING_STAGES,
+    absence_processing,
+    holiday_processing,
+    nightly_attendance_closing,
+    run_nightly_closing_stage,
+)
+from config.celery import app
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def closing_generation(make_generation):
+    """
+    오늘이 결석 처리 요일이 되도록 시작일을 맞춘 기수입니다.
+    """
+    return make_generation("11기", start_date=timezone.now().date() - timedelta(days=27))
+
+
+class TestAbsenceProcessing:
+
+    def test_absences_are_recorded_for_members_without_approved_attendance(self, closing_generation, make_member):
+        previous_generation = baker.make(Generation, name="10기")
+        attended_member = make_member(closing_generation, 1)
+        member_with_stats = make_member(closing_generation, 2)
+        member_without_stats = make_member(previous_generation, 3)
+        inactive_member = make_member(closing_generation, 4)
+        inactive_member.is_active = False
+        inactive_member.save()
+        baker.make(
+            Attendance,
+            user=attended_member,
+            generation=closing_generation,
+            week=4,
+            request_processed_status="승인",
+            attendance_status="출석",
+        )
+        baker.make(AttendanceStats, user=member_with_stats, generation=closing_generation, attendance=2, absence=1)
+
+        assert absence_processing() == 2
+
+        absences = Attendance.objects.filter(attendance_status="결석")
+        assert set(absences.values_list("user_id", flat=True)) == {member_with_stats.id, member_without_stats.id}
+        assert set(absences.values_list("week", flat=True)) == {4}
+
+        stats = {stats.user_id: stats for stats in AttendanceStats.objects.all()}
+        assert stats[member_with_stats.id].absence == 2
+        assert stats[member_with_stats.id].attendance_rate == pytest.approx(50.0)
+        assert stats[member_without_stats.id].absence == 1
+        assert stats[member_without_stats.id].attendance_rate == 0
+
+    @pytest.mark.parametrize("member_count", [2, 30])
+    def test_query_count_is_constant(self, closing_generation, make_member, member_count):
+        for index in range(member_count):
+            member = make_member(closing_generation, index)
+            if index % 2:
+                baker.make(AttendanceStats, user=member, generation=closing_generation, attendance=1)
+        generation_calendar.get_generation(closing_generation.start_date)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert absence_processing() == member_count
+
+        assert len(queries) == 9
+
+    def test_nothing_is_recorded_on_other_days(self, current_generation, make_member):
+        make_member(current_generation, 1)
+
+        assert absence_processing() == 0
+        assert not Attendance.objects.exists()
+
+
+class TestHolidayProcessing:
+
+    @pytest.fixture
+    def holiday(self, current_generation):
+        today = timezone.now().date()
+        baker.make(UnavailableDates, date=today)
+        baker.make(
+            WeeklyStaffInfo,
+            generation=current_generation,
+            day_of_week=get_day_of_week(today),
+            workout_location="더클라임 양재",
+            start_time=time(19, 0),
+        )
+
+    def test_holidays_are_recorded_once(self, holiday, current_generation, make_member):
+        attended_member = make_member(current_generation, 1)
+        members = [make_member(current_generation, index) for index in range(2, 5)]
+        baker.make(
+            Attendance,
+            user=attended_member,
+            generation=current_generation,
+            week=get_weeks_since_start(current_generation.start_date),
+            request_processed_status="승인",
+            attendance_status="출석",
+        )
+
+        assert holiday_processing() == 3
+        assert holiday_processing() == 0
+
+        holidays = Attendance.objects.filter(attendance_status="휴일")
+        assert sorted(holidays.values_list("user_id", flat=True)) == sorted(member.id for member in members)
+
+    def test_duplicate_holidays_are_ignored(self, holiday, current_generation, make_member):
+        member = make_member(current_generation, 1)
+        week = get_weeks_since_start(current_generation.start_date)
+
+        with patch("attendance.tasks.Exists", return_value=Value(False)):
+            holiday_processing()
+            holiday_processing()
+
+        assert Attendance.objects.filter(user=member, week=week, attendance_status="휴일").count() == 1
+
+
+class TestNightlyAttendanceClosing:
+
+    @pytest.fixture(autouse=True)
+    def eager_celery(self):
+        app.conf.task_always_eager = True
+        yield
+        app.conf.task_always_eager = False
+        cache.delete(NIGHTLY_CLOSING_LOCK_KEY)
+
+    def test_stages_run_in_order_and_release_lock(self):
+        calls = []
+        stages = {stage: (lambda stage=stage: calls.append(stage) or len(calls)) for stage in NIGHTLY_CLOSING_STAGES}
+
+        with patch.dict(NIGHTLY_CLOSING_STAGES, stages):
+            nightly_attendance_closing()
+
+        assert calls == ["reject_pending_attendances", "holiday_processing", "absence_processing"]
+        assert cache.get(NIGHTLY_CLOSING_LOCK_KEY) is None
+
+    def test_stage_result_is_appended(self):
+        previous = [{"stage": "reject_pending_attendances", "count": 2, "elapsed": 0.1}]
+
+        with patch.dict(NIGHTLY_CLOSING_STAGES, {"holiday_processing": MagicMock(return_value=5)}):
+            results = run_nightly_closing_stage(previous, stage="holiday_processing")
+
+        assert results[0] == previous[0]
+        assert results[1]["stage"] == "holiday_processing"
+        assert results[1]["count"] == 5
+        assert results[1]["elapsed"] >= 0
+
+    def test_running_closing_is_not_started_again(self):
+        cache.add(NIGHTLY_CLOSING_LOCK_KEY, "other-worker")
+        stage = MagicMock(return_value=0)
+
+        with patch.dict(NIGHTLY_CLOSING_STAGES, {"reject_pending_attendances": stage}):
+            assert nightly_attendance_closing() is None
+
+        stage.assert_not_called()
+        assert cache.get(NIGHTLY_CLOSING_LOCK_KEY) == "other-worker"
+
+    def test_failed_stage_releases_lock(self):
+        failing_stage = MagicMock(side_effect=RuntimeError)
+        absence_stage = MagicMock(return_value=0)
+
+        with patch.dict(
+            NIGHTLY_CLOSING_STAGES, {"holiday_processing": failing_stage, "absence_processing": absence_stage}
+        ):
+            with pytest.raises(RuntimeError):
+                nightly_attendance_closing()
+
+        absence_stage.assert_not_called()
+        assert cache.get(NIGHTLY_CLOSING_LOCK_KEY) is None
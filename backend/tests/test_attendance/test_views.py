@@ -0,0 +1,57 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import status
+
+from account.services import generation_calendar
+from attendance.models import AttendanceStats
+
+pytestmark = pytest.mark.django_db
+
+
+class TestAttendanceUserList:
+
+    @pytest.mark.parametrize("member_count", [1, 30])
+    def test_query_count_is_constant(self, manager_client, current_generation, make_member, member_count):
+        for index in range(member_count):
+            member = make_member(current_generation, index)
+            baker.make(AttendanceStats, user=member, generation=current_generation, attendance=index)
+        generation_calendar.get_generation(current_generation.start_date)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = manager_client.get("/api/attendances/users/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["data"]) == member_count
+        assert len(queries) == 1
+
+    def test_attendance_rates_are_read_from_stats(
+        self, manager_client, current_generation, old_generation, make_member
+    ):
+        member = make_member(current_generation, 1)
+        member_without_stats = make_member(current_generation, 2)
+        baker.make(AttendanceStats, user=member, generation=current_generation, attendance_rate=75.0)
+        baker.make(AttendanceStats, user=member_without_stats, generation=old_generation, attendance_rate=50.0)
+
+        response = manager_client.get("/api/attendances/users/")
+
+        rates = {row["user_id"]: row["attendance_rate"] for row in response.data["data"]}
+        assert rates == {member.id: 75.0, member_without_stats.id: 0}
+
+    def test_members_are_ordered_and_filtered_by_rate(self, manager_client, current_generation, make_member):
+        for index, rate in enumerate([40.0, 90.0, 70.0], start=1):
+            member = make_member(current_generation, index)
+            baker.make(AttendanceStats, user=member, generation=current_generation, attendance_rate=rate)
+
+        response = manager_client.get(
+            "/api/attendances/users/", data={"ordering": "-attendance_rate", "min_attendance_rate": 50}
+        )
+
+        assert [row["attendance_rate"] for row in response.data["data"]] == [90.0, 70.0]
+
+    @pytest.mark.parametrize("params", [{"ordering": "username"}, {"min_attendance_rate": "many"}])
+    def test_invalid_rate_parameters(self, manager_client, params):
+        response = manager_client.get("/api/attendances/users/", data=params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,250 @@
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List
+
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+from model_bakery import baker
+
+from account.models import Generation, User
+from attendance.models import Attendance, AttendanceStats, WeeklyStaffInfo
+from attendance.services import bulk_refresh_attendance_rates
+from common.choices import WORKOUT_LEVELS, WORKOUT_LOCATION_CHOICES
+from ranking.services import recompute_generation_rankings
+from record.models import BoulderProblem, Record
+from record.services import rebuild_workout_stats
+
+CLUB_SEED = 901
+CLUB_PASSWORD = "Password1!"
+
+GENERATION_NUMBERS = (7, 8, 9, 10, 11)
+GENERATION_WEEKS = 24
+MEMBER_COUNT = 200
+MANAGER_COUNT = 10
+SESSIONS_PER_WEEK = (0, 1, 1, 2, 2, 3)
+PENDING_REQUEST_COUNT = 30
+
+# 요일과 관계없이 출석 요청을 측정할 수 있도록 주말에도 운영진 정보를 둡니다.
+DAYS_OF_WEEK = ("월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일")
+
+
+@dataclass
+class Club:
+    """
+    벤치마크용으로 생성한 동아리 데이터를 담는 클래스입니다.
+    member는 현재 기수에 속하며 이번 주 출석 요청이 없는 부원입니다.
+    """
+
+    generations: List[Generation]
+    member: User
+    manager: User
+    pending_attendance_ids: List[int]
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def current_generation(self) -> Generation:
+        return self.generations[-1]
+
+
+def make_generations(today: date) -> List[Generation]:
+    """
+    현재 기수가 오늘을 포함하도록, 약 2년에 걸친 기수를 생성하는 메서드입니다.
+    """
+    current_start: date = today - timedelta(weeks=GENERATION_WEEKS // 2)
+    generations: List[Generation] = []
+    for offset, number in enumerate(reversed(GENERATION_NUMBERS)):
+        start_date: date = current_start - timedelta(weeks=offset * (GENERATION_WEEKS + 1))
+        generations.append(
+            baker.make(
+                Generation,
+                name=f"{number}기",
+                start_date=start_date,
+                end_date=start_date + timedelta(weeks=GENERATION_WEEKS, days=-1),
+            )
+        )
+    return list(reversed(generations))
+
+
+def make_users(generations: List[Generation], rng: random.Random) -> List[User]:
+    """
+    기수마다 같은 수의 부원과 현재 기수의 운영진을 생성하는 메서드입니다.
+    비밀번호 해시는 한 번만 계산하여 모든 사용자가 공유합니다.
+    """
+    password: str = make_password(CLUB_PASSWORD)
+    locations: List[str] = [location for location, _ in WORKOUT_LOCATION_CHOICES]
+    users: List[User] = []
+    for index in range(MEMBER_COUNT + MANAGER_COUNT):
+        is_manager: bool = index >= MEMBER_COUNT
+        generation: Generation = generations[-1] if is_manager else generations[index % len(generations)]
+        users.append(
+            baker.prepare(
+                User,
+                email=f"{'manager' if is_manager else 'member'}{index}@example.com",
+                username=f"{'운영진' if is_manager else '부원'}{index}",
+                password=password,
+                generation=generation,
+                role="운영진" if is_manager else "부원",
+                workout_location=rng.choice(locations),
+                workout_level=rng.randint(1, len(WORKOUT_LEVELS)),
+                profile_number=rng.randint(1, 8),
+                introduction="안녕하세요",
+                is_active=True,
+            )
+        )
+    return User.objects.bulk_create(users)
+
+
+def make_records(generations: List[Generation], members: List[User], today: date, rng: random.Random) -> int:
+    """
+    부원이 가입한 기수부터 어제까지, 주마다 무작위 횟수만큼 운동한 기록과 해결한 문제를 생성하는 메서드입니다.
+    """
+    generation_by_name: Dict[str, Generation] = {generation.name: generation for generation in generations}
+    locations: List[str] = [location for location, _ in WORKOUT_LOCATION_CHOICES]
+    records: List[Record] = []
+    for member in members:
+        week_start: date = generation_by_name[member.generation_id].start_date
+        while week_start < today - timedelta(days=7):
+            for day in sorted(rng.sample(range(7), rng.choice(SESSIONS_PER_WEEK))):
+                workout_date: date = week_start + timedelta(days=day)
+                start_time: datetime = datetime.combine(workout_date, time(rng.randint(10, 20), 0))
+                end_time: datetime = start_time + timedelta(minutes=rng.choice((60, 90, 120, 150)))
+                generation = next(
+                    (g for g in generations if g.start_date <= workout_date <= g.end_date),
+                    None,
+                )
+                records.append(
+                    Record(
+                        user=member,
+                        generation=generation,
+                        workout_location=rng.choice(locations),
+                        start_time=start_time,
+                        end_time=end_time,
+                        record_date=Record.get_record_date(end_time),
+                    )
+                )
+            week_start += timedelta(weeks=1)
+    records = Record.objects.bulk_create(records, batch_size=2000)
+
+    user_levels: Dict[int, int] = {member.id: member.workout_level for member in members}
+    problems: List[BoulderProblem] = []
+    for record in records:
+        user_level: int = user_levels[record.user_id]
+        levels = rng.sample(range(max(1, user_level - 2), min(len(WORKOUT_LEVELS), user_level + 2) + 1), 2)
+        problems.extend(
+            BoulderProblem(record=record, workout_level=level, count=rng.randint(1, 8)) for level in sorted(levels)
+        )
+    BoulderProblem.objects.bulk_create(problems, batch_size=2000)
+    return len(records)
+
+
+def make_attendances(
+    generations: List[Generation], members: List[User], managers: List[User], today: date, rng: random.Random
+) -> List[int]:
+    """
+    기수의 부원마다 지난 주차의 출결과 출석 통계를 생성하고, 이번 주차의 대기 중인 출석 요청을 생성하는 메서드입니다.
+    생성한 대기 중인 출석 요청의 ID 목록을 반환합니다.
+    """
+    attendances: List[Attendance] = []
+    pending: List[Attendance] = []
+    for generation in generations:
+        generation_members: List[User] = [member for member in members if member.generation_id == generation.name]
+        last_week: int = min(GENERATION_WEEKS, (min(today, generation.end_date) - generation.start_date).days // 7)
+        for member in generation_members:
+            for week in range(1, last_week + 1):
+                request_time: datetime = datetime.combine(
+                    generation.start_date + timedelta(weeks=week - 1, days=rng.randint(0, 4)), time(19, 0)
+                )
+                status: str = rng.choices(("출석", "지각", "결석"), weights=(7, 2, 1))[0]
+                attendances.append(
+                    Attendance(
+                        user=member,
+                        generation=generation,
+                        workout_location=member.workout_location,
+                        week=week,
+                        request_time=request_time,
+                        request_processed_status="승인",
+                        request_processed_time=request_time + timedelta(minutes=5),
+                        request_processed_user=managers[0],
+                        attendance_status=status,
+                    )
+                )
+
+    current_generation: Generation = generations[-1]
+    current_week: int = (today - current_generation.start_date).days // 7 + 1
+    current_members: List[User] = [member for member in members if member.generation_id == current_generation.name]
+    for member in current_members[:PENDING_REQUEST_COUNT]:
+        pending.append(
+            Attendance(
+                user=member,
+                generation=current_generation,
+                workout_location=member.workout_location,
+                week=current_week,
+                request_time=timezone.now() - timedelta(minutes=10),
+                request_processed_status="대기",
+            )
+        )
+    Attendance.objects.bulk_create(attendances, batch_size=2000)
+    pending = Attendance.objects.bulk_create(pending)
+
+    stats: Dict[tuple, Counter] = {}
+    for attendance in attendances:
+        stats.setdefault((attendance.user_id, attendance.generation_id), Counter())[attendance.attendance_status] += 1
+    AttendanceStats.objects.bulk_create(
+        [
+            AttendanceStats(
+                user_id=user_id,
+                generation_id=generation_id,
+                attendance=counter["출석"],
+                late=counter["지각"],
+                absence=counter["결석"],
+            )
+            for (user_id, generation_id), counter in stats.items()
+        ],
+        batch_size=2000,
+    )
+    for generation in generations:
+        bulk_refresh_attendance_rates(generation, [member.id for member in members])
+
+    WeeklyStaffInfo.objects.bulk_create(
+        [
+            WeeklyStaffInfo(
+                generation=current_generation,
+                staff=managers[index % len(managers)],
+                day_of_week=day_of_week,
+                workout_location=managers[index % len(managers)].workout_location,
+                start_time=time(19, 0),
+            )
+            for index, day_of_week in enumerate(DAYS_OF_WEEK)
+        ]
+    )
+    return [attendance.id for attendance in pending]
+
+
+def seed_club() -> Club:
+    """
+    여러 기수, 200명의 부원, 2년 동안의 운동 기록과 출결, 랭킹과 운동 통계를 갖춘 동아리 데이터를 생성하는 메서드입니다.
+    같은 날짜에 실행하면 항상 같은 데이터가 생성됩니다.
+    """
+    rng: random.Random = random.Random(CLUB_SEED)
+    today: date = timezone.now().date()
+
+    generations: List[Generation] = make_generations(today)
+    users: List[User] = make_users(generations, rng)
+    members: List[User] = [user for user in users if user.role == "부원"]
+    managers: List[User] = [user for user in users if user.role == "운영진"]
+
+    record_count: int = make_records(generations, members, today, rng)
+    pending_attendance_ids: List[int] = make_attendances(generations, members, managers, today, rng)
+    for generation in generations:
+        recompute_generation_rankings(generation.name)
+    rebuild_workout_stats()
+
+    return Club(
+        generations=generations,
+        member=[member for member in members if member.generation_id == generations[-1].name][-1],
+        manager=managers[0],
+        pending_attendance_ids=pending_attendance_ids,
+        counts={"users": len(users), "records": record_count, "attendances": Attendance.objects.count()},
+    )
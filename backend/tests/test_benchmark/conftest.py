@@ -0,0 +1,173 @@
+import json
+import statistics
+import time
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from account.models import User
+from tests.test_benchmark.club import Club, seed_club
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+BENCHMARK_WARMUPS = 1
+BENCHMARK_ITERATIONS = 15
+
+# 응답 시간의 회귀 판단에 더하는 여유 시간입니다. 매우 빠른 엔드포인트가 측정 오차로 경고되지 않도록 합니다.
+LATENCY_SLACK_MS = 5.0
+
+# 응답 크기의 회귀 판단에 사용하는 허용 비율입니다.
+SIZE_TOLERANCE = 1.1
+
+
+class BenchmarkLatencyWarning(UserWarning):
+    """
+    p95 응답 시간이 기준보다 늘어났을 때 발생하는 경고 클래스입니다.
+    기준 파일의 응답 시간은 다른 장비에서 측정되었을 수 있으므로, 응답 시간은 실패가 아닌 경고로만 보고합니다.
+    """
+
+
+@dataclass
+class Measurement:
+    queries: int
+    p50_ms: float
+    p95_ms: float
+    size: int
+
+    def to_dict(self) -> Dict:
+        return {"queries": self.queries, "p50_ms": self.p50_ms, "p95_ms": self.p95_ms, "size": self.size}
+
+
+def percentile(samples: List[float], ratio: float) -> float:
+    ordered: List[float] = sorted(samples)
+    index: int = min(len(ordered) - 1, max(0, round(ratio * len(ordered)) - 1))
+    return round(ordered[index], 3)
+
+
+def get_client(user: Optional[User]) -> APIClient:
+    """
+    사용자의 JWT 액세스 토큰으로 인증한 클라이언트를 반환하는 메서드입니다. 사용자가 없으면 인증하지 않습니다.
+    """
+    client = APIClient()
+    if user is not None:
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+    return client
+
+
+def measure(send: Callable[[Optional[Dict]], Response], prepare: Callable[[], Optional[Dict]]) -> Measurement:
+    """
+    요청을 반복하여 쿼리 수, 응답 시간의 중앙값과 95번째 백분위수, 응답 크기를 측정하는 메서드입니다.
+    prepare는 요청에 필요한 상태를 준비하고 요청 본문을 반환하며, 측정에 포함되지 않습니다.
+    매 요청은 세이브포인트 안에서 실행된 뒤 롤백되므로, 쓰기 요청도 항상 같은 상태에서 측정됩니다.
+    처음 BENCHMARK_WARMUPS번의 요청은 캐시를 채우기 위한 것으로 측정하지 않습니다.
+    """
+    query_counts: List[int] = []
+    latencies: List[float] = []
+    sizes: List[int] = []
+    for iteration in range(BENCHMARK_WARMUPS + BENCHMARK_ITERATIONS):
+        with transaction.atomic():
+            data: Optional[Dict] = prepare()
+            with CaptureQueriesContext(connection) as queries:
+                started_at: float = time.perf_counter()
+                response: Response = send(data)
+                elapsed: float = (time.perf_counter() - started_at) * 1000
+            transaction.set_rollback(True)
+
+        assert response.status_code < 400, response.content
+        if iteration >= BENCHMARK_WARMUPS:
+            query_counts.append(len(queries))
+            latencies.append(elapsed)
+            sizes.append(len(response.content))
+
+    return Measurement(
+        queries=max(query_counts),
+        p50_ms=round(statistics.median(latencies), 3),
+        p95_ms=percentile(latencies, 0.95),
+        size=max(sizes),
+    )
+
+
+@pytest.fixture(scope="session")
+def benchmark_settings():
+    # 운영 환경과 같이 시간대 정보가 없는 시간으로 동작하도록 합니다.
+    with override_settings(USE_TZ=False):
+        yield
+
+
+@pytest.fixture(scope="session")
+def club(benchmark_settings, django_db_setup, django_db_blocker) -> Club:
+    with django_db_blocker.unblock():
+        return seed_club()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_send_auth_code_task():
+    with patch("account.tasks.send_auth_code_to_email.delay") as mock:
+        yield mock
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline() -> Dict:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request, club, benchmark_baseline):
+    """
+    측정 결과를 모으고, 세션이 끝나면 옵션에 따라 기준 파일이나 결과 파일로 저장하는 픽스처입니다.
+    """
+    results: Dict[str, Dict] = {}
+    yield results
+
+    report: Dict = {"dataset": club.counts, "endpoints": dict(sorted(results.items()))}
+    if request.config.getoption("--benchmark-update"):
+        report["endpoints"] = {**benchmark_baseline.get("endpoints", {}), **report["endpoints"]}
+        BASELINE_PATH.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+
+    output: Optional[str] = request.config.getoption("--benchmark-output")
+    if output:
+        Path(output).write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+
+
+@pytest.fixture
+def check_regression(request, benchmark_baseline, benchmark_results):
+    """
+    측정 결과를 기록하고 기준 파일과 비교하는 함수를 반환하는 픽스처입니다.
+    장비와 무관한 쿼리 수는 늘어나면, 응답 크기는 허용 비율을 넘어서면 실패합니다.
+    응답 시간은 장비에 따라 달라지므로 허용 비율을 넘어서면 BenchmarkLatencyWarning으로 보고만 합니다.
+    """
+    tolerance: float = request.config.getoption("--benchmark-tolerance")
+    updating: bool = request.config.getoption("--benchmark-update")
+
+    def _check_regression(name: str, measurement: Measurement) -> None:
+        benchmark_results[name] = measurement.to_dict()
+        baseline: Optional[Dict] = benchmark_baseline.get("endpoints", {}).get(name)
+        if updating or baseline is None:
+            return
+
+        assert (
+            measurement.queries <= baseline["queries"]
+        ), f"{name}: 쿼리 수가 {baseline['queries']}개에서 {measurement.queries}개로 늘어났습니다."
+        assert (
+            measurement.size <= baseline["size"] * SIZE_TOLERANCE
+        ), f"{name}: 응답 크기가 {baseline['size']}바이트에서 {measurement.size}바이트로 늘어났습니다."
+        if measurement.p95_ms > baseline["p95_ms"] * tolerance + LATENCY_SLACK_MS:
+            warnings.warn(
+                BenchmarkLatencyWarning(
+                    f"{name}: p95 응답 시간이 {baseline['p95_ms']}ms에서 {measurement.p95_ms}ms로 늘어났습니다."
+                )
+            )
+
+    return _check_regression
@@ -0,0 +1,255 @@
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Callable, Dict, Optional
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from account.models import User
+from record.models import Record
+from tests.test_benchmark.club import CLUB_PASSWORD, Club
+from tests.test_benchmark.conftest import get_client, measure
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+AUTH_CODE = 12345
+NEW_MEMBER_EMAIL = "newmember@example.com"
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """
+    벤치마크할 요청을 정의하는 클래스입니다.
+    path와 data는 생성된 동아리 데이터를 받아 요청 경로와 본문을 반환하며,
+    prepare는 매 요청 전에 캐시 등 요청에 필요한 상태를 준비합니다.
+    """
+
+    name: str
+    method: str
+    path: Callable[[Club], str]
+    user: Optional[Callable[[Club], User]] = None
+    data: Optional[Callable[[Club], Dict]] = None
+    prepare: Optional[Callable[[Club], None]] = None
+
+
+def as_member(club: Club) -> User:
+    return club.member
+
+
+def as_manager(club: Club) -> User:
+    return club.manager
+
+
+def latest_record_id(club: Club) -> int:
+    return Record.objects.filter(user=club.member).order_by("-start_time").values_list("id", flat=True).first()
+
+
+def make_record_payload(club: Club) -> Dict:
+    start_time = datetime.combine(timezone.now().date() - timedelta(days=1), time(10, 0))
+    return {
+        "workout_location": "더클라임 양재",
+        "start_time": start_time.isoformat(),
+        "end_time": (start_time + timedelta(hours=2)).isoformat(),
+        "boulder_problems": [
+            {"workout_level": "주황색", "count": 3},
+            {"workout_level": "초록색", "count": 2},
+            {"workout_level": "파란색", "count": 1},
+        ],
+    }
+
+
+def certify_new_member(club: Club) -> None:
+    cache.set(f"{NEW_MEMBER_EMAIL}:register:status", "certified")
+
+
+def request_register_auth_code(club: Club) -> None:
+    cache.set(f"{NEW_MEMBER_EMAIL}:register:code", AUTH_CODE)
+    cache.set(f"{NEW_MEMBER_EMAIL}:register:status", "uncertified")
+
+
+def request_password_auth_code(club: Club) -> None:
+    cache.set(f"{club.member.email}:password:code", AUTH_CODE)
+    cache.set(f"{club.member.email}:password:status", "uncertified")
+
+
+def certify_password_update(club: Club) -> None:
+    cache.set(f"{club.member.email}:password:status", "certified")
+
+
+ENDPOINTS = [
+    # account
+    Endpoint(
+        "account.register",
+        "post",
+        lambda club: "/api/accounts/register/",
+        data=lambda club: {
+            "email": NEW_MEMBER_EMAIL,
+            "password": CLUB_PASSWORD,
+            "password_confirmation": CLUB_PASSWORD,
+            "username": "새부원",
+            "generation": club.current_generation.name,
+            "role": "부원",
+            "workout_location": "더클라임 양재",
+            "workout_level": "빨간색",
+            "profile_number": 1,
+            "introduction": "안녕하세요.",
+        },
+        prepare=certify_new_member,
+    ),
+    Endpoint(
+        "account.login",
+        "post",
+        lambda club: "/api/accounts/login/",
+        data=lambda club: {"email": club.member.email, "password": CLUB_PASSWORD},
+    ),
+    Endpoint(
+        "account.register_auth_code_request",
+        "post",
+        lambda club: "/api/accounts/user-register-auth-code-request/",
+        data=lambda club: {"email": NEW_MEMBER_EMAIL},
+    ),
+    Endpoint(
+        "account.register_auth_code_verify",
+        "post",
+        lambda club: "/api/accounts/user-register-auth-code-verify/",
+        data=lambda club: {"email": NEW_MEMBER_EMAIL, "code": AUTH_CODE},
+        prepare=request_register_auth_code,
+    ),
+    Endpoint(
+        "account.password_auth_code_request",
+        "post",
+        lambda club: "/api/accounts/password-update-auth-code-request/",
+        data=lambda club: {"email": club.member.email},
+    ),
+    Endpoint(
+        "account.password_auth_code_verify",
+        "post",
+        lambda club: "/api/accounts/password-update-auth-code-verify/",
+        data=lambda club: {"email": club.member.email, "code": AUTH_CODE},
+        prepare=request_password_auth_code,
+    ),
+    Endpoint(
+        "account.token_refresh",
+        "post",
+        lambda club: "/api/accounts/token-refresh/",
+        data=lambda club: {"refresh": str(RefreshToken.for_user(club.member))},
+    ),
+    Endpoint(
+        "account.logout",
+        "post",
+        lambda club: "/api/accounts/logout/",
+        user=as_member,
+        data=lambda club: {"refresh": str(RefreshToken.for_user(club.member))},
+    ),
+    Endpoint(
+        "account.password_update",
+        "patch",
+        lambda club: "/api/accounts/password-update/",
+        data=lambda club: {
+            "email": club.member.email,
+            "new_password": "Password2!",
+            "new_password_confirmation": "Password2!",
+        },
+        prepare=certify_password_update,
+    ),
+    # attendance
+    Endpoint("attendance.status", "get", lambda club: "/api/attendances/", user=as_member),
+    Endpoint("attendance.request", "post", lambda club: "/api/attendances/", user=as_member),
+    Endpoint("attendance.request_list", "get", lambda club: "/api/attendances/requests/", user=as_manager),
+    Endpoint(
+        "attendance.accept",
+        "patch",
+        lambda club: f"/api/attendances/requests/{club.pending_attendance_ids[0]}/accept/",
+        user=as_manager,
+    ),
+    Endpoint(
+        "attendance.reject",
+        "patch",
+        lambda club: f"/api/attendances/requests/{club.pending_attendance_ids[0]}/reject/",
+        user=as_manager,
+    ),
+    Endpoint("attendance.rate", "get", lambda club: "/api/attendances/rate/", user=as_member),
+    Endpoint(
+        "attendance.detail",
+        "get",
+        lambda club: f"/api/attendances/users/{club.member.id}/details/",
+        user=as_manager,
+    ),
+    Endpoint("attendance.location", "get", lambda club: "/api/attendances/location/", user=as_member),
+    Endpoint("attendance.user_list", "get", lambda club: "/api/attendances/users/", user=as_manager),
+    Endpoint("attendance.latest_generation", "get", lambda club: "/api/attendances/latest-generation/", user=as_member),
+    # record
+    Endpoint("record.list", "get", lambda club: "/api/records/", user=as_member),
+    Endpoint(
+        "record.list_date_range",
+        "get",
+        lambda club: (
+            f"/api/records/?start_date={club.current_generation.start_date}&end_date={club.current_generation.end_date}"
+        ),
+        user=as_member,
+    ),
+    Endpoint("record.retrieve", "get", lambda club: f"/api/records/{latest_record_id(club)}/", user=as_member),
+    Endpoint("record.create", "post", lambda club: "/api/records/", user=as_member, data=make_record_payload),
+    Endpoint(
+        "record.update",
+        "put",
+        lambda club: f"/api/records/{latest_record_id(club)}/",
+        user=as_member,
+        data=make_record_payload,
+    ),
+    Endpoint("record.destroy", "delete", lambda club: f"/api/records/{latest_record_id(club)}/", user=as_member),
+    Endpoint(
+        "record.dates",
+        "get",
+        lambda club: (
+            f"/api/records/dates/?start_date={club.current_generation.start_date}"
+            f"&end_date={club.current_generation.start_date + timedelta(weeks=4)}"
+        ),
+        user=as_member,
+    ),
+    # ranking
+    Endpoint("ranking.weekly", "get", lambda club: "/api/rankings/weeks/", user=as_member),
+    Endpoint("ranking.generations", "get", lambda club: "/api/rankings/generations/", user=as_member),
+    Endpoint(
+        "ranking.generation_top",
+        "get",
+        lambda club: f"/api/rankings/generations/?generation={club.current_generation.name}&limit=10",
+        user=as_member,
+    ),
+    # mypage
+    Endpoint("mypage.retrieve", "get", lambda club: "/api/mypages/", user=as_member),
+    Endpoint(
+        "mypage.retrieve_other",
+        "get",
+        lambda club: f"/api/mypages/?user_id={club.manager.id}",
+        user=as_member,
+    ),
+    Endpoint(
+        "mypage.update",
+        "patch",
+        lambda club: "/api/mypages/",
+        user=as_member,
+        data=lambda club: {"introduction": "반갑습니다"},
+    ),
+]
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS, ids=[endpoint.name for endpoint in ENDPOINTS])
+def test_endpoint(club, check_regression, endpoint):
+    client = get_client(endpoint.user(club) if endpoint.user else None)
+    path: str = endpoint.path(club)
+    send = getattr(client, endpoint.method)
+
+    def prepare() -> Optional[Dict]:
+        if endpoint.prepare is not None:
+            endpoint.prepare(club)
+        return endpoint.data(club) if endpoint.data is not None else None
+
+    def send_request(data: Optional[Dict]):
+        if data is None:
+            return send(path)
+        return send(path, data=data, format="json")
+
+    check_regression(endpoint.name, measure(send_request, prepare))
@@ -0,0 +1,47 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from common.choices import (
+    ROLE_REGISTRY,
+    WORKOUT_LEVEL_REGISTRY,
+    WORKOUT_LEVELS,
+    WORKOUT_LOCATION_REGISTRY,
+    get_choice_registry,
+)
+from config.exceptions import InvalidFieldException
+from config.utils import WorkoutLevelChoiceField
+
+
+class TestChoiceRegistry:
+
+    def test_bidirectional_lookup(self):
+        assert WORKOUT_LEVEL_REGISTRY.get_label(3) == "주황색"
+        assert WORKOUT_LEVEL_REGISTRY.get_value("주황색") == 3
+        assert WORKOUT_LEVEL_REGISTRY.get_label(0, "") == ""
+        assert "더클라임 양재" in WORKOUT_LOCATION_REGISTRY
+        assert "방문자" not in ROLE_REGISTRY
+
+    def test_registry_is_frozen(self):
+        with pytest.raises(FrozenInstanceError):
+            WORKOUT_LEVEL_REGISTRY.labels = {}
+        with pytest.raises(TypeError):
+            WORKOUT_LEVEL_REGISTRY.labels[11] = "무지개색"
+
+    def test_known_choices_share_registry(self):
+        assert get_choice_registry(WORKOUT_LEVELS) is WORKOUT_LEVEL_REGISTRY
+        assert get_choice_registry(((1, "하나"),)).get_value("하나") == 1
+
+
+class TestWorkoutLevelChoiceField:
+
+    def test_converts_between_level_and_label(self):
+        field = WorkoutLevelChoiceField(WORKOUT_LEVELS)
+
+        assert field.to_representation(10) == "검정색"
+        assert field.to_internal_value("검정색") == 10
+
+    @pytest.mark.parametrize("data", ["무지개색", 10, ["검정색"]])
+    def test_rejects_unknown_label(self, data):
+        with pytest.raises(InvalidFieldException):
+            WorkoutLevelChoiceField(WORKOUT_LEVELS).to_internal_value(data)
@@ -0,0 +1,181 @@
+import base64
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from config.cache import get_cache_key_family
+from config.celery import record_task_duration, record_task_failure, record_task_start
+from config.metrics import (
+    METRICS_KEY,
+    MetricsStore,
+    get_message_task_name,
+    metrics,
+    render_metrics,
+)
+from ranking.scoring import get_scoring_matrix_key
+
+pytestmark = pytest.mark.django_db
+
+LATEST_GENERATION_URL = "/api/attendances/latest-generation/"
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.fixture
+def member_client(current_generation, make_member):
+    client = APIClient()
+    client.force_authenticate(user=make_member(current_generation, 0))
+    return client
+
+
+def get_samples():
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in render_metrics().splitlines()
+        if line and not line.startswith("#")
+    }
+
+
+class TestRequestMetrics:
+
+    def test_request_latency_histogram(self, member_client):
+        member_client.get(LATEST_GENERATION_URL)
+        member_client.get(LATEST_GENERATION_URL)
+
+        samples = get_samples()
+        labels = 'view="attendance-latest-generation",method="GET"'
+        assert samples[f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'] == 2
+        assert samples[f"http_request_duration_seconds_count{{{labels}}}"] == 2
+        assert samples[f'http_requests_total{{{labels},status="200"}}'] == 2
+        assert samples[f"http_request_db_queries_total{{{labels}}}"] == 2
+
+    def test_histogram_buckets_are_ordered(self, member_client):
+        member_client.get(LATEST_GENERATION_URL)
+
+        bounds = [
+            line.split('le="', 1)[1].split('"', 1)[0]
+            for line in render_metrics().splitlines()
+            if line.startswith("http_request_duration_seconds_bucket")
+        ]
+        assert bounds[-1] == "+Inf"
+        assert [float(bound) for bound in bounds[:-1]] == sorted(float(bound) for bound in bounds[:-1])
+
+    def test_metrics_endpoint(self, member_client):
+        member_client.get(LATEST_GENERATION_URL)
+
+        response = APIClient().get("/metrics")
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE http_request_duration_seconds histogram" in response.content.decode()
+
+
+class TestMetricsStore:
+
+    @pytest.fixture
+    def connection(self):
+        connection = MagicMock()
+        with patch("config.metrics.get_metrics_connection", return_value=connection):
+            yield connection
+
+    def test_increments_are_flushed_in_one_pipeline(self, connection, settings):
+        settings.METRICS_FLUSH_INTERVAL = 60
+        store = MetricsStore()
+
+        for _ in range(3):
+            store.increment("cache_requests_total", {"cache": "other", "result": "hit"})
+        store.increment("http_request_db_queries_total", {"view": "unmatched"}, 2)
+
+        connection.pipeline.assert_not_called()
+        store.flush()
+        pipeline = connection.pipeline.return_value
+        connection.pipeline.assert_called_once_with(transaction=False)
+        assert pipeline.hincrbyfloat.call_args_list == [
+            call(METRICS_KEY, 'cache_requests_total{cache="other",result="hit"}', 3.0),
+            call(METRICS_KEY, 'http_request_db_queries_total{view="unmatched"}', 2.0),
+        ]
+        pipeline.execute.assert_called_once()
+
+    def test_flushes_when_interval_elapses(self, connection, settings):
+        settings.METRICS_FLUSH_INTERVAL = 0
+        store = MetricsStore()
+
+        store.increment("cache_requests_total", {"cache": "other", "result": "miss"})
+
+        connection.pipeline.return_value.execute.assert_called_once()
+
+
+class TestCacheMetrics:
+
+    @pytest.mark.parametrize(
+        "key, family",
+        [
+            ("test@example.com:register:code", "register:code"),
+            ("test@example.com:password:status", "password:status"),
+            ("mypage:1:version", "mypage:version"),
+            ("mypage:1:0123abcd:11기", "mypage:summary"),
+            (get_scoring_matrix_key("11기"), "ranking:scoring"),
+            ("unknown", "other"),
+        ],
+    )
+    def test_cache_key_family(self, key, family):
+        assert get_cache_key_family(key) == family
+
+    def test_cache_hit_and_miss(self):
+        cache.set("test@example.com:register:code", 12345)
+
+        cache.get("test@example.com:register:code")
+        cache.get("other@example.com:register:code")
+        cache.get_many(["test@example.com:register:code", "mypage:1:version"])
+
+        samples = get_samples()
+        assert samples['cache_requests_total{cache="register:code",result="hit"}'] == 2
+        assert samples['cache_requests_total{cache="register:code",result="miss"}'] == 1
+        assert samples['cache_requests_total{cache="mypage:version",result="miss"}'] == 1
+
+    def test_get_or_set_records_single_lookup(self):
+        cache.get_or_set("mypage:1:version", "version")
+        cache.get_or_set("mypage:1:version", "version")
+
+        samples = get_samples()
+        assert samples['cache_requests_total{cache="mypage:version",result="miss"}'] == 1
+        assert samples['cache_requests_total{cache="mypage:version",result="hit"}'] == 1
+
+
+class TestCeleryMetrics:
+
+    def test_task_duration_and_failure(self):
+        task = SimpleNamespace(name="run_nightly_closing_stage")
+        record_task_start(task_id="1")
+        record_task_duration(task_id="1", task=task, kwargs={"stage": "absence_processing"}, state="FAILURE")
+        record_task_failure(sender=task, kwargs={"stage": "absence_processing"})
+
+        samples = get_samples()
+        assert samples['celery_task_duration_seconds_count{task="absence_processing",state="FAILURE"}'] == 1
+        assert samples['celery_task_failures_total{task="absence_processing"}'] == 1
+
+    @pytest.mark.parametrize(
+        "task_name, kwargs, expected",
+        [
+            ("worker", {}, "send_auth_code_to_email"),
+            ("run_nightly_closing_stage", {"stage": "holiday_processing"}, "holiday_processing"),
+            ("recompute_rankings", {}, "recompute_rankings"),
+        ],
+    )
+    def test_queued_message_task_name(self, task_name, kwargs, expected):
+        body = base64.b64encode(json.dumps([[], kwargs, {}]).encode()).decode()
+        message = json.dumps({"headers": {"task": task_name}, "body": body}).encode()
+
+        assert get_message_task_name(message) == expected
+
+    def test_malformed_queued_message(self):
+        assert get_message_task_name(b"not a message") == "unknown"
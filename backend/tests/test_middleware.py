@@ -0,0 +1,63 @@
+import json
+import logging
+
+import pytest
+from rest_framework.test import APIClient
+
+pytestmark = pytest.mark.django_db
+
+LATEST_GENERATION_URL = "/api/attendances/latest-generation/"
+
+
+@pytest.fixture
+def member_client(current_generation, make_member):
+    client = APIClient()
+    client.force_authenticate(user=make_member(current_generation, 0))
+    return client
+
+
+def get_timing_records(caplog, level):
+    return [
+        json.loads(record.getMessage().split(" ", 3)[3])
+        for record in caplog.records
+        if record.levelno == level and record.getMessage().startswith(("요청 처리 완료", "느린 요청 처리"))
+    ]
+
+
+class TestRequestTimingMiddleware:
+
+    def test_server_timing_header(self, member_client):
+        response = member_client.get(LATEST_GENERATION_URL)
+
+        metrics = {metric.split(";")[0]: metric for metric in response["Server-Timing"].split(", ")}
+        assert set(metrics) == {"app", "db", "db-slowest"}
+        assert 'desc="1 queries"' in metrics["db"]
+
+    def test_structured_log_line(self, member_client, caplog):
+        with caplog.at_level(logging.INFO, logger="django"):
+            member_client.get(LATEST_GENERATION_URL)
+
+        (record,) = get_timing_records(caplog, logging.INFO)
+        assert record["view"] == "attendance-latest-generation"
+        assert record["status"] == 200
+        assert record["query_count"] == 1
+        assert 'FROM "generation"' in record["slowest_sql"]
+        assert "queries" not in record
+
+    def test_slow_request_dumps_queries(self, member_client, caplog, settings):
+        settings.REQUEST_TIMING_SLOW_THRESHOLD = 0
+
+        with caplog.at_level(logging.INFO, logger="django"):
+            member_client.get(LATEST_GENERATION_URL)
+
+        (record,) = get_timing_records(caplog, logging.WARNING)
+        assert len(record["queries"]) == record["query_count"] == 1
+
+    def test_unsampled_request_is_not_recorded(self, member_client, caplog, settings):
+        settings.REQUEST_TIMING_SAMPLE_RATE = 0.0
+
+        with caplog.at_level(logging.INFO, logger="django"):
+            response = member_client.get(LATEST_GENERATION_URL)
+
+        assert "Server-Timing" not in response
+        assert get_timing_records(caplog, logging.INFO) == []
@@ -0,0 +1,100 @@
+from datetime import datetime, time, timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from account.services import generation_calendar
+from attendance.models import AttendanceStats
+from mypage.services import invalidate_mypage_summary
+from record.services import rebuild_workout_stats
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    settings.USE_TZ = False
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def member(current_generation, make_member):
+    return make_member(current_generation, 0, email="member@example.com", username="부원")
+
+
+@pytest.fixture
+def member_client(member, current_generation, make_record):
+    for day, (level, count) in enumerate([(3, 2), (4, 1), (3, 5)]):
+        start_time = datetime.combine(current_generation.start_date + timedelta(days=day), time(18, 0))
+        make_record(member, start_time, [(level, count)], duration=timedelta(minutes=90), generation=current_generation)
+    baker.make(AttendanceStats, user=member, generation=current_generation, attendance=3, late=1, absence=2)
+    rebuild_workout_stats()
+    generation_calendar.get_generation(current_generation.start_date)
+
+    client = APIClient()
+    client.force_authenticate(user=member)
+    return client
+
+
+class TestMypageSummary:
+
+    def test_summary_is_computed_then_served_from_cache(self, member_client):
+        with CaptureQueriesContext(connection) as cold_queries:
+            cold = member_client.get("/api/mypages/").data["data"]
+        with CaptureQueriesContext(connection) as warm_queries:
+            warm = member_client.get("/api/mypages/").data["data"]
+
+        assert cold == warm
+        assert cold["total_workout_time"] == 270
+        assert [dict(row) for row in cold["records"]] == [
+            {"workout_level": "주황색", "total_count": 7},
+            {"workout_level": "초록색", "total_count": 1},
+        ]
+        assert dict(cold["attendance_stats"]) == {"attendance": 3, "late": 1, "absence": 2}
+        assert len(cold_queries) == 1
+        assert len(warm_queries) == 0
+
+    def test_record_write_invalidates_summary(
+        self, member_client, current_generation, django_capture_on_commit_callbacks
+    ):
+        member_client.get("/api/mypages/")
+        start_time = datetime.combine(current_generation.start_date + timedelta(days=7), time(18, 0))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            member_client.post(
+                "/api/records/",
+                data={
+                    "workout_location": "더클라임 양재",
+                    "start_time": start_time.isoformat(),
+                    "end_time": (start_time + timedelta(minutes=30)).isoformat(),
+                    "boulder_problems": [{"workout_level": "노란색", "count": 1}],
+                },
+                format="json",
+            )
+
+        assert member_client.get("/api/mypages/").data["data"]["total_workout_time"] == 300
+
+    def test_profile_update_invalidates_summary(self, member_client, django_capture_on_commit_callbacks):
+        member_client.get("/api/mypages/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            member_client.patch("/api/mypages/", data={"introduction": "반갑습니다"}, format="json")
+
+        assert member_client.get("/api/mypages/").data["data"]["profile"]["introduction"] == "반갑습니다"
+
+    def test_invalidation_waits_for_commit(self, member_client, member, django_capture_on_commit_callbacks):
+        member_client.get("/api/mypages/")
+
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            invalidate_mypage_summary([member.id])
+            AttendanceStats.objects.filter(user=member).update(absence=9)
+            assert member_client.get("/api/mypages/").data["data"]["attendance_stats"]["absence"] == 2
+
+        callbacks[0]()
+        assert member_client.get("/api/mypages/").data["data"]["attendance_stats"]["absence"] == 9
@@ -0,0 +1,97 @@
+import datetime
+from itertools import cycle, product
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+from model_bakery import baker
+
+from account.models import Generation, User
+from attendance.models import Attendance
+from ranking.models import Ranking
+from record.models import Record
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def seeded_data():
+    generations = [
+        baker.make(
+            Generation,
+            name=f"{number}기",
+            start_date=datetime.date(2020 + number // 2, 1 + number % 2 * 6, 1),
+            end_date=datetime.date(2020 + number // 2, 6 + number % 2 * 6, 28),
+        )
+        for number in range(1, 11)
+    ]
+    users = baker.make(User, generation=generations[-1], workout_level=3, _quantity=20, _bulk_create=True)
+    baker.make(
+        Attendance,
+        user=cycle(users),
+        generation=cycle(generations),
+        week=cycle(range(1, 17)),
+        request_processed_status=cycle(["승인", "거절", "대기"]),
+        request_time=timezone.now(),
+        _quantity=300,
+        _bulk_create=True,
+    )
+    Record.objects.bulk_create(
+        Record(
+            user=user,
+            start_time=timezone.now() - datetime.timedelta(days=day),
+            end_time=timezone.now() - datetime.timedelta(days=day),
+            record_date=timezone.now().date() - datetime.timedelta(days=day),
+        )
+        for user, day in product(users, range(15))
+    )
+    Ranking.objects.bulk_create(
+        Ranking(user=user, generation=generation, week=week, score=week)
+        for user, generation, week in product(users, generations, range(1, 3))
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    return generations, users
+
+
+def assert_uses_index(queryset, *index_names):
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    plan = queryset.explain()
+    assert any(index_name in plan for index_name in index_names), plan
+
+
+class TestHotQueryPlans:
+
+    def test_attendance_duplicate_request_check(self, seeded_data):
+        generations, users = seeded_data
+        queryset = Attendance.objects.filter(
+            user=users[0], generation=generations[0], week=1, request_processed_status__in=["대기", "승인"]
+        )
+
+        assert_uses_index(queryset, "attendance_user_week_idx")
+
+    def test_attendance_pending_queue(self, seeded_data):
+        queryset = Attendance.objects.filter(request_processed_status="대기", attendance_status=None)
+
+        assert_uses_index(queryset, "attendance_pending_idx")
+
+    def test_record_daily_duplicate_check(self, seeded_data):
+        _, users = seeded_data
+        queryset = Record.objects.filter(user=users[0], record_date=timezone.now().date())
+
+        # SQLite는 고유 제약 조건을 테이블 정의에 포함하므로 자동 생성된 인덱스 이름을 사용합니다.
+        assert_uses_index(queryset, "unique_record_user_record_date", "sqlite_autoindex_record")
+
+    def test_weekly_ranking(self, seeded_data):
+        generations, _ = seeded_data
+        queryset = Ranking.objects.filter(generation=generations[0], week=1).order_by("-score")
+
+        assert_uses_index(queryset, "ranking_generation_week_idx")
+
+    def test_generation_by_date(self, seeded_data):
+        target_date = datetime.date(2023, 3, 1)
+        queryset = Generation.objects.filter(start_date__lte=target_date, end_date__gte=target_date)
+
+        assert_uses_index(queryset, "generation_date_range_idx")
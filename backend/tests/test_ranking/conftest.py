@@ -0,0 +1,54 @@
+from datetime import timedelta
+
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from ranking.models import Ranking
+
+
+@pytest.fixture
+def generation_window():
+    # 여러 주차의 랭킹을 만들 수 있도록 이미 14주가 지난 기수를 사용합니다.
+    return (14, 2)
+
+
+@pytest.fixture
+def previous_generation(make_generation, current_generation):
+    return make_generation(
+        "10기",
+        start_date=current_generation.start_date - timedelta(weeks=20),
+        end_date=current_generation.start_date - timedelta(days=1),
+    )
+
+
+@pytest.fixture
+def ranking_users(current_generation, make_member):
+    return [
+        make_member(
+            current_generation,
+            index,
+            email=f"ranker{index}@example.com",
+            username=f"랭커{index}",
+            workout_level=index,
+            profile_number=index,
+        )
+        for index in range(1, 4)
+    ]
+
+
+@pytest.fixture
+def make_rankings(ranking_users):
+    def _make_rankings(generation, weeks):
+        for week in range(1, weeks + 1):
+            for index, user in enumerate(ranking_users):
+                baker.make(Ranking, user=user, generation=generation, week=week, score=float(week + index))
+
+    return _make_rankings
+
+
+@pytest.fixture
+def authenticated_client(ranking_users):
+    client = APIClient()
+    client.force_authenticate(user=ranking_users[0])
+    return client
@@ -0,0 +1,153 @@
+from typing import Any, Dict, List, Optional
+
+from redis.exceptions import WatchError
+
+
+def encode(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).encode()
+
+
+class FakeRedis:
+    """
+    리더보드 테스트에서 사용하는 Redis 연결의 메모리 구현 클래스입니다.
+    리더보드가 사용하는 명령어와 WATCH, MULTI로 이루어진 트랜잭션만 지원합니다.
+    """
+
+    def __init__(self):
+        self.data: Dict[bytes, Any] = {}
+        self.versions: Dict[bytes, int] = {}
+
+    def _touch(self, key: Any) -> None:
+        key = encode(key)
+        self.versions[key] = self.versions.get(key, 0) + 1
+        if not self.data.get(key) and key in self.data:
+            del self.data[key]
+
+    def pipeline(self) -> "FakePipeline":
+        return FakePipeline(self)
+
+    def flushall(self) -> bool:
+        for key in list(self.data):
+            self._touch(key)
+        self.data.clear()
+        return True
+
+    def exists(self, *keys: Any) -> int:
+        return sum(encode(key) in self.data for key in keys)
+
+    def get(self, key: Any) -> Optional[bytes]:
+        return self.data.get(encode(key))
+
+    def set(self, key: Any, value: Any, nx: bool = False, ex: Optional[int] = None) -> Optional[bool]:
+        if nx and encode(key) in self.data:
+            return None
+        self.data[encode(key)] = encode(value)
+        self._touch(key)
+        return True
+
+    def delete(self, *keys: Any) -> int:
+        count = 0
+        for key in keys:
+            if self.data.pop(encode(key), None) is not None:
+                count += 1
+                self._touch(key)
+        return count
+
+    def sadd(self, key: Any, *members: Any) -> int:
+        values = self.data.setdefault(encode(key), set())
+        added = {encode(member) for member in members} - values
+        values.update(added)
+        self._touch(key)
+        return len(added)
+
+    def srem(self, key: Any, *members: Any) -> int:
+        values = self.data.get(encode(key), set())
+        removed = {encode(member) for member in members} & values
+        values.difference_update(removed)
+        self._touch(key)
+        return len(removed)
+
+    def smembers(self, key: Any) -> set:
+        return set(self.data.get(encode(key), set()))
+
+    def sismember(self, key: Any, member: Any) -> bool:
+        return encode(member) in self.data.get(encode(key), set())
+
+    def zincrby(self, key: Any, amount: float, member: Any) -> float:
+        scores = self.data.setdefault(encode(key), {})
+        scores[encode(member)] = scores.get(encode(member), 0) + amount
+        self._touch(key)
+        return scores[encode(member)]
+
+    def zadd(self, key: Any, mapping: Dict[Any, float]) -> int:
+        scores = self.data.setdefault(encode(key), {})
+        added = len(set(map(encode, mapping)) - set(scores))
+        scores.update({encode(member): float(score) for member, score in mapping.items()})
+        self._touch(key)
+        return added
+
+    def zremrangebyscore(self, key: Any, minimum: Any, maximum: float) -> int:
+        scores = self.data.get(encode(key), {})
+        removed = [member for member, score in scores.items() if score <= maximum]
+        for member in removed:
+            del scores[member]
+        self._touch(key)
+        return len(removed)
+
+    def zrevrange(self, key: Any, start: int, end: int, withscores: bool = False) -> List:
+        entries = sorted(self.data.get(encode(key), {}).items(), key=lambda entry: -entry[1])
+        stop = None if end == -1 else end + 1
+        return entries[start:stop] if withscores else [member for member, _ in entries[start:stop]]
+
+    def zscore(self, key: Any, member: Any) -> Optional[float]:
+        return self.data.get(encode(key), {}).get(encode(member))
+
+
+class FakePipeline:
+    """
+    FakeRedis의 파이프라인 클래스입니다. WATCH 이후 MULTI 전까지는 명령어를 바로 실행합니다.
+    """
+
+    def __init__(self, connection: FakeRedis):
+        self.connection = connection
+        self.commands: List = []
+        self.watching: Optional[Dict[bytes, int]] = None
+        self.immediate = False
+
+    def __enter__(self) -> "FakePipeline":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.reset()
+
+    def __getattr__(self, name: str):
+        command = getattr(self.connection, name)
+
+        def run(*args, **kwargs):
+            if self.immediate:
+                return command(*args, **kwargs)
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return run
+
+    def reset(self) -> None:
+        self.commands, self.watching, self.immediate = [], None, False
+
+    def watch(self, *keys: Any) -> None:
+        self.watching = {encode(key): self.connection.versions.get(encode(key), 0) for key in keys}
+        self.immediate = True
+
+    def multi(self) -> None:
+        self.immediate = False
+
+    def execute(self) -> List:
+        watching, commands = self.watching, self.commands
+        self.reset()
+        if watching and any(self.connection.versions.get(key, 0) != version for key, version in watching.items()):
+            raise WatchError("Watched variable changed.")
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
@@ -0,0 +1,172 @@
+from unittest.mock import patch
+
+import pytest
+
+from ranking.leaderboard import (
+    _increment_score,
+    get_generation_key,
+    get_generation_leaderboard_from_store,
+    get_populated_key,
+    get_rebuilding_key,
+    get_weekly_key,
+    get_weekly_leaderboard_from_store,
+    increment_leaderboard_score,
+    rebuild_leaderboard,
+)
+from tests.test_ranking.fake_redis import FakeRedis
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def fake_connection():
+    connection = FakeRedis()
+    with patch("ranking.leaderboard.get_leaderboard_connection", return_value=connection):
+        yield connection
+
+
+@pytest.fixture
+def rebuild_task():
+    with patch("ranking.tasks.rebuild_leaderboard_task.delay") as delay:
+        yield delay
+
+
+@pytest.fixture
+def increment(django_capture_on_commit_callbacks):
+    def _increment(generation, week, user, delta):
+        with django_capture_on_commit_callbacks(execute=True):
+            increment_leaderboard_score(generation.name, week, user.id, delta)
+
+    return _increment
+
+
+class TestWeeklyLeaderboardStore:
+
+    def test_returns_none_without_redis(self, current_generation):
+        assert get_weekly_leaderboard_from_store(current_generation.name) is None
+
+    def test_reads_sorted_sets(self, fake_connection, current_generation, make_rankings, ranking_users):
+        make_rankings(current_generation, 2)
+        rebuild_leaderboard(current_generation.name)
+
+        leaderboard = get_weekly_leaderboard_from_store(current_generation.name)
+
+        assert [weekly["week"] for weekly in leaderboard] == [1, 2]
+        assert [row["user_id"] for row in leaderboard[0]["ranking"]] == [user.id for user in reversed(ranking_users)]
+        assert leaderboard[0]["ranking"][0]["username"] == ranking_users[2].username
+        assert leaderboard[1]["ranking"][0]["score"] == 4.0
+
+    def test_requests_rebuild_when_week_is_evicted(
+        self, fake_connection, rebuild_task, current_generation, make_rankings
+    ):
+        make_rankings(current_generation, 2)
+        rebuild_leaderboard(current_generation.name)
+        fake_connection.delete(get_weekly_key(current_generation.name, 2))
+
+        assert get_weekly_leaderboard_from_store(current_generation.name) is None
+        assert get_weekly_leaderboard_from_store(current_generation.name) is None
+        rebuild_task.assert_called_once_with(current_generation.name)
+
+
+class TestGenerationLeaderboardStore:
+
+    def test_populated_generation_without_scores_is_empty(
+        self, fake_connection, rebuild_task, current_generation, make_rankings
+    ):
+        rebuild_leaderboard(current_generation.name)
+
+        assert get_generation_leaderboard_from_store(current_generation.name) == []
+        assert get_weekly_leaderboard_from_store(current_generation.name) == []
+        rebuild_task.assert_not_called()
+
+    def test_unknown_generation_does_not_request_rebuild(self, fake_connection, rebuild_task):
+        assert get_generation_leaderboard_from_store("zzz") is None
+        rebuild_task.assert_not_called()
+        assert not fake_connection.exists(get_populated_key("zzz"))
+
+    def test_requests_rebuild_when_total_is_evicted(
+        self, fake_connection, rebuild_task, current_generation, make_rankings
+    ):
+        make_rankings(current_generation, 1)
+        rebuild_leaderboard(current_generation.name)
+        fake_connection.delete(get_generation_key(current_generation.name))
+
+        assert get_generation_leaderboard_from_store(current_generation.name) is None
+        rebuild_task.assert_called_once_with(current_generation.name)
+
+
+class TestIncrementLeaderboardScore:
+
+    def test_increments_populated_leaderboard(
+        self, fake_connection, increment, current_generation, make_rankings, ranking_users
+    ):
+        make_rankings(current_generation, 1)
+        rebuild_leaderboard(current_generation.name)
+
+        increment(current_generation, 1, ranking_users[0], 5.0)
+
+        leaderboard = get_generation_leaderboard_from_store(current_generation.name)
+        assert leaderboard[0]["ranking"][0]["user_id"] == ranking_users[0].id
+        assert leaderboard[0]["ranking"][0]["score"] == 6.0
+
+    def test_increment_after_flush_is_skipped(
+        self, fake_connection, rebuild_task, increment, current_generation, make_rankings, ranking_users
+    ):
+        make_rankings(current_generation, 2)
+        rebuild_leaderboard(current_generation.name)
+        fake_connection.flushall()
+
+        increment(current_generation, 1, ranking_users[0], 5.0)
+
+        assert not fake_connection.exists(
+            get_weekly_key(current_generation.name, 1), get_generation_key(current_generation.name)
+        )
+        assert get_weekly_leaderboard_from_store(current_generation.name) is None
+        assert get_generation_leaderboard_from_store() is None
+        rebuild_task.assert_any_call(current_generation.name)
+        rebuild_task.assert_any_call(None)
+
+    def test_increment_during_rebuild_discards_rebuild(
+        self, fake_connection, increment, current_generation, make_rankings, ranking_users
+    ):
+        make_rankings(current_generation, 1)
+        rebuild_leaderboard(current_generation.name)
+        fake_connection.set(get_rebuilding_key(current_generation.name), "token")
+
+        increment(current_generation, 1, ranking_users[0], 5.0)
+
+        assert not fake_connection.exists(get_populated_key(current_generation.name))
+        assert not fake_connection.exists(get_rebuilding_key(current_generation.name))
+        assert fake_connection.zscore(get_generation_key(current_generation.name), ranking_users[0].id) == 1.0
+
+
+class TestRebuildLeaderboard:
+
+    def test_rebuild_from_ranking_table(self, fake_connection, current_generation, make_rankings, ranking_users):
+        make_rankings(current_generation, 2)
+
+        count = rebuild_leaderboard(current_generation.name)
+
+        assert count == 6
+        assert fake_connection.exists(get_populated_key(current_generation.name))
+        assert fake_connection.zrevrange(get_weekly_key(current_generation.name, 1), 0, -1, withscores=True) == [
+            (str(user.id).encode(), 1.0 + index) for index, user in reversed(list(enumerate(ranking_users)))
+        ]
+        assert fake_connection.zscore(get_generation_key(current_generation.name), ranking_users[2].id) == 7.0
+
+    def test_rebuild_is_discarded_when_scores_change(
+        self, fake_connection, current_generation, make_rankings, ranking_users
+    ):
+        make_rankings(current_generation, 1)
+        set_rebuilding_token = fake_connection.set
+
+        def set_then_increment(*args, **kwargs):
+            set_rebuilding_token(*args, **kwargs)
+            _increment_score(current_generation.name, 1, ranking_users[0].id, 5.0)
+
+        with patch.object(fake_connection, "set", side_effect=set_then_increment):
+            count = rebuild_leaderboard(current_generation.name)
+
+        assert count is None
+        assert not fake_connection.exists(get_populated_key(current_generation.name))
+        assert not fake_connection.exists(get_generation_key(current_generation.name))
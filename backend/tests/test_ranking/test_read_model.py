@@ -0,0 +1,90 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from account.models import User
+from mypage.serializers import UserUpdateSerializer
+from ranking.models import Ranking
+from ranking.services import (
+    apply_ranking_deltas,
+    query_generation_leaderboard,
+    query_weekly_leaderboard,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+class TestRankingReadModel:
+
+    def test_new_ranking_stores_user_fields(self, current_generation, ranking_users):
+        user = ranking_users[2]
+
+        apply_ranking_deltas(user, {}, {(current_generation.name, 1): 1.0})
+
+        ranking = Ranking.objects.get(user=user)
+        assert ranking.username == user.username
+        assert ranking.user_generation == current_generation.name
+        assert ranking.workout_location == user.workout_location
+        assert ranking.workout_level == 3
+        assert ranking.workout_level_label == "주황색"
+        assert ranking.profile_number == user.profile_number
+
+    def test_profile_update_syncs_rankings(self, current_generation, make_rankings, ranking_users):
+        make_rankings(current_generation, 2)
+        user = ranking_users[0]
+
+        serializer = UserUpdateSerializer(user, data={"workout_level": "보라색", "profile_number": 5}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        assert set(Ranking.objects.filter(user=user).values_list("workout_level_label", "profile_number")) == {
+            ("보라색", 5)
+        }
+
+    def test_leaderboard_reads_do_not_join_user(self, current_generation, make_rankings):
+        make_rankings(current_generation, 2)
+
+        with CaptureQueriesContext(connection) as queries:
+            weekly = query_weekly_leaderboard(current_generation)
+            generation = query_generation_leaderboard(current_generation.name)
+
+        assert all('"user"' not in query["sql"] for query in queries)
+        assert weekly[0]["ranking"][0]["workout_level_label"] == "주황색"
+        assert generation[0]["ranking"][0]["username"] == "랭커3"
+
+    def test_mismatched_user_fields_do_not_split_generation_ranking(self, current_generation, make_rankings):
+        make_rankings(current_generation, 2)
+        user_id = Ranking.objects.order_by("-score").first().user_id
+        Ranking.objects.filter(user_id=user_id, week=1).update(username="이전 이름", profile_number=9)
+
+        generation = query_generation_leaderboard(current_generation.name)
+
+        assert [row["user_id"] for row in generation[0]["ranking"]].count(user_id) == 1
+        assert generation[0]["ranking"][0]["score"] == 7.0
+        assert generation[0]["ranking"][0]["rank"] == 1
+
+
+class TestRankingUserFieldsSync:
+
+    def test_user_save_syncs_rankings(self, current_generation, make_rankings, ranking_users):
+        make_rankings(current_generation, 2)
+        user = User.objects.get(id=ranking_users[0].id)
+
+        user.username = "새 이름"
+        user.workout_location = "더클라임 연남"
+        user.save()
+
+        assert set(Ranking.objects.filter(user=user).values_list("username", "workout_location")) == {
+            ("새 이름", "더클라임 연남")
+        }
+
+    def test_unchanged_user_save_does_not_update_rankings(self, current_generation, make_rankings, ranking_users):
+        make_rankings(current_generation, 1)
+        user = User.objects.get(id=ranking_users[0].id)
+
+        user.introduction = "소개"
+        with CaptureQueriesContext(connection) as queries:
+            user.save()
+            user.save(update_fields=["last_login"])
+
+        assert all('"ranking"' not in query["sql"] for query in queries)
@@ -0,0 +1,98 @@
+from datetime import datetime, time, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+from model_bakery import baker
+
+from ranking.models import Ranking
+from ranking.services import recompute_generation_rankings
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def generation_records(current_generation, ranking_users, make_record):
+    def make_week_record(user, week, problems):
+        start_time = datetime.combine(
+            current_generation.start_date + timedelta(weeks=week - 1, days=1),
+            time(12, 0),
+            tzinfo=timezone.get_current_timezone(),
+        )
+        make_record(user, start_time, problems, duration=timedelta(hours=1), generation=current_generation)
+
+    low, middle, _ = ranking_users
+    make_week_record(low, 1, [(1, 2), (3, 1)])
+    make_week_record(middle, 1, [(1, 4), (2, 1)])
+    make_week_record(middle, 3, [(5, 1)])
+    return low, middle
+
+
+def get_scores(generation):
+    return {(ranking.user_id, ranking.week): ranking.score for ranking in Ranking.objects.filter(generation=generation)}
+
+
+class TestRecomputeGenerationRankings:
+
+    def test_stale_rankings_are_replaced(self, current_generation, generation_records):
+        low, middle = generation_records
+        baker.make(Ranking, user=low, generation=current_generation, week=9, score=100)
+
+        result = recompute_generation_rankings(current_generation.name)
+
+        assert get_scores(current_generation) == {
+            (low.id, 1): 2 * 1.0 + 1 * 2.0,
+            (middle.id, 1): 4 * 0.5 + 1 * 1.0,
+            (middle.id, 3): 1 * 2.0,
+        }
+        assert result["rows"] == 5
+        assert result["rankings"] == 3
+        assert result["rows_per_second"] > 0
+
+    def test_level_change_is_reflected(self, current_generation, generation_records):
+        low, _ = generation_records
+        low.workout_level = 3
+        low.save()
+
+        recompute_generation_rankings(current_generation.name)
+
+        assert get_scores(current_generation)[(low.id, 1)] == 2 * 0.5 + 1 * 1.0
+
+    def test_rankings_store_user_fields(self, current_generation, generation_records):
+        low, _ = generation_records
+
+        recompute_generation_rankings(current_generation.name)
+
+        ranking = Ranking.objects.get(user=low, generation=current_generation, week=1)
+        assert (ranking.username, ranking.workout_level_label) == (low.username, "하얀색")
+
+    def test_records_outside_moved_period_are_skipped(self, current_generation, generation_records):
+        _, middle = generation_records
+        current_generation.start_date += timedelta(weeks=2)
+        current_generation.save()
+
+        result = recompute_generation_rankings(current_generation.name)
+
+        assert get_scores(current_generation) == {(middle.id, 1): 1 * 2.0}
+        assert (result["rows"], result["skipped"], result["rankings"]) == (5, 4, 1)
+
+    def test_other_generations_are_untouched(self, current_generation, previous_generation, generation_records):
+        low, _ = generation_records
+        baker.make(Ranking, user=low, generation=previous_generation, week=1, score=7)
+
+        recompute_generation_rankings(current_generation.name)
+
+        assert get_scores(previous_generation) == {(low.id, 1): 7}
+
+    def test_command_reports_throughput(self, current_generation, generation_records):
+        stdout = StringIO()
+
+        call_command("recompute_rankings", current_generation.name, stdout=stdout)
+
+        assert "초당" in stdout.getvalue()
+        assert Ranking.objects.filter(generation=current_generation).count() == 3
+
+    def test_command_rejects_unknown_generation(self):
+        with pytest.raises(CommandError):
+            call_command("recompute_rankings", "99기", stdout=StringIO())
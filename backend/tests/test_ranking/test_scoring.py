@@ -0,0 +1,133 @@
+from datetime import datetime, time, timedelta
+from unittest.mock import call, patch
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+
+from ranking.models import Ranking, ScoringMatrix
+from ranking.scoring import (
+    default_scoring_engine,
+    get_default_multipliers,
+    get_scoring_engine,
+)
+from ranking.services import (
+    get_problems_score,
+    get_record_ranking_scores,
+    recompute_generation_rankings,
+)
+from record.models import BoulderProblem
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def doubled_multipliers():
+    return [[multiplier * 2 for multiplier in row] for row in get_default_multipliers()]
+
+
+@pytest.fixture
+def recompute_task():
+    with patch("ranking.tasks.recompute_rankings.delay") as delay:
+        yield delay
+
+
+@pytest.fixture
+def first_week_record(current_generation, ranking_users, make_record):
+    start_time = datetime.combine(
+        current_generation.start_date + timedelta(days=1), time(12, 0), tzinfo=timezone.get_current_timezone()
+    )
+    return make_record(ranking_users[0], start_time, duration=timedelta(hours=1), generation=current_generation)
+
+
+class TestScoringEngine:
+
+    @pytest.mark.parametrize("user_level", range(0, 12))
+    def test_default_engine_matches_default_rule(self, user_level):
+        for problem_level in range(1, 11):
+            assert default_scoring_engine.get_multiplier(user_level, problem_level) == get_problems_score(
+                user_level, problem_level, 1
+            )
+
+    def test_score_sums_problems(self):
+        assert default_scoring_engine.score(3, [(1, 2), (3, 1), (5, 2)]) == 2 * 0.5 + 1 * 1.0 + 2 * 2.0
+
+    def test_generation_without_matrix_uses_default(self, current_generation):
+        assert get_scoring_engine(current_generation.name) is default_scoring_engine
+
+    def test_matrix_is_cached(self, current_generation, doubled_multipliers):
+        baker.make(ScoringMatrix, generation=current_generation, multipliers=doubled_multipliers)
+        get_scoring_engine(current_generation.name)
+
+        with CaptureQueriesContext(connection) as queries:
+            engine = get_scoring_engine(current_generation.name)
+
+        assert len(queries) == 0
+        assert engine.get_multiplier(1, 2) == 4.0
+
+    def test_matrix_change_invalidates_cache(
+        self, current_generation, doubled_multipliers, recompute_task, django_capture_on_commit_callbacks
+    ):
+        assert get_scoring_engine(current_generation.name).get_multiplier(1, 2) == 2.0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            matrix = baker.make(ScoringMatrix, generation=current_generation, multipliers=doubled_multipliers)
+        assert get_scoring_engine(current_generation.name).get_multiplier(1, 2) == 4.0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            matrix.delete()
+        assert get_scoring_engine(current_generation.name).get_multiplier(1, 2) == 2.0
+
+    def test_matrix_change_queues_recompute(
+        self, current_generation, doubled_multipliers, recompute_task, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            matrix = baker.make(ScoringMatrix, generation=current_generation, multipliers=doubled_multipliers)
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            matrix.delete()
+
+        assert recompute_task.call_args_list == [call(current_generation.name)]
+        for callback in callbacks:
+            callback()
+        assert recompute_task.call_args_list == [call(current_generation.name)] * 2
+
+    @pytest.mark.parametrize(
+        "multipliers",
+        [
+            [[1.0] * 10] * 9,
+            [[1.0] * 9] * 10,
+            [[1.0] * 9 + [-1.0]] * 10,
+            [[1.0] * 9 + ["2"]] * 10,
+            "default",
+        ],
+    )
+    def test_invalid_matrix_is_rejected(self, current_generation, multipliers):
+        matrix = ScoringMatrix(generation=current_generation, multipliers=multipliers)
+
+        with pytest.raises(ValidationError):
+            matrix.full_clean()
+
+
+class TestGenerationScoring:
+
+    def test_record_bookkeeping_uses_generation_matrix(
+        self, current_generation, first_week_record, doubled_multipliers
+    ):
+        baker.make(ScoringMatrix, generation=current_generation, multipliers=doubled_multipliers)
+
+        scores = get_record_ranking_scores(first_week_record, [(1, 2), (3, 1)], first_week_record.user.workout_level)
+
+        assert scores == {(current_generation.name, 1): 2 * 2.0 + 1 * 4.0}
+
+    def test_recompute_uses_generation_matrix(self, current_generation, first_week_record, doubled_multipliers):
+        baker.make(BoulderProblem, record=first_week_record, workout_level=1, count=2)
+        baker.make(BoulderProblem, record=first_week_record, workout_level=3, count=1)
+        baker.make(ScoringMatrix, generation=current_generation, multipliers=doubled_multipliers)
+
+        recompute_generation_rankings(current_generation.name)
+
+        ranking = Ranking.objects.get(user=first_week_record.user, generation=current_generation, week=1)
+        assert ranking.score == 2 * 2.0 + 1 * 4.0
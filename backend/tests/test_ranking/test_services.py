@@ -0,0 +1,113 @@
+import threading
+import time
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from django.db import OperationalError, connection
+from django.db.models import QuerySet
+from model_bakery import baker
+
+from ranking.models import Ranking
+from ranking.services import (
+    apply_ranking_deltas,
+    increment_ranking_score,
+    lock_generation_rankings,
+    recompute_generation_rankings,
+)
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+SQLITE_LOCK_RETRIES = 20
+
+
+class TestConcurrentRankingWrites:
+
+    def test_parallel_record_submissions_keep_exact_score(self, current_generation, ranking_users):
+        writers = 16
+        user = ranking_users[0]
+        barrier = threading.Barrier(writers)
+        errors = []
+
+        def submit_record():
+            try:
+                barrier.wait()
+                for attempt in range(SQLITE_LOCK_RETRIES):
+                    try:
+                        apply_ranking_deltas(user, {}, {(current_generation.name, 1): 1.5})
+                        break
+                    except OperationalError as e:
+                        # 테스트용 SQLite는 공유 캐시의 테이블 잠금을 기다리지 않고 실패하므로, 반영되지 않은 요청을 다시 보냅니다.
+                        if "locked" not in str(e) or attempt == SQLITE_LOCK_RETRIES - 1:
+                            raise
+                        time.sleep(0.01)
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=submit_record) for _ in range(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        rankings = Ranking.objects.filter(user=user, generation=current_generation, week=1)
+        assert rankings.count() == 1
+        assert rankings.get().score == writers * 1.5
+
+    def test_create_collision_retries_update(self, current_generation, ranking_users):
+        user = ranking_users[0]
+        update = QuerySet.update
+        updates = []
+
+        def update_missing_first(queryset, **kwargs):
+            # 첫 UPDATE 이후 다른 요청이 같은 랭킹을 먼저 생성한 상황을 재현합니다.
+            updates.append(kwargs)
+            if len(updates) == 1:
+                baker.make(Ranking, user=user, generation=current_generation, week=1, score=2.0)
+                return 0
+            return update(queryset, **kwargs)
+
+        with patch.object(QuerySet, "update", autospec=True, side_effect=update_missing_first):
+            assert increment_ranking_score(user, current_generation.name, 1, 1.5)
+
+        assert len(updates) == 2
+        assert Ranking.objects.get(user=user, generation=current_generation, week=1).score == 3.5
+
+    def test_sequential_deltas_remove_exhausted_ranking(self, current_generation, ranking_users):
+        user = ranking_users[0]
+        key = (current_generation.name, 1)
+
+        apply_ranking_deltas(user, {}, {key: 3.0})
+        apply_ranking_deltas(user, {key: 1.0}, {})
+        assert Ranking.objects.get(user=user).score == 2.0
+
+        apply_ranking_deltas(user, {key: 2.0}, {})
+        assert not Ranking.objects.filter(user=user).exists()
+
+
+class TestGenerationRankingLock:
+
+    def test_increments_share_and_recompute_excludes(self, current_generation, ranking_users):
+        with patch("ranking.services.lock_generation_rankings") as lock:
+            apply_ranking_deltas(ranking_users[0], {}, {(current_generation.name, 1): 1.5})
+            recompute_generation_rankings(current_generation.name)
+
+        assert lock.call_args_list == [
+            call(current_generation.name, shared=True),
+            call(current_generation.name, shared=False),
+        ]
+
+    @pytest.mark.parametrize(
+        "shared, lock_function", [(True, "pg_advisory_xact_lock_shared"), (False, "pg_advisory_xact_lock")]
+    )
+    def test_postgresql_advisory_lock(self, shared, lock_function):
+        cursor = MagicMock()
+        with patch.object(connection, "vendor", "postgresql"), patch.object(connection, "cursor") as get_cursor:
+            get_cursor.return_value.__enter__.return_value = cursor
+            lock_generation_rankings("11기", shared=shared)
+
+        sql, params = cursor.execute.call_args.args
+        assert sql.startswith(f"SELECT {lock_function}(")
+        assert params[1] == "11기"
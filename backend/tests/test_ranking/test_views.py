@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from account.models import User
+from account.services import generation_calendar
+
+pytestmark = pytest.mark.django_db
+
+
+class TestWeeklyRankings:
+
+    @pytest.mark.parametrize("weeks", [1, 15])
+    def test_query_count_is_constant(self, authenticated_client, current_generation, make_rankings, weeks):
+        make_rankings(current_generation, weeks)
+        generation_calendar.get_generation(current_generation.start_date)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get("/api/rankings/weeks/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["data"]["weekly_rankings"]) == weeks
+        assert len(queries) == 1
+
+    def test_weekly_rankings_are_grouped_and_ordered(self, authenticated_client, current_generation, make_rankings):
+        make_rankings(current_generation, 3)
+
+        response = authenticated_client.get("/api/rankings/weeks/")
+
+        data = response.data["data"]
+        assert data["current_generation_week"] == 15
+        assert [weekly["week"] for weekly in data["weekly_rankings"]] == [1, 2, 3]
+        for weekly in data["weekly_rankings"]:
+            scores = [ranking["score"] for ranking in weekly["ranking"]]
+            assert scores == sorted(scores, reverse=True)
+            assert weekly["ranking"][0]["user_workout_level"] == "주황색"
+
+    def test_weekly_rankings_without_generation(self):
+        client = APIClient()
+        client.force_authenticate(user=baker.make(User, workout_level=1, profile_number=1))
+
+        response = client.get("/api/rankings/weeks/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == {"current_generation_week": None, "weekly_rankings": []}
+
+
+class TestGenerationRankings:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, current_generation, previous_generation, make_rankings):
+        make_rankings(current_generation, 3)
+        make_rankings(previous_generation, 2)
+
+    def test_generation_rankings_in_single_query(self, authenticated_client):
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get("/api/rankings/generations/")
+
+        generation_rankings = response.data["data"]["generation_rankings"]
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 1
+        assert [ranking["generation"] for ranking in generation_rankings] == ["10기", "11기"]
+        assert [ranking["score"] for ranking in generation_rankings[1]["ranking"]] == [12.0, 9.0, 6.0]
+
+    def test_generation_rankings_with_generation_and_limit(self, authenticated_client, ranking_users):
+        response = authenticated_client.get("/api/rankings/generations/", data={"generation": "11기", "limit": 2})
+
+        generation_rankings = response.data["data"]["generation_rankings"]
+        assert len(generation_rankings) == 1
+        assert generation_rankings[0]["generation"] == "11기"
+        assert [ranking["user_id"] for ranking in generation_rankings[0]["ranking"]] == [
+            ranking_users[2].id,
+            ranking_users[1].id,
+        ]
+
+    @pytest.mark.parametrize("limit", ["0", "-1", "many"])
+    def test_generation_rankings_with_invalid_limit(self, authenticated_client, limit):
+        response = authenticated_client.get("/api/rankings/generations/", data={"limit": limit})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize("generation", ["zzz", "'; x", "99기"])
+    def test_generation_rankings_with_unknown_generation(self, authenticated_client, generation):
+        with patch("ranking.tasks.rebuild_leaderboard_task.delay") as rebuild_task:
+            response = authenticated_client.get("/api/rankings/generations/", data={"generation": generation})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        rebuild_task.assert_not_called()
@@ -0,0 +1,36 @@
+from datetime import datetime, time, timedelta
+
+import pytest
+from rest_framework.test import APIClient
+
+
+@pytest.fixture(autouse=True)
+def naive_datetimes(settings):
+    settings.USE_TZ = False
+
+
+@pytest.fixture
+def climber(current_generation, make_member):
+    return make_member(current_generation, 0, email="climber@example.com", username="클라이머")
+
+
+@pytest.fixture
+def climber_client(climber):
+    client = APIClient()
+    client.force_authenticate(user=climber)
+    return client
+
+
+@pytest.fixture
+def make_record_payload(current_generation):
+    def _make_record_payload(days_after_start, boulder_problems):
+        workout_date = current_generation.start_date + timedelta(days=days_after_start)
+        start_time = datetime.combine(workout_date, time(18, 0))
+        return {
+            "workout_location": "더클라임 양재",
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=2)).isoformat(),
+            "boulder_problems": boulder_problems,
+        }
+
+    return _make_record_payload
@@ -0,0 +1,324 @@
+from datetime import datetime, time, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import status
+
+from ranking.models import Ranking
+from record.models import BoulderProblem, Record, WorkoutStats
+from record.serializers import RecordCreateSerializer
+
+pytestmark = pytest.mark.django_db
+
+
+def get_scores(user):
+    return dict(Ranking.objects.filter(user=user).values_list("week", "score"))
+
+
+class TestRecordRankingBookkeeping:
+
+    def test_create_record_adds_score_once(self, climber_client, climber, make_record_payload):
+        payload = make_record_payload(
+            1,
+            [
+                {"workout_level": "노란색", "count": 4},
+                {"workout_level": "주황색", "count": 2},
+                {"workout_level": "초록색", "count": 1},
+            ],
+        )
+
+        response = climber_client.post("/api/records/", data=payload, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert get_scores(climber) == {1: 4 * 0.5 + 2 * 1.0 + 1 * 2.0}
+
+    def test_update_record_moves_score_between_weeks(self, climber_client, climber, make_record_payload):
+        climber_client.post(
+            "/api/records/", data=make_record_payload(1, [{"workout_level": "주황색", "count": 3}]), format="json"
+        )
+        climber_client.post(
+            "/api/records/", data=make_record_payload(8, [{"workout_level": "초록색", "count": 1}]), format="json"
+        )
+        record = Record.objects.filter(user=climber).order_by("start_time").first()
+
+        response = climber_client.put(
+            f"/api/records/{record.id}/",
+            data=make_record_payload(9, [{"workout_level": "초록색", "count": 2}]),
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert get_scores(climber) == {2: 1 * 2.0 + 2 * 2.0}
+
+    def test_destroy_record_removes_score(self, climber_client, climber, make_record_payload):
+        climber_client.post(
+            "/api/records/", data=make_record_payload(1, [{"workout_level": "주황색", "count": 3}]), format="json"
+        )
+        record = Record.objects.get(user=climber)
+
+        response = climber_client.delete(f"/api/records/{record.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert get_scores(climber) == {}
+
+
+class TestBoulderProblemBulkWrites:
+
+    @pytest.mark.parametrize("level_count", [2, 8])
+    def test_create_record_query_count_is_independent_of_levels(self, climber_client, make_record_payload, level_count):
+        levels = ["하얀색", "노란색", "주황색", "초록색", "파란색", "빨간색", "보라색", "회색"][:level_count]
+        payload = make_record_payload(1, [{"workout_level": level, "count": 1} for level in levels])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = climber_client.post("/api/records/", data=payload, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert BoulderProblem.objects.count() == level_count
+        assert len([query for query in queries if "boulder_problem" in query["sql"]]) == 1
+
+    def test_update_record_only_touches_changed_levels(self, climber_client, climber, make_record_payload):
+        climber_client.post(
+            "/api/records/",
+            data=make_record_payload(
+                1,
+                [
+                    {"workout_level": "노란색", "count": 4},
+                    {"workout_level": "주황색", "count": 2},
+                    {"workout_level": "초록색", "count": 1},
+                ],
+            ),
+            format="json",
+        )
+        record = Record.objects.get(user=climber)
+        unchanged = BoulderProblem.objects.get(record=record, workout_level=2)
+
+        response = climber_client.put(
+            f"/api/records/{record.id}/",
+            data=make_record_payload(
+                1,
+                [
+                    {"workout_level": "노란색", "count": 4},
+                    {"workout_level": "주황색", "count": 5},
+                    {"workout_level": "파란색", "count": 1},
+                ],
+            ),
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert dict(record.boulder_problems.values_list("workout_level", "count")) == {2: 4, 3: 5, 5: 1}
+        assert BoulderProblem.objects.get(record=record, workout_level=2).id == unchanged.id
+        assert get_scores(climber) == {1: 4 * 0.5 + 5 * 1.0 + 1 * 2.0}
+
+
+class TestRecordDateUniqueness:
+
+    def test_second_record_on_same_day_is_rejected(self, climber_client, climber, make_record_payload):
+        payload = make_record_payload(1, [{"workout_level": "주황색", "count": 1}])
+        climber_client.post("/api/records/", data=payload, format="json")
+
+        response = climber_client.post("/api/records/", data=payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"] == "해당일에 이미 기록이 존재합니다."
+        assert Record.objects.filter(user=climber).count() == 1
+
+    def test_database_rejects_double_submit_past_validation(self, climber_client, climber, make_record_payload):
+        payload = make_record_payload(1, [{"workout_level": "주황색", "count": 1}])
+        climber_client.post("/api/records/", data=payload, format="json")
+
+        with patch.object(RecordCreateSerializer, "validate", lambda self, data: data):
+            response = climber_client.post("/api/records/", data=payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Record.objects.filter(user=climber).count() == 1
+        assert get_scores(climber) == {1: 1.0}
+
+    def test_update_onto_existing_day_is_rejected(self, climber_client, climber, make_record_payload):
+        climber_client.post(
+            "/api/records/", data=make_record_payload(1, [{"workout_level": "주황색", "count": 1}]), format="json"
+        )
+        climber_client.post(
+            "/api/records/", data=make_record_payload(2, [{"workout_level": "주황색", "count": 1}]), format="json"
+        )
+        record = Record.objects.filter(user=climber).order_by("start_time").last()
+
+        response = climber_client.put(
+            f"/api/records/{record.id}/",
+            data=make_record_payload(1, [{"workout_level": "주황색", "count": 1}]),
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        record.refresh_from_db()
+        assert record.record_date == record.start_time.date()
+        assert record.start_time.date() != Record.objects.order_by("start_time").first().record_date
+
+
+class TestRecordList:
+
+    @pytest.fixture
+    def make_records(self, climber, current_generation, make_record):
+        def _make_records(days):
+            for day in range(days):
+                start_time = datetime.combine(current_generation.start_date + timedelta(days=day), time(18, 0))
+                make_record(climber, start_time, [(3, day + 1)])
+
+        return _make_records
+
+    @pytest.mark.parametrize("days", [3, 20])
+    def test_page_costs_two_queries(self, climber_client, make_records, days):
+        make_records(days)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = climber_client.get("/api/records/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["data"]["records"]) == days
+        assert len(queries) == 2
+
+    def test_cursor_walks_history_newest_first(self, climber_client, make_records):
+        make_records(5)
+
+        first_page = climber_client.get("/api/records/", {"page_size": 3}).data["data"]
+        second_page = climber_client.get(first_page["next"]).data["data"]
+
+        start_times = [record["start_time"] for record in first_page["records"] + second_page["records"]]
+        assert len(start_times) == 5
+        assert start_times == sorted(start_times, reverse=True)
+        assert second_page["next"] is None
+
+    def test_date_range_filter(self, climber_client, current_generation, make_records):
+        make_records(10)
+        start_date = current_generation.start_date + timedelta(days=2)
+        end_date = current_generation.start_date + timedelta(days=4)
+
+        response = climber_client.get(
+            "/api/records/", {"start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
+        )
+
+        records = response.data["data"]["records"]
+        assert [record["start_time"][:10] for record in records] == [
+            (end_date - timedelta(days=offset)).isoformat() for offset in range(3)
+        ]
+
+    def test_invalid_date_is_rejected(self, climber_client):
+        response = climber_client.get("/api/records/", {"start_date": "2024-13-01"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestRecordDates:
+
+    @pytest.fixture
+    def records(self, climber):
+        return [
+            baker.make(
+                Record,
+                user=climber,
+                start_time=datetime(2024, month, day, 18, 0),
+                end_time=datetime(2024, month, day, 20, 0),
+            )
+            for month, day in [(4, 28), (5, 1), (5, 15), (6, 2)]
+        ]
+
+    def test_month_scope(self, climber_client, records):
+        response = climber_client.get("/api/records/dates/", {"month": "2024-05"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [str(day) for day in response.data["data"]["dates"]] == ["2024-05-01", "2024-05-15"]
+        assert response["ETag"]
+        assert response["Last-Modified"]
+
+    def test_unchanged_calendar_returns_not_modified(self, climber_client, records):
+        etag = climber_client.get("/api/records/dates/", {"month": "2024-05"})["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = climber_client.get("/api/records/dates/", {"month": "2024-05"}, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert len(queries) == 1
+
+    def test_unchanged_calendar_since_last_modified_returns_not_modified(self, climber_client, records):
+        last_modified = climber_client.get("/api/records/dates/", {"month": "2024-05"})["Last-Modified"]
+
+        response = climber_client.get("/api/records/dates/", {"month": "2024-05"}, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.mark.parametrize("change", ["update", "delete"])
+    def test_changed_calendar_gets_new_etag(self, climber_client, records, change):
+        etag = climber_client.get("/api/records/dates/")["ETag"]
+        if change == "update":
+            records[1].workout_location = "더클라임 신림"
+            records[1].save()
+        else:
+            records[1].delete()
+
+        response = climber_client.get("/api/records/dates/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_scopes_have_different_etags(self, climber_client, records):
+        may = climber_client.get("/api/records/dates/", {"month": "2024-05"})
+        everything = climber_client.get("/api/records/dates/")
+
+        assert may["ETag"] != everything["ETag"]
+        assert len(everything.data["data"]["dates"]) == 4
+
+    @pytest.mark.parametrize("month", ["2024-13", "2024", "may"])
+    def test_invalid_month_is_rejected(self, climber_client, month):
+        response = climber_client.get("/api/records/dates/", {"month": month})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestWorkoutStatsRollup:
+
+    def get_rollup(self, climber):
+        return list(
+            WorkoutStats.objects.filter(user=climber).values_list("total_seconds", "session_count", "level_counts")
+        )
+
+    def test_rollup_tracks_record_writes(self, climber_client, climber, make_record_payload):
+        climber_client.post(
+            "/api/records/",
+            data=make_record_payload(
+                1, [{"workout_level": "주황색", "count": 3}, {"workout_level": "초록색", "count": 1}]
+            ),
+            format="json",
+        )
+        climber_client.post(
+            "/api/records/", data=make_record_payload(2, [{"workout_level": "주황색", "count": 2}]), format="json"
+        )
+        assert self.get_rollup(climber) == [(4 * 3600, 2, [0, 0, 5, 1, 0, 0, 0, 0, 0, 0])]
+
+        first, second = Record.objects.filter(user=climber).order_by("start_time")
+        climber_client.put(
+            f"/api/records/{first.id}/",
+            data=make_record_payload(1, [{"workout_level": "파란색", "count": 1}]),
+            format="json",
+        )
+        climber_client.delete(f"/api/records/{second.id}/")
+
+        assert self.get_rollup(climber) == [(2 * 3600, 1, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0])]
+
+    def test_rebuild_command_matches_incremental_rollup(self, climber_client, climber, make_record_payload):
+        for day in range(3):
+            climber_client.post(
+                "/api/records/",
+                data=make_record_payload(day, [{"workout_level": "노란색", "count": day + 1}]),
+                format="json",
+            )
+        incremental = self.get_rollup(climber)
+        WorkoutStats.objects.all().delete()
+
+        call_command("rebuild_workout_stats", stdout=StringIO())
+
+        assert self.get_rollup(climber) == incremental